@@ -1,16 +1,50 @@
 #!/usr/bin/env python3
 """Test script for WebSocket bridge functionality."""
 import asyncio
+import audioop
+import math
 import websockets
 import json
 import time
 import base64
 import logging
-from typing import Dict, Any
+from array import array
+from typing import Dict, Any, List
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default loop
+    uvloop = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Size of the bridge's binary audio frame header (struct "!BBHIQ")
+AUDIO_FRAME_HEADER_SIZE = 16
+
+# 20ms of 8kHz mono audio
+FRAME_SIZE = 160
+FRAME_INTERVAL = 0.02
+
+# Frames coalesced into one WebSocket message by the test client
+FRAMES_PER_SEND = 5
+
+
+def build_tone_frames(frequency: int = 440, sample_rate: int = 8000) -> List[bytes]:
+    """μ-law encode one seamless loop of a sine tone, split into 20ms frames."""
+    # Shortest block that holds whole sine periods and whole frames, so the
+    # frames can be replayed in rotation without a phase jump
+    period = sample_rate // math.gcd(sample_rate, frequency)
+    loop_samples = period * FRAME_SIZE // math.gcd(period, FRAME_SIZE)
+    pcm = array('h', (int(16384 * math.sin(2 * math.pi * frequency * n / sample_rate))
+                      for n in range(loop_samples)))
+    ulaw = audioop.lin2ulaw(pcm.tobytes(), 2)
+    return [ulaw[i:i + FRAME_SIZE] for i in range(0, len(ulaw), FRAME_SIZE)]
+
+
+# Encoded once; every sender rotates through the same frames
+TONE_FRAMES = build_tone_frames()
+
 
 class MockAIPlatform:
     """Mock AI platform for testing WebSocket bridge."""
@@ -18,6 +52,7 @@ class MockAIPlatform:
     def __init__(self, port: int = 8001):
         self.port = port
         self.active_sessions = {}
+        self.test_frames = [TONE_FRAMES[i % len(TONE_FRAMES)] for i in range(5)]
         
     async def start_server(self):
         """Start mock AI platform WebSocket server."""
@@ -64,6 +99,13 @@ class MockAIPlatform:
     async def process_message(self, session_id: str, message: str):
         """Process message from SIP bridge."""
         try:
+            if isinstance(message, bytes):
+                # Binary audio frame: 16-byte header followed by raw PCM
+                audio_data = message[AUDIO_FRAME_HEADER_SIZE:]
+                logger.debug(f"AI Platform: Received {len(audio_data)} bytes of binary audio")
+                await self.echo_audio(session_id, audio_data)
+                return
+                
             data = json.loads(message)
             msg_type = data.get("type")
             
@@ -157,14 +199,14 @@ class MockAIPlatform:
         await asyncio.sleep(2)  # Wait 2 seconds
         
         try:
-            for i in range(5):  # Send 5 audio frames
+            deadline = time.monotonic()
+            for test_audio in self.test_frames:
                 if session_id not in self.active_sessions:
                     break
                     
-                # Generate test audio (160 bytes = 20ms at 8kHz)
-                test_audio = bytes([i % 256] * 160)
                 await self.echo_audio(session_id, test_audio)
-                await asyncio.sleep(0.02)  # 20ms intervals
+                deadline += FRAME_INTERVAL
+                await asyncio.sleep(max(0, deadline - time.monotonic()))
                 
         except Exception as e:
             logger.error(f"Error sending test audio: {e}")
@@ -204,6 +246,7 @@ class SIPBridgeTester:
     
     def __init__(self, bridge_url: str = "ws://localhost:8080"):
         self.bridge_url = bridge_url
+        self.test_frames = [TONE_FRAMES[i % len(TONE_FRAMES)] for i in range(10)]
         
     async def test_call_flow(self):
         """Test complete call flow."""
@@ -237,14 +280,13 @@ class SIPBridgeTester:
                 if response_data.get("type") == "call_ready":
                     logger.info(f"Call ready! RTP port: {response_data.get('rtp_port')}")
                     
-                    # Test audio sending
-                    await self.send_test_audio(websocket)
-                    
-                    # Test DTMF
-                    await self.send_dtmf(websocket, "1")
-                    
-                    # Listen for responses
-                    await self.listen_for_responses(websocket)
+                    # Audio, DTMF and the response listener are independent,
+                    # so run them side by side as they would on a live call
+                    await asyncio.gather(
+                        self.send_test_audio(websocket),
+                        self.send_dtmf(websocket, "1"),
+                        self.listen_for_responses(websocket)
+                    )
                     
                 else:
                     logger.error(f"Unexpected response: {response_data}")
@@ -254,15 +296,17 @@ class SIPBridgeTester:
         except Exception as e:
             logger.error(f"Test failed: {e}")
             
-    async def send_test_audio(self, websocket):
-        """Send test audio frames."""
+    async def send_test_audio(self, websocket, frames_per_send: int = FRAMES_PER_SEND):
+        """Send test audio frames, several frames per message."""
         logger.info("Sending test audio...")
         
-        for i in range(10):
-            # Generate test audio (160 bytes μ-law)
-            audio_data = bytes([(i * 10) % 256] * 160)
-            await websocket.send(audio_data)
-            await asyncio.sleep(0.02)  # 20ms frames
+        deadline = time.monotonic()
+        for i in range(0, len(self.test_frames), frames_per_send):
+            batch = self.test_frames[i:i + frames_per_send]
+            await websocket.send(b"".join(batch))
+            # Pace against an absolute deadline so send time does not accumulate
+            deadline += FRAME_INTERVAL * len(batch)
+            await asyncio.sleep(max(0, deadline - time.monotonic()))
             
     async def send_dtmf(self, websocket, digit: str):
         """Send DTMF digit."""
@@ -320,4 +364,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
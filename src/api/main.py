@@ -95,47 +95,30 @@ async def rtp_test():
     return test_results
 
 
-# Metrics endpoint for Prometheus
-@app.get("/metrics", response_class=PlainTextResponse)
-async def metrics():
-    """Prometheus metrics endpoint."""
-    try:
-        # System metrics
-        cpu_percent = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        # Process metrics
-        process = psutil.Process()
-        proc_cpu = process.cpu_percent()
-        proc_memory = process.memory_info()
-        
-        # Custom application metrics
-        uptime = time.time() - process.create_time()
-        
-        metrics_text = f"""# HELP sip_server_cpu_percent CPU usage percentage
+# Prometheus exposition text for /metrics; the markup is static, only values change
+_METRICS_TEMPLATE = """# HELP sip_server_cpu_percent CPU usage percentage
 # TYPE sip_server_cpu_percent gauge
 sip_server_cpu_percent {cpu_percent}
 
 # HELP sip_server_memory_percent Memory usage percentage
 # TYPE sip_server_memory_percent gauge
-sip_server_memory_percent {memory.percent}
+sip_server_memory_percent {memory_percent}
 
 # HELP sip_server_memory_bytes Memory usage in bytes
 # TYPE sip_server_memory_bytes gauge
-sip_server_memory_bytes_available {memory.available}
-sip_server_memory_bytes_used {memory.used}
-sip_server_memory_bytes_total {memory.total}
+sip_server_memory_bytes_available {memory_available}
+sip_server_memory_bytes_used {memory_used}
+sip_server_memory_bytes_total {memory_total}
 
 # HELP sip_server_disk_percent Disk usage percentage
 # TYPE sip_server_disk_percent gauge
-sip_server_disk_percent {(disk.used / disk.total) * 100}
+sip_server_disk_percent {disk_percent}
 
 # HELP sip_server_disk_bytes Disk usage in bytes
 # TYPE sip_server_disk_bytes gauge
-sip_server_disk_bytes_free {disk.free}
-sip_server_disk_bytes_used {disk.used}
-sip_server_disk_bytes_total {disk.total}
+sip_server_disk_bytes_free {disk_free}
+sip_server_disk_bytes_used {disk_used}
+sip_server_disk_bytes_total {disk_total}
 
 # HELP sip_server_process_cpu_percent Process CPU usage percentage
 # TYPE sip_server_process_cpu_percent gauge
@@ -143,8 +126,8 @@ sip_server_process_cpu_percent {proc_cpu}
 
 # HELP sip_server_process_memory_bytes Process memory usage in bytes
 # TYPE sip_server_process_memory_bytes gauge
-sip_server_process_memory_bytes_rss {proc_memory.rss}
-sip_server_process_memory_bytes_vms {proc_memory.vms}
+sip_server_process_memory_bytes_rss {proc_memory_rss}
+sip_server_process_memory_bytes_vms {proc_memory_vms}
 
 # HELP sip_server_uptime_seconds Process uptime in seconds
 # TYPE sip_server_uptime_seconds gauge
@@ -154,6 +137,41 @@ sip_server_uptime_seconds {uptime}
 # TYPE sip_server_info gauge
 sip_server_info{{version="1.0.0",service="sip-server"}} 1
 """
+
+
+# Metrics endpoint for Prometheus
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    try:
+        # System metrics
+        cpu_percent = psutil.cpu_percent()
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        
+        # Process metrics
+        process = psutil.Process()
+        proc_cpu = process.cpu_percent()
+        proc_memory = process.memory_info()
+        
+        # Custom application metrics
+        uptime = time.time() - process.create_time()
+        
+        metrics_text = _METRICS_TEMPLATE.format_map({
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory.percent,
+            "memory_available": memory.available,
+            "memory_used": memory.used,
+            "memory_total": memory.total,
+            "disk_percent": (disk.used / disk.total) * 100,
+            "disk_free": disk.free,
+            "disk_used": disk.used,
+            "disk_total": disk.total,
+            "proc_cpu": proc_cpu,
+            "proc_memory_rss": proc_memory.rss,
+            "proc_memory_vms": proc_memory.vms,
+            "uptime": uptime,
+        })
         return metrics_text
         
     except Exception as e:
@@ -33,7 +33,6 @@ class PCMUCodec(AudioCodec):
     def encode(self, pcm_data: bytes) -> bytes:
         """Convert 16-bit PCM to μ-law."""
         try:
-            logger.debug(f"🔄 PCMU encode: {len(pcm_data)} bytes PCM → μ-law")
             if len(pcm_data) == 0:
                 logger.warning("⚠️ Empty PCM data for PCMU encoding")
                 return b''
@@ -43,9 +42,7 @@ class PCMUCodec(AudioCodec):
                 logger.warning(f"⚠️ PCM data length {len(pcm_data)} is not even, truncating")
                 pcm_data = pcm_data[:-1]
             
-            ulaw_data = audioop.lin2ulaw(pcm_data, 2)
-            logger.debug(f"✅ PCMU encode complete: {len(pcm_data)} bytes → {len(ulaw_data)} bytes")
-            return ulaw_data
+            return audioop.lin2ulaw(pcm_data, 2)
         except Exception as e:
             logger.error(f"❌ PCMU encode error: {e}")
             import traceback
@@ -55,23 +52,16 @@ class PCMUCodec(AudioCodec):
     def decode(self, ulaw_data: bytes) -> bytes:
         """Convert μ-law to 16-bit PCM."""
         try:
-            logger.debug(f"🔄 PCMU decode: {len(ulaw_data)} bytes μ-law → PCM")
             if len(ulaw_data) == 0:
                 logger.warning("⚠️ Empty μ-law data for PCMU decoding")
                 return b''
             
-            # Log first few bytes for debugging
-            if len(ulaw_data) >= 8:
-                logger.debug(f"📊 μ-law input: first 8 bytes: {ulaw_data[:8].hex()}")
-            
             pcm_data = audioop.ulaw2lin(ulaw_data, 2)
-            logger.debug(f"✅ PCMU decode complete: {len(ulaw_data)} bytes → {len(pcm_data)} bytes")
             
-            # Validate output
-            if len(pcm_data) >= 8:
-                import struct
+            # Sample dumps are only built when debug logging is on
+            if len(pcm_data) >= 8 and logger.isEnabledFor(logging.DEBUG):
                 first_samples = struct.unpack('<4h', pcm_data[:8])
-                logger.debug(f"📊 PCM output: first 4 samples: {first_samples}")
+                logger.debug(f"📊 PCMU decode: {ulaw_data[:8].hex()} → first 4 samples: {first_samples}")
             
             return pcm_data
         except Exception as e:
@@ -139,15 +129,12 @@ class AudioProcessor:
     def convert_format(self, data: bytes, from_codec: str, to_codec: str) -> bytes:
         """Convert audio between different formats."""
         try:
-            logger.info(f"🔄 Audio conversion: {from_codec} → {to_codec} ({len(data)} bytes)")
-            
             # Handle PCM as a special case
             from_is_pcm = from_codec.upper() == 'PCM'
             to_is_pcm = to_codec.upper() == 'PCM'
             
             # If both are PCM, no conversion needed
             if from_is_pcm and to_is_pcm:
-                logger.info("✅ No conversion needed (PCM → PCM)")
                 return data
             
             # Get codec objects for non-PCM formats
@@ -162,28 +149,16 @@ class AudioProcessor:
                 logger.error(f"❌ Unsupported target codec: {to_codec}")
                 return data
             
-            # Log input data characteristics
-            if len(data) >= 8:
-                logger.debug(f"📊 Input data: {len(data)} bytes, first 8 bytes: {data[:8].hex()}")
-            
             # Decode to PCM first if needed
-            if from_is_pcm:
-                logger.info("📥 Input is already PCM")
-                pcm_data = data
-            else:
-                logger.info(f"📥 Decoding from {from_codec} to PCM")
-                pcm_data = from_codec_obj.decode(data)
-                logger.info(f"✅ Decoded: {len(data)} bytes → {len(pcm_data)} bytes PCM")
+            pcm_data = data if from_is_pcm else from_codec_obj.decode(data)
             
             # Encode to target format if needed
-            if to_is_pcm:
-                logger.info("📤 Output format is PCM, conversion complete")
-                return pcm_data
-            else:
-                logger.info(f"📤 Encoding from PCM to {to_codec}")
-                result = to_codec_obj.encode(pcm_data)
-                logger.info(f"✅ Encoded: {len(pcm_data)} bytes PCM → {len(result)} bytes {to_codec}")
-                return result
+            result = pcm_data if to_is_pcm else to_codec_obj.encode(pcm_data)
+            
+            # Called for every 20ms frame: skip building log messages unless debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🔄 Audio conversion: {from_codec} → {to_codec} ({len(data)} → {len(result)} bytes)")
+            return result
             
         except Exception as e:
             logger.error(f"❌ Audio conversion error ({from_codec} → {to_codec}): {e}")
@@ -242,26 +217,49 @@ class AudioProcessor:
                   sample_width: int = 2) -> bytes:
         """Apply Automatic Gain Control to normalize audio levels."""
         try:
-            # Calculate current RMS level
-            rms = audioop.rms(data, sample_width)
-            if rms == 0:
+            gain_factor = self._agc_gain(audioop.rms(data, sample_width), target_level, sample_width)
+            if gain_factor is None:
                 return data
-            
-            # Calculate gain factor needed
-            max_amplitude = (1 << (sample_width * 8 - 1)) - 1
-            current_level = rms / max_amplitude
-            
-            if current_level > 0:
-                gain_factor = target_level / current_level
-                # Limit gain to prevent distortion
-                gain_factor = min(gain_factor, 4.0)
-                return self.adjust_volume(data, gain_factor, sample_width)
-            
-            return data
+            return self.adjust_volume(data, gain_factor, sample_width)
         except Exception as e:
             logger.error(f"AGC error: {e}")
             return data
     
+    def decode_and_agc(self, data: bytes, codec: str, target_level: float = 0.7) -> bytes:
+        """Decode a frame to 16-bit PCM and apply AGC in one call.
+        
+        Same result as convert_format(data, codec, "PCM") followed by
+        apply_agc(), without the generic conversion dispatch in between.
+        """
+        try:
+            if codec.upper() == 'PCM':
+                pcm_data = data
+            else:
+                codec_obj = self.get_codec(codec)
+                if codec_obj is None:
+                    logger.error(f"❌ Unsupported source codec: {codec}")
+                    return data
+                pcm_data = codec_obj.decode(data)
+            
+            gain_factor = self._agc_gain(audioop.rms(pcm_data, 2), target_level, 2)
+            if gain_factor is None:
+                return pcm_data
+            return audioop.mul(pcm_data, 2, gain_factor)
+        except Exception as e:
+            logger.error(f"❌ Decode/AGC error ({codec}): {e}")
+            return data
+    
+    @staticmethod
+    def _agc_gain(rms: int, target_level: float, sample_width: int) -> Optional[float]:
+        """Gain that brings rms to target_level, capped to prevent distortion; None for silence."""
+        if rms == 0:
+            return None
+        
+        # Calculate gain factor needed
+        max_amplitude = (1 << (sample_width * 8 - 1)) - 1
+        current_level = rms / max_amplitude
+        return min(target_level / current_level, 4.0)
+    
     def create_silence(self, duration_ms: int, sample_rate: int = 8000,
                       sample_width: int = 2) -> bytes:
         """Create silence of specified duration."""
@@ -280,19 +278,13 @@ class AudioProcessor:
                 fade_bytes = len(data)
                 fade_samples = fade_bytes // sample_width
             
-            # Create fade-in envelope
-            fade_data = data[:fade_bytes]
             result = bytearray(data)
             
-            for i in range(0, fade_bytes, sample_width):
-                sample_idx = i // sample_width
-                factor = sample_idx / fade_samples
-                
-                # Apply fade factor to sample
-                if sample_width == 2:
-                    sample = struct.unpack('<h', fade_data[i:i+2])[0]
-                    faded_sample = int(sample * factor)
-                    result[i:i+2] = struct.pack('<h', faded_sample)
+            if sample_width == 2 and fade_samples:
+                # Scale the whole fade window by a linear ramp in one pass
+                samples = np.frombuffer(data, dtype='<i2', count=fade_samples)
+                envelope = np.arange(fade_samples) / fade_samples
+                result[:fade_samples * 2] = (samples * envelope).astype('<i2').tobytes()
             
             return bytes(result)
         except Exception as e:
@@ -310,19 +302,14 @@ class AudioProcessor:
                 fade_bytes = len(data)
                 fade_samples = fade_bytes // sample_width
             
-            # Create fade-out envelope
             start_pos = len(data) - fade_bytes
-            fade_data = data[start_pos:]
             result = bytearray(data)
             
-            for i in range(0, fade_bytes, sample_width):
-                sample_idx = i // sample_width
-                factor = 1.0 - (sample_idx / fade_samples)
-                
-                if sample_width == 2:
-                    sample = struct.unpack('<h', fade_data[i:i+2])[0]
-                    faded_sample = int(sample * factor)
-                    result[start_pos + i:start_pos + i + 2] = struct.pack('<h', faded_sample)
+            if sample_width == 2 and fade_samples:
+                # Scale the whole fade window by a falling ramp in one pass
+                samples = np.frombuffer(data, dtype='<i2', count=fade_samples, offset=start_pos)
+                envelope = 1.0 - np.arange(fade_samples) / fade_samples
+                result[start_pos:start_pos + fade_samples * 2] = (samples * envelope).astype('<i2').tobytes()
             
             return bytes(result)
         except Exception as e:
@@ -3,7 +3,9 @@ import struct
 import socket
 import errno
 import asyncio
+import inspect
 import time
+from array import array
 from typing import Dict, Callable, Optional, Tuple
 from dataclasses import dataclass
 import logging
@@ -201,6 +203,7 @@ class RTPSession:
         
         self.running = False
         self.receive_callback: Optional[Callable[[bytes], None]] = None
+        self._callback_wants_addr = False
         self.last_remote_addr = None
         
     async def start(self) -> None:
@@ -237,6 +240,8 @@ class RTPSession:
     def set_receive_callback(self, callback: Callable[[bytes], None]) -> None:
         """Set callback for received audio data."""
         self.receive_callback = callback
+        # Resolved once here rather than per packet in the playout loop
+        self._callback_wants_addr = len(inspect.signature(callback).parameters) >= 2
     
     async def send_audio(self, audio_data: bytes) -> None:
         """Send audio data via RTP."""
@@ -344,12 +349,7 @@ class RTPSession:
                 packet = self.jitter_buffer.get_next_packet()
                 if packet and self.receive_callback:
                     logger.info(f"🎵 RTP callback delivering {len(packet.payload)} bytes for port {self.local_port}")
-                    # Check if callback expects remote_addr parameter
-                    import inspect
-                    callback_sig = inspect.signature(self.receive_callback)
-                    num_params = len(callback_sig.parameters)
-                    
-                    if num_params >= 2:
+                    if self._callback_wants_addr:
                         # Callback expects remote_addr
                         self.receive_callback(packet.payload, self.last_remote_addr)
                     else:
@@ -427,8 +427,17 @@ class RTPManager:
             await self.destroy_session(call_id)
 
 
+# Number of recent packet arrivals used for the jitter estimate
+JITTER_WINDOW = 100
+
+
 class RTPStatistics:
     """Statistics collection for RTP sessions."""
+    __slots__ = (
+        "packets_sent", "packets_received", "bytes_sent", "bytes_received", "packets_lost",
+        "jitter_ms", "last_sequence", "sequence_gaps", "_arrivals", "_arrival_count",
+        "_interval_sum", "_interval_sq_sum"
+    )
     
     def __init__(self):
         self.packets_sent = 0
@@ -439,7 +448,12 @@ class RTPStatistics:
         self.jitter_ms = 0.0
         self.last_sequence = None
         self.sequence_gaps = deque(maxlen=100)
-        self.packet_times = deque(maxlen=100)
+        # Preallocated ring of monotonic arrival times; no per-packet allocation
+        self._arrivals = array('d', bytes(8 * JITTER_WINDOW))
+        self._arrival_count = 0
+        # Running sums over the inter-arrival intervals in the window
+        self._interval_sum = 0.0
+        self._interval_sq_sum = 0.0
     
     def record_sent_packet(self, packet_size: int) -> None:
         """Record a sent packet."""
@@ -448,11 +462,7 @@ class RTPStatistics:
     
     def record_received_packet(self, packet: RTPPacket) -> None:
         """Record a received packet and update statistics."""
-        self.packets_received += 1
-        self.bytes_received += len(packet.payload)
-        
-        current_time = time.time()
-        self.packet_times.append(current_time)
+        self.record_received_payload(packet.payload)
         
         # Track sequence numbers for loss detection
         seq_num = packet.header.sequence_number
@@ -471,17 +481,35 @@ class RTPStatistics:
         
         self.last_sequence = seq_num
         
-        # Calculate jitter (simplified)
-        if len(self.packet_times) >= 2:
-            intervals = []
-            for i in range(1, len(self.packet_times)):
-                interval = self.packet_times[i] - self.packet_times[i-1]
-                intervals.append(interval)
-            
-            if intervals:
-                mean_interval = sum(intervals) / len(intervals)
-                variance = sum((x - mean_interval) ** 2 for x in intervals) / len(intervals)
-                self.jitter_ms = (variance ** 0.5) * 1000  # Convert to ms
+    def record_received_payload(self, payload: bytes) -> None:
+        """Record a received payload whose RTP header is not available (no loss tracking)."""
+        self.packets_received += 1
+        self.bytes_received += len(payload)
+        
+        now = time.monotonic()
+        arrivals = self._arrivals
+        count = self._arrival_count
+        
+        # Update the window's interval sums instead of rescanning it per packet
+        if count:
+            interval = now - arrivals[(count - 1) % JITTER_WINDOW]
+            self._interval_sum += interval
+            self._interval_sq_sum += interval * interval
+            if count >= JITTER_WINDOW:
+                # The oldest arrival leaves the window along with its interval
+                evicted = arrivals[(count + 1) % JITTER_WINDOW] - arrivals[count % JITTER_WINDOW]
+                self._interval_sum -= evicted
+                self._interval_sq_sum -= evicted * evicted
+                
+        arrivals[count % JITTER_WINDOW] = now
+        self._arrival_count = count + 1
+        
+        # Calculate jitter (standard deviation of inter-arrival time)
+        intervals = min(count, JITTER_WINDOW - 1)
+        if intervals:
+            mean_interval = self._interval_sum / intervals
+            variance = max(self._interval_sq_sum / intervals - mean_interval * mean_interval, 0.0)
+            self.jitter_ms = (variance ** 0.5) * 1000  # Convert to ms
     
     def get_loss_rate(self) -> float:
         """Calculate packet loss rate."""
@@ -2,6 +2,7 @@
 import asyncio
 import logging
 import time
+import secrets
 import uuid
 from typing import Dict, List, Optional, Callable, Set, Any
 from dataclasses import dataclass, field
@@ -324,16 +325,21 @@ class KamailioStateSynchronizer:
         self.pending_updates: Dict[str, Dict] = {}
         self.sync_interval = 5  # seconds
         self.running = False
+        self.session: Optional[aiohttp.ClientSession] = None
         
     async def start(self):
         """Start synchronization loop."""
         self.running = True
+        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
         asyncio.create_task(self._sync_loop())
         logger.info("Kamailio state synchronizer started")
     
     async def stop(self):
         """Stop synchronization."""
         self.running = False
+        if self.session:
+            await self.session.close()
+            self.session = None
         logger.info("Kamailio state synchronizer stopped")
     
     async def notify_state_change(self, call_session, old_state: CallState, new_state: CallState):
@@ -462,21 +468,19 @@ class KamailioStateSynchronizer:
         try:
             payload = {
                 "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
+                "id": secrets.token_hex(8),
                 "method": method,
                 "params": params or []
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.kamailio_rpc_url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.warning(f"Kamailio RPC failed: HTTP {response.status}")
+            if self.session is None or self.session.closed:
+                self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
+            
+            async with self.session.post(self.kamailio_rpc_url, json=payload) as response:
+                if response.status == 200:
+                    return await response.json()
+                else:
+                    logger.warning(f"Kamailio RPC failed: HTTP {response.status}")
                         
         except Exception as e:
             logger.error(f"Kamailio RPC error: {e}")
@@ -569,9 +573,6 @@ class CallManager:
             
         self.is_running = False
         
-        # Stop synchronizer
-        await self.kamailio_sync.stop()
-        
         # Stop DTMF components
         await self.dtmf_processor.stop()
         await self.music_on_hold.stop()
@@ -585,6 +586,9 @@ class CallManager:
             await self.update_call_state(call_session.call_id, CallState.CANCELLED, 
                                         {"hangup_reason": "system_shutdown"})
         
+        # Stop synchronizer once the final call state updates are sent
+        await self.kamailio_sync.stop()
+        
         logger.info("Call manager stopped")
         
     async def handle_incoming_call(self, sip_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -2,7 +2,6 @@
 import asyncio
 import websockets
 import websockets.exceptions
-import json
 import logging
 import base64
 from typing import Dict, Any, Optional, Callable, Tuple
@@ -14,6 +13,7 @@ from .call_manager import CallManager, CallSession, CallState
 from ..audio.rtp import RTPManager
 from ..audio.codecs import AudioProcessor
 from ..utils.config import get_config
+from ..utils import json_codec
 from ..utils.auth import WebSocketAuthenticator
 
 logger = logging.getLogger(__name__)
@@ -134,7 +134,7 @@ class WebSocketCallBridge:
         
         try:
             async for message in websocket:
-                data = json.loads(message)
+                data = json_codec.loads(message)
                 message_type = data.get("type")
                 
                 # Require authentication first
@@ -424,6 +424,11 @@ class WebSocketCallBridge:
             
             logger.info(f"✅ Successfully sent {len(ulaw_data)} bytes of μ-law audio to AI platform for call {call_id}")
             
+        except websockets.exceptions.ConnectionClosed:
+            # Drop the dead connection now so later frames skip it
+            if self.active_connections.get(call_id) is websocket:
+                self.active_connections.pop(call_id, None)
+            logger.info(f"WebSocket for call {call_id} closed, stopped forwarding audio")
         except Exception as e:
             logger.error(f"❌ Error forwarding audio for call {call_id}: {e}")
             import traceback
@@ -876,7 +881,7 @@ class WebSocketCallBridge:
     async def _send_message(self, websocket, message: Dict[str, Any]):
         """Send message to WebSocket connection."""
         try:
-            message_json = json.dumps(message)
+            message_json = json_codec.dumps(message)
             await websocket.send(message_json)
         except Exception as e:
             logger.error(f"Error sending WebSocket message: {e}")
@@ -935,7 +940,7 @@ class WebSocketCallBridge:
                 # Keep connection alive and handle messages
                 async for message in websocket:
                     try:
-                        data = json.loads(message)
+                        data = json_codec.loads(message)
                         message_type = data.get("type")
                         
                         if message_type in self.message_handlers:
@@ -954,7 +959,7 @@ class WebSocketCallBridge:
                             logger.warning(f"Unknown message type from AI platform: {message_type}")
                             logger.info(f"📋 Full message from AI platform: {data}")  # Log the complete message for debugging
                             
-                    except json.JSONDecodeError as e:
+                    except json_codec.JSONDecodeError as e:
                         logger.error(f"Invalid JSON from AI platform: {e}")
                     except Exception as e:
                         logger.error(f"Error processing AI platform message: {e}")
@@ -1146,8 +1151,7 @@ class WebSocketCallBridge:
             websocket = self.active_connections.pop(call_id, None)
             if websocket:
                 try:
-                    if not websocket.closed:
-                        await websocket.close(code=1000, reason="Call cleanup")
+                    await websocket.close(code=1000, reason="Call cleanup")
                     logger.info(f"✅ Closed WebSocket for call {call_id}")
                 except Exception as e:
                     logger.warning(f"Error closing WebSocket for call {call_id}: {e}")
@@ -7,9 +7,6 @@ from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
-from scipy import signal
-import threading
-from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +116,11 @@ class InbandDTMFDetector:
         (941, 1209): '*', (941, 1336): '0', (941, 1477): '#', (941, 1633): 'D'
     }
     
+    # Row/column tone groups and the keypad they index, in DTMF_MATRIX order
+    LOW_FREQS = (697, 770, 852, 941)
+    HIGH_FREQS = (1209, 1336, 1477, 1633)
+    DTMF_KEYPAD = ("123A", "456B", "789C", "*0#D")
+    
     def __init__(self, sample_rate: int = 8000, frame_size: int = 160):
         self.sample_rate = sample_rate
         self.frame_size = frame_size
@@ -127,22 +129,36 @@ class InbandDTMFDetector:
         self.max_duration_ms = 1000  # Maximum DTMF duration
         
         # State tracking
-        self.call_buffers: Dict[str, deque] = {}
+        self.call_buffers: Dict[str, np.ndarray] = {}  # last frame_size samples
         self.call_states: Dict[str, Dict] = {}
         
-        # Precompute Goertzel coefficients
+        # Precompute Goertzel coefficients and the analysis window
         self._compute_coefficients()
+        self._window = np.hanning(frame_size)
         
     def _compute_coefficients(self):
         """Precompute Goertzel algorithm coefficients."""
         self.coefficients = {}
         
-        for freq in [697, 770, 852, 941, 1209, 1336, 1477, 1633]:
+        for freq in self.LOW_FREQS + self.HIGH_FREQS:
             k = int(0.5 + (self.frame_size * freq / self.sample_rate))
             w = (2.0 * np.pi * k) / self.frame_size
             cosine = np.cos(w)
             coeff = 2.0 * cosine
             self.coefficients[freq] = coeff
+        
+        # Same coefficients as a flat array: four rows followed by four columns
+        self._coeffs = np.array(list(self.coefficients.values()))
+        
+        # Goertzel power equals |X(w)|^2 at each coefficient's frequency, so
+        # keep the eight cosine/sine rows as one (16, N) DFT basis
+        self._omegas = np.arccos(self._coeffs / 2.0)
+        self._basis = self._dft_basis(self.frame_size)
+    
+    def _dft_basis(self, length: int) -> np.ndarray:
+        """Stacked cosine and sine rows of the eight DTMF bins for a frame length."""
+        phases = np.outer(self._omegas, np.arange(length))
+        return np.vstack((np.cos(phases), np.sin(phases)))
     
     def process_audio(self, call_id: str, audio_data: bytes) -> Optional[DTMFEvent]:
         """Process audio data for in-band DTMF detection."""
@@ -151,28 +167,34 @@ class InbandDTMFDetector:
             if len(audio_data) % 2 != 0:
                 return None
                 
-            samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+            samples = np.frombuffer(audio_data, dtype=np.int16)
             
             # Initialize call buffer if needed
             if call_id not in self.call_buffers:
-                self.call_buffers[call_id] = deque(maxlen=self.frame_size * 2)
+                self.call_buffers[call_id] = np.zeros(self.frame_size, dtype=np.float32)
                 self.call_states[call_id] = {
                     'detecting': False,
                     'current_digit': None,
                     'start_time': None,
-                    'frame_count': 0
+                    'frame_count': 0,
+                    'buffered': 0
                 }
             
-            # Add samples to buffer
-            self.call_buffers[call_id].extend(samples)
+            # Shift the newest samples into the fixed float32 frame buffer
+            buffer = self.call_buffers[call_id]
+            state = self.call_states[call_id]
+            count = len(samples)
+            if count >= self.frame_size:
+                buffer[:] = samples[-self.frame_size:]
+            elif count:
+                buffer[:-count] = buffer[count:]
+                buffer[-count:] = samples
+            state['buffered'] = min(self.frame_size, state['buffered'] + count)
             
             # Process when we have enough samples
-            if len(self.call_buffers[call_id]) >= self.frame_size:
-                # Extract frame
-                frame = np.array(list(self.call_buffers[call_id])[-self.frame_size:])
-                
+            if state['buffered'] >= self.frame_size:
                 # Detect DTMF
-                detected_digit = self._detect_dtmf_in_frame(frame)
+                detected_digit = self._detect_dtmf_in_frame(buffer)
                 
                 return self._process_detection_result(call_id, detected_digit)
             
@@ -186,73 +208,60 @@ class InbandDTMFDetector:
         """Detect DTMF digit in audio frame using Goertzel algorithm."""
         try:
             # Apply window to reduce spectral leakage
-            windowed_frame = frame * np.hanning(len(frame))
-            
-            # Calculate energy for each DTMF frequency
-            energies = {}
-            for freq, coeff in self.coefficients.items():
-                energy = self._goertzel(windowed_frame, coeff)
-                energies[freq] = energy
+            window = self._window if len(frame) == self.frame_size else np.hanning(len(frame))
+            windowed_frame = frame * window
             
-            # Find strongest frequencies in each group
-            low_freqs = [697, 770, 852, 941]
-            high_freqs = [1209, 1336, 1477, 1633]
-            
-            max_low_freq = max(low_freqs, key=lambda f: energies[f])
-            max_high_freq = max(high_freqs, key=lambda f: energies[f])
-            
-            max_low_energy = energies[max_low_freq]
-            max_high_energy = energies[max_high_freq]
-            
-            # Check if energies are above threshold
-            if (max_low_energy > self.detection_threshold and 
-                max_high_energy > self.detection_threshold):
-                
-                # Check if this is a valid DTMF combination
-                digit = self.DTMF_MATRIX.get((max_low_freq, max_high_freq))
-                if digit:
-                    # Additional validation: check frequency ratio
-                    if self._validate_dtmf_detection(energies, max_low_freq, max_high_freq):
-                        return digit
-            
-            return None
+            return self._classify_energies(self._goertzel(windowed_frame))
             
         except Exception as e:
             logger.error(f"Error in DTMF detection: {e}")
             return None
     
-    def _goertzel(self, samples: np.ndarray, coeff: float) -> float:
-        """Goertzel algorithm for single frequency detection."""
-        s_prev = 0.0
-        s_prev2 = 0.0
+    def _classify_energies(self, energies: np.ndarray) -> Optional[str]:
+        """Map the eight DTMF bin energies of one frame to a digit."""
+        low_energies = energies[:4]
+        high_energies = energies[4:]
+        
+        # Find strongest frequencies in each group
+        row = int(np.argmax(low_energies))
+        col = int(np.argmax(high_energies))
         
-        for sample in samples:
-            s = sample + coeff * s_prev - s_prev2
-            s_prev2 = s_prev
-            s_prev = s
+        # Check if energies are above threshold
+        if (low_energies[row] > self.detection_threshold and 
+            high_energies[col] > self.detection_threshold):
+            
+            # Additional validation: check frequency ratio
+            if self._validate_dtmf_detection(low_energies, high_energies, row, col):
+                return self.DTMF_KEYPAD[row][col]
         
-        power = s_prev2 * s_prev2 + s_prev * s_prev - coeff * s_prev * s_prev2
-        return power
+        return None
     
-    def _validate_dtmf_detection(self, energies: Dict[int, float], 
-                                low_freq: int, high_freq: int) -> bool:
-        """Validate DTMF detection with additional checks."""
-        # Check that detected frequencies dominate their groups
-        low_freqs = [697, 770, 852, 941]
-        high_freqs = [1209, 1336, 1477, 1633]
+    def _goertzel(self, samples: np.ndarray) -> np.ndarray:
+        """Goertzel energies of the eight DTMF frequencies along the last axis."""
+        length = samples.shape[-1]
+        basis = self._basis if length == self.frame_size else self._dft_basis(length)
         
-        # Low frequency should be strongest in its group
-        for freq in low_freqs:
-            if freq != low_freq and energies[freq] > energies[low_freq] * 0.5:
-                return False
+        # One matrix product evaluates every bin of every frame
+        projections = samples @ basis.T
+        real = projections[..., :8]
+        imag = projections[..., 8:]
+        return real * real + imag * imag
+    
+    def _validate_dtmf_detection(self, low_energies: np.ndarray, high_energies: np.ndarray,
+                                row: int, col: int) -> bool:
+        """Validate DTMF detection with additional checks."""
+        low_energy = low_energies[row]
+        high_energy = high_energies[col]
         
-        # High frequency should be strongest in its group
-        for freq in high_freqs:
-            if freq != high_freq and energies[freq] > energies[high_freq] * 0.5:
-                return False
+        # Detected frequencies should dominate their groups (only the peak may
+        # exceed half of itself)
+        if np.count_nonzero(low_energies > low_energy * 0.5) > 1:
+            return False
+        if np.count_nonzero(high_energies > high_energy * 0.5) > 1:
+            return False
         
         # Check energy ratio between low and high frequencies
-        ratio = energies[high_freq] / energies[low_freq]
+        ratio = high_energy / low_energy
         if not (0.5 <= ratio <= 2.0):
             return False
         
@@ -407,15 +416,22 @@ class DTMFDetector:
                 f"method={event.method.value}, confidence={event.confidence}"
             )
             
-            # Call event handlers
+            # Call sync handlers inline and run coroutine handlers concurrently
+            pending = []
             for handler in self.event_handlers:
                 try:
                     if asyncio.iscoroutinefunction(handler):
-                        await handler(event)
+                        pending.append(handler(event))
                     else:
                         handler(event)
                 except Exception as e:
                     logger.error(f"Error in DTMF event handler: {e}")
+            
+            if pending:
+                results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Error in DTMF event handler: {result}")
                     
         except Exception as e:
             logger.error(f"Error emitting DTMF event: {e}")
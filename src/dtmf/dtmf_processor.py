@@ -67,9 +67,11 @@ class DTMFSequence:
         self.last_digit_time = event.timestamp
         self.events.append(event)
     
-    def is_expired(self, timeout: float) -> bool:
-        """Check if sequence has expired."""
-        return (time.time() - self.last_digit_time) > timeout
+    def is_expired(self, timeout: float, now: Optional[float] = None) -> bool:
+        """Check if sequence has expired (as of now, defaulting to the current time)."""
+        if now is None:
+            now = time.time()
+        return (now - self.last_digit_time) > timeout
     
     def duration(self) -> float:
         """Get sequence duration in seconds."""
@@ -436,7 +438,7 @@ class DTMFProcessor:
                 expired_calls = []
                 
                 for call_id, sequence in self.active_sequences.items():
-                    if sequence.is_expired(self.default_timeout):
+                    if sequence.is_expired(self.default_timeout, current_time):
                         expired_calls.append(call_id)
                 
                 for call_id in expired_calls:
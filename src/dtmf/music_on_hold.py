@@ -1,16 +1,17 @@
 """Music on Hold Implementation."""
 import asyncio
+import functools
 import logging
+import math
 import os
 import wave
-import struct
 import time
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
-import threading
 from pathlib import Path
-import random
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -43,26 +44,49 @@ class MusicSource:
             raise ValueError("Stream source requires URL")
 
 
+@functools.lru_cache(maxsize=16)
+def _time_axis(num_samples: int, sample_rate: int) -> np.ndarray:
+    """Sample times in seconds, shared read-only between callers."""
+    t = np.arange(num_samples) / sample_rate
+    t.setflags(write=False)
+    return t
+
+
 class AudioGenerator:
     """Generate audio tones and patterns."""
     
+    # One full period of each integer-frequency sine, keyed by (frequency, sample_rate)
+    _sine_tables: Dict[tuple, np.ndarray] = {}
+    
+    @classmethod
+    def _sine_table(cls, frequency: int, sample_rate: int) -> np.ndarray:
+        """Get the cached single-period sine table for a frequency."""
+        key = (frequency, sample_rate)
+        table = cls._sine_tables.get(key)
+        if table is None:
+            period = sample_rate // math.gcd(sample_rate, frequency)
+            table = np.sin(2 * np.pi * frequency * np.arange(period) / sample_rate)
+            cls._sine_tables[key] = table
+        return table
+    
+    # Results are immutable bytes, so repeated prompts and players can share them
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def generate_tone(frequency: float, duration: float, sample_rate: int = 8000, 
                      amplitude: float = 0.3) -> bytes:
         """Generate a sine wave tone."""
-        import math
-        
         num_samples = int(duration * sample_rate)
-        samples = []
         
-        for i in range(num_samples):
-            t = i / sample_rate
-            sample = amplitude * math.sin(2 * math.pi * frequency * t)
-            # Convert to 16-bit PCM
-            sample_int = int(sample * 32767)
-            samples.append(struct.pack('<h', sample_int))
+        if float(frequency).is_integer() and isinstance(sample_rate, int):
+            # Tile the cached period instead of evaluating sin per sample
+            table = AudioGenerator._sine_table(int(frequency), sample_rate)
+            waveform = np.resize(table, num_samples)
+        else:
+            waveform = np.sin(2 * np.pi * frequency * _time_axis(num_samples, sample_rate))
         
-        return b''.join(samples)
+        # Convert to 16-bit PCM
+        samples = np.clip(amplitude * waveform * 32767, -32768, 32767)
+        return samples.astype('<i2').tobytes()
     
     @staticmethod
     def generate_silence(duration: float, sample_rate: int = 8000) -> bytes:
@@ -71,49 +95,28 @@ class AudioGenerator:
         return b'\x00\x00' * num_samples
     
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def generate_ring_tone(duration: float = 1.0, sample_rate: int = 8000) -> bytes:
         """Generate a ring tone pattern."""
         # Ring tone: 440Hz + 480Hz for 2 seconds, silence for 4 seconds
         ring_duration = 2.0
         silence_duration = 4.0
         
-        audio_data = b''
-        current_time = 0.0
+        num_samples = int(duration * sample_rate)
+        ring_samples = int(ring_duration * sample_rate)
+        cycle_samples = ring_samples + int(silence_duration * sample_rate)
         
-        while current_time < duration:
-            # Ring portion
-            if current_time + ring_duration <= duration:
-                # Mix 440Hz and 480Hz
-                tone1 = AudioGenerator.generate_tone(440, ring_duration, sample_rate, 0.2)
-                tone2 = AudioGenerator.generate_tone(480, ring_duration, sample_rate, 0.2)
-                
-                # Mix the tones
-                mixed = AudioGenerator._mix_audio([tone1, tone2])
-                audio_data += mixed
-                current_time += ring_duration
-            else:
-                # Partial ring
-                remaining = duration - current_time
-                tone1 = AudioGenerator.generate_tone(440, remaining, sample_rate, 0.2)
-                tone2 = AudioGenerator.generate_tone(480, remaining, sample_rate, 0.2)
-                mixed = AudioGenerator._mix_audio([tone1, tone2])
-                audio_data += mixed
-                break
-            
-            # Silence portion
-            if current_time + silence_duration <= duration:
-                silence = AudioGenerator.generate_silence(silence_duration, sample_rate)
-                audio_data += silence
-                current_time += silence_duration
-            else:
-                # Partial silence
-                remaining = duration - current_time
-                if remaining > 0:
-                    silence = AudioGenerator.generate_silence(remaining, sample_rate)
-                    audio_data += silence
-                break
+        # Mix 440Hz and 480Hz once and blit it into each cycle of a single buffer
+        tone1 = AudioGenerator.generate_tone(440, ring_duration, sample_rate, 0.2)
+        tone2 = AudioGenerator.generate_tone(480, ring_duration, sample_rate, 0.2)
+        ring = np.frombuffer(AudioGenerator._mix_audio([tone1, tone2]), dtype='<i2')
         
-        return audio_data
+        audio = np.zeros(num_samples, dtype='<i2')
+        for start in range(0, num_samples, cycle_samples):
+            end = min(start + ring_samples, num_samples)
+            audio[start:end] = ring[:end - start]
+        
+        return audio.tobytes()
     
     @staticmethod
     def _mix_audio(audio_streams: List[bytes]) -> bytes:
@@ -121,42 +124,40 @@ class AudioGenerator:
         if not audio_streams:
             return b''
         
-        # Ensure all streams are the same length
-        min_length = min(len(stream) for stream in audio_streams)
+        # Ensure all streams are the same length (whole 16-bit samples)
+        num_samples = min(len(stream) for stream in audio_streams) // 2
         
-        mixed_samples = []
-        for i in range(0, min_length, 2):  # 2 bytes per sample (16-bit)
-            sample_sum = 0
-            
-            for stream in audio_streams:
-                if i + 1 < len(stream):
-                    sample = struct.unpack('<h', stream[i:i+2])[0]
-                    sample_sum += sample
-            
-            # Average and clamp
-            mixed_sample = sample_sum // len(audio_streams)
-            mixed_sample = max(-32768, min(32767, mixed_sample))
-            
-            mixed_samples.append(struct.pack('<h', mixed_sample))
+        # Sum in int32 so the streams cannot overflow before averaging
+        mixed = np.zeros(num_samples, dtype=np.int32)
+        for stream in audio_streams:
+            mixed += np.frombuffer(stream, dtype='<i2', count=num_samples)
+        
+        # Average and clamp
+        mixed //= len(audio_streams)
+        np.clip(mixed, -32768, 32767, out=mixed)
         
-        return b''.join(mixed_samples)
+        return mixed.astype('<i2').tobytes()
 
 
 class MusicPlayer:
     """Audio player for music on hold."""
     
-    def __init__(self, source: MusicSource):
+    def __init__(self, source: MusicSource, audio_data: Optional[bytes] = None):
         self.source = source
-        self.audio_data: Optional[bytes] = None
+        self.audio_data: Optional[bytes] = audio_data
         self.position = 0
         self.is_playing = False
         self.loop_count = 0
         
-        # Load audio data
-        asyncio.create_task(self._load_audio())
+        # Load audio data unless an already loaded buffer was shared with us
+        if audio_data is None:
+            asyncio.create_task(self._load_audio())
     
-    async def _load_audio(self):
-        """Load audio data based on source type."""
+    async def _load_audio(self) -> bool:
+        """Load audio data based on source type.
+        
+        Returns False when loading failed and the fallback ring tone was used.
+        """
         try:
             if self.source.source_type == MusicSourceType.FILE:
                 await self._load_from_file()
@@ -166,11 +167,13 @@ class MusicPlayer:
                 await self._generate_audio()
             
             logger.info(f"Loaded audio for source '{self.source.name}': {len(self.audio_data)} bytes")
+            return True
             
         except Exception as e:
             logger.error(f"Error loading audio source '{self.source.name}': {e}")
             # Fallback to generated ring tone
             self.audio_data = AudioGenerator.generate_ring_tone(60.0, self.source.sample_rate)
+            return False
     
     async def _load_from_file(self):
         """Load audio from file."""
@@ -229,16 +232,12 @@ class MusicPlayer:
         if volume == 1.0:
             return audio_data
         
-        # Convert bytes to samples, apply volume, convert back
-        samples = []
-        for i in range(0, len(audio_data), 2):
-            if i + 1 < len(audio_data):
-                sample = struct.unpack('<h', audio_data[i:i+2])[0]
-                sample = int(sample * volume)
-                sample = max(-32768, min(32767, sample))  # Clamp
-                samples.append(struct.pack('<h', sample))
+        # Scale in float32 in place; the int16 cast truncates like int()
+        samples = np.frombuffer(audio_data, dtype='<i2', count=len(audio_data) // 2).astype(np.float32)
+        samples *= np.float32(volume)
+        np.clip(samples, -32768, 32767, out=samples)
         
-        return b''.join(samples)
+        return samples.astype('<i2').tobytes()
     
     async def _load_from_stream(self):
         """Load audio from stream URL."""
@@ -308,6 +307,9 @@ class MusicOnHoldManager:
         self.music_sources: Dict[str, MusicSource] = {}
         self.players: Dict[str, MusicPlayer] = {}  # call_id -> player
         
+        # Loaded PCM per source, shared read-only by every player of that source
+        self._source_audio: Dict[str, bytes] = {}  # source name -> audio
+        
         # Active hold sessions
         self.hold_sessions: Dict[str, Dict[str, Any]] = {}  # call_id -> session info
         
@@ -349,12 +351,14 @@ class MusicOnHoldManager:
     def add_music_source(self, source: MusicSource):
         """Add music source."""
         self.music_sources[source.name] = source
+        self._source_audio.pop(source.name, None)
         logger.info(f"Added music source: {source.name} ({source.source_type.value})")
     
     def remove_music_source(self, name: str) -> bool:
         """Remove music source."""
         if name in self.music_sources:
             del self.music_sources[name]
+            self._source_audio.pop(name, None)
             logger.info(f"Removed music source: {name}")
             return True
         return False
@@ -375,9 +379,12 @@ class MusicOnHoldManager:
             
             source = self.music_sources[source_name]
             
-            # Create player
-            player = MusicPlayer(source)
-            await player._load_audio()  # Ensure audio is loaded
+            # Create player, loading the source only for its first listener
+            audio_data = self._source_audio.get(source_name)
+            player = MusicPlayer(source, audio_data)
+            if audio_data is None and await player._load_audio():
+                # Only a successful load is shared; a failed one retries on the next hold
+                self._source_audio[source_name] = player.audio_data
             
             # Start playback
             player.start()
@@ -438,10 +445,11 @@ class MusicOnHoldManager:
         """Main playback loop for hold music."""
         logger.info("Started music on hold playback loop")
         
+        interval = self.playback_interval
+        deadline = time.monotonic()
+        
         try:
             while self.players:
-                start_time = time.time()
-                
                 # Process each active player
                 for call_id in list(self.players.keys()):
                     try:
@@ -451,11 +459,14 @@ class MusicOnHoldManager:
                         # Remove problematic player
                         await self.stop_hold_music(call_id)
                 
-                # Sleep until next interval
-                elapsed = time.time() - start_time
-                sleep_time = max(0, self.playback_interval - elapsed)
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
+                # Sleep until the next absolute deadline so pacing does not drift
+                deadline += interval
+                now = time.monotonic()
+                if deadline > now:
+                    await asyncio.sleep(deadline - now)
+                elif now - deadline > interval:
+                    # Fell more than a chunk behind; resync instead of bursting
+                    deadline = now
                     
         except asyncio.CancelledError:
             logger.info("Music on hold playback loop cancelled")
@@ -11,6 +11,7 @@ from .call_handling.call_manager import CallManager
 from .call_handling.websocket_integration import WebSocketCallBridge
 from .api.sip_integration import initialize_services, start_api_server
 from .utils.config import get_config, AppConfig
+from .utils.event_loop import install_uvloop
 
 # Configure logging
 logging.basicConfig(
@@ -235,6 +236,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -3,18 +3,23 @@ import asyncio
 import socket
 import struct
 import logging
-import json
 import time
+import zlib
 from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
-import threading
+from dataclasses import dataclass, field
 import websockets
 from ..audio.codecs import AudioProcessor
 from ..audio.rtp import RTPHeader
 from ..utils.config import get_config
+from ..utils import json_codec
+from ..utils.event_loop import install_uvloop
+from ..websocket.frames import AUDIO_FRAME_HEADER, AUDIO_FRAME_VERSION, AUDIO_FRAME_TYPE_AUDIO
 
 logger = logging.getLogger(__name__)
 
+# Inbound RTP packets buffered per session while the AI link is busy (1s at 20ms)
+RTP_QUEUE_SIZE = 50
+
 
 @dataclass
 class MediaSession:
@@ -30,6 +35,61 @@ class MediaSession:
     audio_processor: Optional[AudioProcessor] = None
     created_at: float = 0.0
     last_activity: float = 0.0
+    frame_hash: int = field(init=False, default=0)
+    
+    def __post_init__(self):
+        # Identifies the session in binary audio frame headers
+        self.frame_hash = zlib.crc32(self.session_id.encode())
+
+
+class _ControlProtocol(asyncio.DatagramProtocol):
+    """RTPproxy control socket; answers each command as it arrives."""
+    
+    def __init__(self, proxy: "RTPproxy"):
+        self.proxy = proxy
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.closed = asyncio.get_running_loop().create_future()
+        
+    def connection_made(self, transport):
+        self.transport = transport
+        
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        try:
+            command = data.decode().strip()
+        except UnicodeDecodeError:
+            logger.warning(f"Undecodable RTPproxy command from {addr}")
+            self.transport.sendto(b"E1", addr)
+            return
+        
+        logger.info(f"Received RTPproxy command: '{command}' from {addr}")
+        response = self.proxy.handle_control_command_sync(command, addr)
+        if response:
+            logger.info(f"Sending response: '{response}' to {addr}")
+            self.transport.sendto(response.encode(), addr)
+            
+    def error_received(self, exc: Exception):
+        logger.error(f"Socket error: {exc}")
+        
+    def connection_lost(self, exc: Optional[Exception]):
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+
+class _RTPProtocol(asyncio.DatagramProtocol):
+    """Queues a session's inbound RTP packets for its forwarding task."""
+    
+    def __init__(self, session_id: str, packets: asyncio.Queue):
+        self.session_id = session_id
+        self.packets = packets
+        
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        try:
+            self.packets.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.debug(f"RTP queue full for session {self.session_id}, dropping packet")
+            
+    def error_received(self, exc: Exception):
+        logger.error(f"RTP socket error for session {self.session_id}: {exc}")
 
 
 class RTPproxy:
@@ -41,6 +101,9 @@ class RTPproxy:
         self.control_port = control_port or config.sip.rtp_proxy_port
         self.sessions: Dict[str, MediaSession] = {}
         self.socket_pairs: Dict[int, socket.socket] = {}
+        self.rtp_transports: Dict[int, asyncio.DatagramTransport] = {}
+        self.reader_tasks: Dict[int, asyncio.Task] = {}
+        self.control_transport: Optional[asyncio.DatagramTransport] = None
         self.audio_processor = AudioProcessor()
         self.running = False
         self.websocket_server = None
@@ -50,6 +113,8 @@ class RTPproxy:
         self.rtp_port_end = config.audio.rtp_port_end
         self.current_port = self.rtp_port_start
         self.websocket_port = config.websocket.port
+        self.binary_audio = config.websocket.binary_audio
+        self.sample_rate = config.audio.sample_rate
         
     async def start(self):
         """Start the RTP bridge server."""
@@ -62,17 +127,14 @@ class RTPproxy:
         )
         logger.info(f"AI platform WebSocket server started on port {self.websocket_port}")
         
-        # Start RTPproxy control protocol server
+        # Start RTPproxy control protocol server; RTP sockets get their own reader tasks
         control_task = asyncio.create_task(self.start_control_server())
         
-        # Start RTP packet processing
-        rtp_task = asyncio.create_task(self.process_rtp_packets())
-        
         logger.info("RTP bridge started successfully")
-        await asyncio.gather(control_task, rtp_task)
+        await control_task
     
     async def start_control_server(self):
-        """Start the RTPproxy control protocol server."""
+        """Start the RTPproxy control protocol server and serve until it closes."""
         try:
             # Create UDP socket for control commands
             sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -80,24 +142,14 @@ class RTPproxy:
             sock.bind((self.control_addr, self.control_port))
             sock.setblocking(False)
             
-            logger.info(f"RTPproxy control server listening on {self.control_addr}:{self.control_port}")
+            # Datagram endpoints work the same on the default loop and uvloop
+            loop = asyncio.get_running_loop()
+            self.control_transport, protocol = await loop.create_datagram_endpoint(
+                lambda: _ControlProtocol(self), sock=sock
+            )
             
-            while self.running:
-                try:
-                    data, addr = sock.recvfrom(1024)
-                    command = data.decode().strip()
-                    logger.info(f"Received RTPproxy command: '{command}' from {addr}")
-                    response = self.handle_control_command_sync(command, addr)
-                    if response:
-                        logger.info(f"Sending response: '{response}' to {addr}")
-                        sock.sendto(response.encode(), addr)
-                except socket.error as e:
-                    if e.errno not in (socket.EAGAIN, socket.EWOULDBLOCK):
-                        logger.error(f"Socket error: {e}")
-                    pass  # Remove sleep - socket is non-blocking
-                except Exception as e:
-                    logger.error(f"Error processing command: {e}")
-                    pass  # Remove sleep
+            logger.info(f"RTPproxy control server listening on {self.control_addr}:{self.control_port}")
+            await protocol.closed
                     
         except Exception as e:
             logger.error(f"Control server error: {e}")
@@ -247,10 +299,17 @@ class RTPproxy:
                     if session.ai_websocket:
                         session.ai_websocket = None
                     
-                    # Close RTP socket
-                    if session.local_port in self.socket_pairs:
-                        self.socket_pairs[session.local_port].close()
-                        del self.socket_pairs[session.local_port]
+                    # Stop forwarding, then close the RTP socket through its transport
+                    reader_task = self.reader_tasks.pop(session.local_port, None)
+                    if reader_task:
+                        reader_task.cancel()
+                    
+                    transport = self.rtp_transports.pop(session.local_port, None)
+                    rtp_sock = self.socket_pairs.pop(session.local_port, None)
+                    if transport:
+                        transport.close()
+                    elif rtp_sock:
+                        rtp_sock.close()
                     
                     logger.info(f"Deleted RTP session {session_id}")
             
@@ -292,6 +351,9 @@ class RTPproxy:
             rtp_sock.setblocking(False)
             
             self.socket_pairs[session.local_port] = rtp_sock
+            self.reader_tasks[session.local_port] = asyncio.get_running_loop().create_task(
+                self.serve_session_packets(session, rtp_sock)
+            )
             
             logger.info(f"Created RTP socket for session {session.session_id} on port {session.local_port}")
             
@@ -302,54 +364,47 @@ class RTPproxy:
         """Create RTP socket for a media session."""
         self.create_rtp_socket_sync(session)
     
-    async def process_rtp_packets(self):
-        """Process incoming RTP packets and forward to AI platform."""
-        while self.running:
-            try:
-                # Process packets for each active session
-                for session in list(self.sessions.values()):
-                    if session.local_port in self.socket_pairs:
-                        await self.process_session_packets(session)
-                
-                await asyncio.sleep(0)  # Yield control to other tasks
-                
-            except Exception as e:
-                logger.error(f"Error processing RTP packets: {e}")
-                await asyncio.sleep(1)
+    async def serve_session_packets(self, session: MediaSession, sock: socket.socket):
+        """Receive a session's RTP packets and forward them to the AI platform in order."""
+        loop = asyncio.get_running_loop()
+        packets: asyncio.Queue = asyncio.Queue(maxsize=RTP_QUEUE_SIZE)
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _RTPProtocol(session.session_id, packets), sock=sock
+        )
+        self.rtp_transports[session.local_port] = transport
+        
+        try:
+            while True:
+                data = await packets.get()
+                await self.process_session_packet(session, data)
+        finally:
+            transport.close()
+            if self.rtp_transports.get(session.local_port) is transport:
+                del self.rtp_transports[session.local_port]
     
-    async def process_session_packets(self, session: MediaSession):
-        """Process RTP packets for a specific session."""
+    async def process_session_packet(self, session: MediaSession, data: bytes):
+        """Process one RTP packet for a specific session."""
         try:
-            sock = self.socket_pairs.get(session.local_port)
-            if not sock:
+            session.last_activity = time.time()
+            
+            # Parse RTP header
+            if len(data) < 12:
                 return
             
-            try:
-                data, addr = sock.recvfrom(1500)
-                session.last_activity = time.time()
-                
-                # Parse RTP header
-                if len(data) < 12:
-                    return
-                
-                header = RTPHeader.parse(data)
-                payload = data[12:]  # Skip RTP header
-                
-                # Convert audio if needed
-                if header.payload_type == 0:  # PCMU
-                    pcm_data = session.audio_processor.convert_format(payload, "PCMU", "PCM")
-                elif header.payload_type == 8:  # PCMA  
-                    pcm_data = session.audio_processor.convert_format(payload, "PCMA", "PCM")
-                else:
-                    pcm_data = payload  # Assume PCM
-                
-                # Forward to AI platform via WebSocket
-                if session.ai_websocket:
-                    await self.send_audio_to_ai(session, pcm_data, header)
-                
-            except socket.error:
-                # No data available
-                pass
+            header = RTPHeader.parse(data)
+            payload = data[12:]  # Skip RTP header
+            
+            # Convert audio if needed
+            if header.payload_type == 0:  # PCMU
+                pcm_data = session.audio_processor.convert_format(payload, "PCMU", "PCM")
+            elif header.payload_type == 8:  # PCMA  
+                pcm_data = session.audio_processor.convert_format(payload, "PCMA", "PCM")
+            else:
+                pcm_data = payload  # Assume PCM
+            
+            # Forward to AI platform via WebSocket
+            if session.ai_websocket:
+                await self.send_audio_to_ai(session, pcm_data, header)
                 
         except Exception as e:
             logger.error(f"Error processing session packets: {e}")
@@ -360,6 +415,18 @@ class RTPproxy:
             if not session.ai_websocket:
                 return
             
+            if self.binary_audio:
+                # Same framing as the WebSocket bridge: fixed header followed by raw PCM
+                header = AUDIO_FRAME_HEADER.pack(
+                    AUDIO_FRAME_VERSION,
+                    AUDIO_FRAME_TYPE_AUDIO,
+                    rtp_header.sequence_number & 0xFFFF,
+                    session.frame_hash,
+                    time.time_ns()
+                )
+                await session.ai_websocket.send(header + audio_data)
+                return
+            
             # Create message for AI platform
             message = {
                 "type": "audio_data",
@@ -367,12 +434,12 @@ class RTPproxy:
                 "timestamp": rtp_header.timestamp,
                 "sequence": rtp_header.sequence_number,
                 "audio_data": audio_data.hex(),  # Send as hex string
-                "sample_rate": get_config().audio.sample_rate,
+                "sample_rate": self.sample_rate,
                 "channels": 1,
                 "format": "pcm"
             }
             
-            await session.ai_websocket.send(json.dumps(message))
+            await session.ai_websocket.send(json_codec.dumps(message))
             
         except Exception as e:
             logger.error(f"Error sending audio to AI platform: {e}")
@@ -399,10 +466,18 @@ class RTPproxy:
             
             # Handle messages from AI platform
             async for message in websocket:
+                if isinstance(message, bytes):
+                    # Binary audio response: frame header followed by raw PCM
+                    if len(message) > AUDIO_FRAME_HEADER.size:
+                        await self.send_ai_audio_to_caller(
+                            available_session, message[AUDIO_FRAME_HEADER.size:]
+                        )
+                    continue
+                    
                 try:
-                    data = json.loads(message)
+                    data = json_codec.loads(message)
                     await self.handle_ai_message(available_session, data)
-                except json.JSONDecodeError:
+                except json_codec.JSONDecodeError:
                     logger.error("Invalid JSON from AI platform")
                 
         except websockets.exceptions.ConnectionClosed:
@@ -422,25 +497,26 @@ class RTPproxy:
             if msg_type == "audio_response":
                 # Convert AI audio response back to RTP
                 audio_hex = data.get("audio_data", "")
-                audio_data = bytes.fromhex(audio_hex)
-                
-                # Convert PCM to telephony format (PCMU)
-                telephony_data = session.audio_processor.convert_format(audio_data, "PCM", "PCMU")
-                
-                # Send back to SIP caller
-                await self.send_rtp_to_caller(session, telephony_data)
+                await self.send_ai_audio_to_caller(session, bytes.fromhex(audio_hex))
                 
         except Exception as e:
             logger.error(f"Error handling AI message: {e}")
     
+    async def send_ai_audio_to_caller(self, session: MediaSession, audio_data: bytes):
+        """Convert AI platform PCM to PCMU and send it to the SIP caller."""
+        try:
+            telephony_data = session.audio_processor.convert_format(audio_data, "PCM", "PCMU")
+            await self.send_rtp_to_caller(session, telephony_data)
+        except Exception as e:
+            logger.error(f"Error handling AI audio: {e}")
+    
     async def send_rtp_to_caller(self, session: MediaSession, audio_data: bytes):
         """Send RTP packet back to SIP caller."""
         try:
-            if session.local_port not in self.socket_pairs:
+            transport = self.rtp_transports.get(session.local_port)
+            if not transport:
                 return
             
-            sock = self.socket_pairs[session.local_port]
-            
             # Create RTP header
             # This is a simplified RTP packet creation
             rtp_header = struct.pack('!BBHII',
@@ -454,7 +530,7 @@ class RTPproxy:
             rtp_packet = rtp_header + audio_data
             
             # Send to caller
-            sock.sendto(rtp_packet, (session.caller_ip, session.caller_port))
+            transport.sendto(rtp_packet, (session.caller_ip, session.caller_port))
             
         except Exception as e:
             logger.error(f"Error sending RTP to caller: {e}")
@@ -477,4 +553,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
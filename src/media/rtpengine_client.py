@@ -2,10 +2,10 @@
 import asyncio
 import json
 import logging
-import socket
 import struct
 import time
 import hashlib
+import secrets
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -86,6 +86,35 @@ class RTPSession:
         return self.rtpengine_session_id is not None
 
 
+class _NgProtocol(asyncio.DatagramProtocol):
+    """ng control socket; hands each reply to the request waiting on its cookie."""
+    
+    def __init__(self):
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.pending: Dict[bytes, asyncio.Future] = {}
+        
+    def connection_made(self, transport):
+        self.transport = transport
+        
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        cookie, _, reply = data.partition(b" ")
+        future = self.pending.pop(cookie, None)
+        if future is None or future.done():
+            # Late answer to a request that already timed out
+            logger.debug(f"Discarding stale RTPEngine reply from {addr}")
+            return
+        future.set_result(reply)
+        
+    def error_received(self, exc: Exception):
+        logger.error(f"RTPEngine socket error: {exc}")
+        
+    def connection_lost(self, exc: Optional[Exception]):
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("RTPEngine client stopped"))
+        self.pending.clear()
+
+
 class RTPEngineClient:
     """Client for communicating with RTPEngine."""
     
@@ -96,8 +125,9 @@ class RTPEngineClient:
         self.control_port = control_port
         self.timeout = timeout
         
-        # Socket for communication
-        self.sock: Optional[socket.socket] = None
+        # Control socket; requests in flight are matched to replies by cookie
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.protocol: Optional[_NgProtocol] = None
         
         # Active sessions
         self.sessions: Dict[str, RTPSession] = {}
@@ -111,8 +141,9 @@ class RTPEngineClient:
     async def start(self):
         """Start RTPEngine client."""
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.sock.settimeout(self.timeout)
+            self.transport, self.protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+                _NgProtocol, remote_addr=(self.host, self.port)
+            )
             
             # Test connectivity
             await self._ping()
@@ -131,9 +162,10 @@ class RTPEngineClient:
                 await self.delete_session(session_key)
             
             # Close socket
-            if self.sock:
-                self.sock.close()
-                self.sock = None
+            if self.transport:
+                self.transport.close()
+                self.transport = None
+                self.protocol = None
                 
             logger.info("RTPEngine client stopped")
             
@@ -374,19 +406,26 @@ class RTPEngineClient:
             return False
     
     async def _send_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Send request to RTPEngine."""
+        """Send request to RTPEngine.
+        
+        Requests carry an ng protocol cookie, so several can be in flight on
+        the one socket; late replies to requests that timed out are dropped.
+        """
         try:
-            if not self.sock:
+            if not self.transport:
                 raise Exception("RTPEngine client not started")
             
             # Encode request using bencode
             encoded_request = bencodepy.encode(request)
             
-            # Send request
-            self.sock.sendto(encoded_request, (self.host, self.port))
-            
-            # Receive response
-            data, addr = self.sock.recvfrom(65536)
+            cookie = secrets.token_hex(8).encode()
+            reply = asyncio.get_running_loop().create_future()
+            self.protocol.pending[cookie] = reply
+            try:
+                self.transport.sendto(cookie + b" " + encoded_request)
+                data = await asyncio.wait_for(reply, self.timeout)
+            finally:
+                self.protocol.pending.pop(cookie, None)
             
             # Decode response
             response = bencodepy.decode(data)
@@ -396,7 +435,7 @@ class RTPEngineClient:
             
             return response
             
-        except socket.timeout:
+        except asyncio.TimeoutError:
             raise Exception("RTPEngine request timeout")
         except Exception as e:
             logger.error(f"RTPEngine communication error: {e}")
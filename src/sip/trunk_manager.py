@@ -5,7 +5,7 @@ import time
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
-import aiohttp
+import httpx
 import json
 from sqlalchemy.orm import Session
 from sqlalchemy import create_engine, select, insert, update, delete
@@ -139,6 +139,10 @@ class SIPTrunkManager:
         self.trunks: Dict[str, TrunkConfig] = {}
         self.active_calls: Dict[str, str] = {}  # call_id -> trunk_id
         
+        # Long-lived RPC client so trunk checks reuse keep-alive connections;
+        # created on first use so the manager can be restarted after stop()
+        self.rpc_client: Optional[httpx.AsyncClient] = None
+        
         # Database engine for direct database operations
         self.db_engine = create_engine(DATABASE_URL)
         
@@ -179,6 +183,10 @@ class SIPTrunkManager:
             if self.registration_tasks:
                 await asyncio.gather(*self.registration_tasks.values(), return_exceptions=True)
             
+            if self.rpc_client:
+                await self.rpc_client.aclose()
+                self.rpc_client = None
+            
             logger.info("SIP Trunk Manager stopped")
             
         except Exception as e:
@@ -479,16 +487,16 @@ class SIPTrunkManager:
     async def _send_kamailio_rpc(self, params: Dict[str, Any]) -> bool:
         """Send RPC command to Kamailio."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.kamailio_rpc_url,
-                    json=params,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get("result") == "ok"
-                    return False
+            if self.rpc_client is None or self.rpc_client.is_closed:
+                self.rpc_client = httpx.AsyncClient(
+                    timeout=10.0,
+                    limits=httpx.Limits(max_keepalive_connections=100)
+                )
+            
+            response = await self.rpc_client.post(self.kamailio_rpc_url, json=params)
+            if response.status_code == 200:
+                return response.json().get("result") == "ok"
+            return False
                     
         except Exception as e:
             logger.error(f"Kamailio RPC error: {e}")
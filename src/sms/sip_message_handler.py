@@ -2,6 +2,7 @@
 import asyncio
 import json
 import logging
+import re
 from typing import Dict, List, Optional, Any
 import aiohttp
 from datetime import datetime, timezone
@@ -9,6 +10,43 @@ import uuid
 
 logger = logging.getLogger(__name__)
 
+# Extra header line for uac.uac_req; the RPC expects the CRLF escaped
+_RPC_HEADER_TEMPLATE = "{}: {}\\r\\n"
+
+# Folds raw line breaks and escapes backslashes in header values, so neither a
+# raw line break nor the escaped text \r\n can inject extra headers
+_HEADER_VALUE_ESCAPE = str.maketrans({"\r": " ", "\n": " ", "\\": "\\\\"})
+
+# RFC 3261 token characters allowed in a header name
+_HEADER_NAME = re.compile(r"[A-Za-z0-9.!%*_+`'~-]+")
+
+_DELIVERY_REPORT_TEMPLATE = (
+    "Delivery Status: {status}\n"
+    "Original Message ID: {original_id}\n"
+    "Timestamp: {timestamp}"
+)
+
+# Message ID markers searched in delivery report bodies, in priority order
+_MESSAGE_ID_PATTERNS = (
+    re.compile(r"Message-ID:\s*([a-fA-F0-9-]+)"),
+    re.compile(r"Original-ID:\s*([a-fA-F0-9-]+)"),
+    re.compile(r"SMS-ID:\s*([a-fA-F0-9-]+)")
+)
+
+
+def _format_rpc_headers(headers: Dict[str, str]) -> str:
+    """Render headers as the escaped extra-headers string for uac.uac_req.
+    
+    Headers whose name is not a valid SIP token are left out.
+    """
+    lines = []
+    for name, value in headers.items():
+        if not _HEADER_NAME.fullmatch(str(name)):
+            logger.warning(f"Dropping SIP header with invalid name {name!r}")
+            continue
+        lines.append(_RPC_HEADER_TEMPLATE.format(name, str(value).translate(_HEADER_VALUE_ESCAPE)))
+    return "".join(lines)
+
 
 class SIPMessageHandler:
     """Handler for SIP MESSAGE method (SMS over SIP)."""
@@ -134,9 +172,7 @@ class SIPMessageHandler:
                 raise Exception("SIP MESSAGE handler not started")
             
             # Prepare headers string for RPC
-            headers_str = ""
-            for key, value in headers.items():
-                headers_str += f"{key}: {value}\\r\\n"
+            headers_str = _format_rpc_headers(headers)
             
             # RPC payload
             payload = {
@@ -250,15 +286,8 @@ class SIPMessageHandler:
                 return headers[header_name]
         
         # Try to find message ID in body
-        import re
-        message_id_patterns = [
-            r"Message-ID:\s*([a-fA-F0-9-]+)",
-            r"Original-ID:\s*([a-fA-F0-9-]+)",
-            r"SMS-ID:\s*([a-fA-F0-9-]+)"
-        ]
-        
-        for pattern in message_id_patterns:
-            match = re.search(pattern, body)
+        for pattern in _MESSAGE_ID_PATTERNS:
+            match = pattern.search(body)
             if match:
                 return match.group(1)
         
@@ -342,7 +371,11 @@ class SIPMessageHandler:
             # Prepare delivery confirmation message
             original_id = original_message.get("headers", {}).get("X-SMS-ID", "unknown")
             
-            delivery_body = f"Delivery Status: {status}\nOriginal Message ID: {original_id}\nTimestamp: {datetime.now(timezone.utc).isoformat()}"
+            delivery_body = _DELIVERY_REPORT_TEMPLATE.format_map({
+                "status": status,
+                "original_id": original_id,
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            })
             
             headers = {
                 "Content-Type": "message/delivery-status",
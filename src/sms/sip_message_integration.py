@@ -19,9 +19,16 @@ class SIPMessageIntegration:
         self.auth_token = auth_token or "test-token"
         self.session: Optional[aiohttp.ClientSession] = None
         
+        # Request target and headers are fixed for the lifetime of the integration
+        self.sms_url = f"{self.ai_platform_url}/sms/incoming"
+        self.ai_headers = {
+            "Authorization": f"Bearer {self.auth_token}",
+            "Content-Type": "application/json"
+        }
+        
     async def start(self):
         """Start the SMS integration."""
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(headers=self.ai_headers)
         logger.info("SMS integration started")
         
     async def stop(self):
@@ -110,14 +117,7 @@ class SIPMessageIntegration:
                     "ai_response": "Mock AI response"
                 }
             
-            headers = {
-                "Authorization": f"Bearer {self.auth_token}",
-                "Content-Type": "application/json"
-            }
-            
-            url = f"{self.ai_platform_url}/sms/incoming"
-            
-            async with self.session.post(url, json=sms_data, headers=headers) as response:
+            async with self.session.post(self.sms_url, json=sms_data) as response:
                 if response.status == 200:
                     result = await response.json()
                     return result
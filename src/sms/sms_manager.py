@@ -3,7 +3,7 @@ import asyncio
 import logging
 import time
 import uuid
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta, timezone
@@ -204,6 +204,7 @@ class SMSManager:
         # Background tasks
         self._processing_task = None
         self._cleanup_task = None
+        self._send_tasks: Set[asyncio.Task] = set()
         
         # Start background processing
         self.start_processing()
@@ -230,6 +231,10 @@ class SMSManager:
             self._cleanup_task.cancel()
             tasks.append(self._cleanup_task)
         
+        for task in self._send_tasks:
+            task.cancel()
+            tasks.append(task)
+        
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
         
@@ -463,24 +468,32 @@ class SMSManager:
         """Background task to process SMS queue."""
         logger.info("Started SMS queue processing")
         
+        # Bounds in-flight sends without rescanning active messages on every pass
+        send_slots = asyncio.Semaphore(self.max_concurrent_messages)
+        
+        def release_slot(task: asyncio.Task):
+            self._send_tasks.discard(task)
+            send_slots.release()
+        
         try:
             while True:
                 try:
-                    # Check if we're under the concurrent limit
-                    sending_count = len([
-                        msg for msg in self.active_messages.values()
-                        if msg.status == SMSStatus.SENDING
-                    ])
-                    
-                    if sending_count >= self.max_concurrent_messages:
-                        await asyncio.sleep(1)
-                        continue
+                    # Wait for a free slot first, so a cancelled wait leaves the message queued
+                    await send_slots.acquire()
                     
-                    # Get next message from queue
-                    message = await self.sms_queue.dequeue()
+                    # Get next message from queue; the slot goes back unless a send takes it
+                    message = None
+                    try:
+                        message = await self.sms_queue.dequeue()
+                    finally:
+                        if not message:
+                            send_slots.release()
                     
                     if message:
-                        await self._send_message_via_sip(message)
+                        # Send alongside other in-flight messages
+                        task = asyncio.create_task(self._send_message_via_sip(message))
+                        self._send_tasks.add(task)
+                        task.add_done_callback(release_slot)
                     else:
                         # No messages in queue, wait a bit
                         await asyncio.sleep(1)
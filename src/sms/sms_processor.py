@@ -1,5 +1,6 @@
 """SMS Processing and AI Integration."""
 import asyncio
+import functools
 import json
 import logging
 import re
@@ -11,6 +12,15 @@ from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Indexed by datetime.weekday(); avoids a locale-aware strftime("%A") per check
+_WEEKDAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_clock_time(value: str):
+    """Parse an "HH:MM" rule time once; rules reuse the same few strings."""
+    return datetime.strptime(value, "%H:%M").time()
+
 
 @dataclass
 class SMSProcessingResult:
@@ -346,14 +356,14 @@ class SMSProcessor:
             # Check day of week
             if "days" in restrictions:
                 allowed_days = restrictions["days"]
-                current_day = current_time.strftime("%A").lower()
-                if current_day not in [day.lower() for day in allowed_days]:
+                current_day = _WEEKDAY_NAMES[current_time.weekday()]
+                if not any(day.lower() == current_day for day in allowed_days):
                     return False
             
             # Check time range
             if "start_time" in restrictions and "end_time" in restrictions:
-                start_time = datetime.strptime(restrictions["start_time"], "%H:%M").time()
-                end_time = datetime.strptime(restrictions["end_time"], "%H:%M").time()
+                start_time = _parse_clock_time(restrictions["start_time"])
+                end_time = _parse_clock_time(restrictions["end_time"])
                 current_time_only = current_time.time()
                 
                 if start_time <= end_time:
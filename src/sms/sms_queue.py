@@ -3,7 +3,8 @@ import asyncio
 import heapq
 import logging
 import time
-from typing import List, Optional, Dict, Any
+from collections import deque
+from typing import Deque, List, Optional, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
@@ -11,6 +12,12 @@ from datetime import datetime, timedelta
 logger = logging.getLogger(__name__)
 
 
+def _prune_send_times(send_times: Deque[float], cutoff_time: float) -> None:
+    """Drop send times at or before the cutoff; times are appended in order."""
+    while send_times and send_times[0] <= cutoff_time:
+        send_times.popleft()
+
+
 class SMSQueuePriority(Enum):
     """SMS queue priority levels."""
     LOW = 1
@@ -53,7 +60,7 @@ class SMSQueue:
         self.start_time = time.time()
         
         # Throttling
-        self.last_send_times: List[float] = []
+        self.last_send_times: Deque[float] = deque()
         self.throttle_window = 60.0  # 1 minute window
         
         # Lock for thread safety
@@ -221,7 +228,7 @@ class SMSQueue:
         # Initialize rate limit tracking for number if needed
         if from_number not in self.rate_limits:
             self.rate_limits[from_number] = {
-                "send_times": [],
+                "send_times": deque(),
                 "last_cleanup": current_time
             }
         
@@ -229,19 +236,16 @@ class SMSQueue:
         
         # Clean up old entries (older than 1 minute)
         cutoff_time = current_time - 60
-        number_limits["send_times"] = [
-            t for t in number_limits["send_times"] if t > cutoff_time
-        ]
+        _prune_send_times(number_limits["send_times"], cutoff_time)
         
         # Check per-number rate limit
         if len(number_limits["send_times"]) >= self.per_number_rate_limit:
             return False
         
         # Check global rate limit
-        total_recent_sends = sum(
-            len([t for t in limits["send_times"] if t > cutoff_time])
-            for limits in self.rate_limits.values()
-        )
+        for limits in self.rate_limits.values():
+            _prune_send_times(limits["send_times"], cutoff_time)
+        total_recent_sends = sum(len(limits["send_times"]) for limits in self.rate_limits.values())
         
         if total_recent_sends >= self.global_rate_limit:
             return False
@@ -262,7 +266,7 @@ class SMSQueue:
         
         # Clean up old send times (older than throttle window)
         cutoff_time = current_time - self.throttle_window
-        self.last_send_times = [t for t in self.last_send_times if t > cutoff_time]
+        _prune_send_times(self.last_send_times, cutoff_time)
         
         # Check if we're sending too fast
         if len(self.last_send_times) >= self.global_rate_limit:
@@ -342,7 +346,7 @@ class SMSQueue:
                 "recent_sends": recent_sends,
                 "limit": self.per_number_rate_limit,
                 "remaining": max(0, self.per_number_rate_limit - recent_sends),
-                "reset_time": min(number_limits["send_times"]) + 60 if number_limits["send_times"] else current_time
+                "reset_time": number_limits["send_times"][0] + 60 if number_limits["send_times"] else current_time
             }
     
     async def cleanup_expired_rate_limits(self):
@@ -355,9 +359,7 @@ class SMSQueue:
             
             for number, limits in self.rate_limits.items():
                 # Remove old send times
-                limits["send_times"] = [
-                    t for t in limits["send_times"] if t > current_time - 60
-                ]
+                _prune_send_times(limits["send_times"], current_time - 60)
                 
                 # Mark for removal if no recent activity
                 if (not limits["send_times"] and 
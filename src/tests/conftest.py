@@ -2,12 +2,11 @@
 Pytest configuration and shared fixtures for SIP server testing.
 """
 import asyncio
+import audioop
 import pytest
 import pytest_asyncio
 import logging
-import os
-import tempfile
-import shutil
+import random
 from typing import AsyncGenerator, Dict, Any, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
@@ -298,27 +297,30 @@ def sample_sip_data():
     }
 
 
-@pytest.fixture
-def sample_audio_data():
-    """Generate sample audio data for testing."""
-    # Generate 20ms of 8kHz PCMU audio (160 samples)
-    sample_rate = 8000
-    duration = 0.02  # 20ms
+def _generate_sample_pcm(sample_rate: int = 8000, duration: float = 0.02) -> bytes:
+    """Generate a 1kHz sine wave as 16-bit PCM."""
     samples = int(sample_rate * duration)
-    
-    # Generate sine wave at 1kHz
     t = np.linspace(0, duration, samples, False)
     sine_wave = np.sin(2 * np.pi * 1000 * t)
-    
-    # Convert to 16-bit PCM
-    pcm_data = (sine_wave * 32767).astype(np.int16).tobytes()
-    
+    return (sine_wave * 32767).astype(np.int16).tobytes()
+
+
+# 20ms of 8kHz audio (160 samples); immutable, so synthesized once for the session
+_SAMPLE_PCM = _generate_sample_pcm()
+# The same tone as real G.711 payloads, encoded once by audioop's C codecs
+_SAMPLE_PCMU = audioop.lin2ulaw(_SAMPLE_PCM, 2)
+_SAMPLE_PCMA = audioop.lin2alaw(_SAMPLE_PCM, 2)
+
+
+@pytest.fixture
+def sample_audio_data():
+    """Generate sample audio data for testing."""
     return {
-        "pcm": pcm_data,
-        "pcmu": b'\x00' * 160,  # Mock PCMU data
-        "pcma": b'\x55' * 160,  # Mock PCMA data
-        "samples": samples,
-        "sample_rate": sample_rate
+        "pcm": _SAMPLE_PCM,
+        "pcmu": _SAMPLE_PCMU,
+        "pcma": _SAMPLE_PCMA,
+        "samples": 160,
+        "sample_rate": 8000
     }
 
 
@@ -415,30 +417,22 @@ async def mock_kamailio_rpc():
         yield responses
 
 
-@pytest.fixture
-def temp_audio_file():
-    """Create temporary audio file for testing."""
-    temp_dir = tempfile.mkdtemp()
-    audio_file = os.path.join(temp_dir, "test_audio.wav")
+@pytest.fixture(scope="session")
+def temp_audio_file(tmp_path_factory):
+    """Create temporary audio file for testing (shared, read-only)."""
+    audio_file = tmp_path_factory.mktemp("audio") / "test_audio.wav"
     
-    # Create simple WAV file
-    import wave
-    with wave.open(audio_file, 'wb') as wav:
-        wav.setnchannels(1)  # Mono
-        wav.setsampwidth(2)  # 16-bit
-        wav.setframerate(8000)  # 8kHz
-        
-        # Generate 1 second of sine wave
-        samples = 8000
-        t = np.linspace(0, 1, samples, False)
-        sine_wave = np.sin(2 * np.pi * 440 * t)  # 440Hz A note
-        audio_data = (sine_wave * 32767).astype(np.int16)
-        wav.writeframes(audio_data.tobytes())
+    # Generate 1 second of 16-bit mono sine wave at 8kHz
+    samples = 8000
+    t = np.arange(samples, dtype=np.float32) / 8000
+    sine_wave = np.sin(2 * np.pi * 440 * t)  # 440Hz A note
+    audio_data = (sine_wave * 32767).astype(np.int16)
     
-    yield audio_file
+    # Write the WAV straight from the array
+    from scipy.io import wavfile
+    wavfile.write(str(audio_file), 8000, audio_data)
     
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    return str(audio_file)
 
 
 @pytest.fixture
@@ -458,6 +452,10 @@ def performance_thresholds():
 
 # Test utilities
 
+# Seeded so generated test data is reproducible between runs
+_test_rng = random.Random(42)
+
+
 class TestUtils:
     """Utility functions for testing."""
     
@@ -470,8 +468,7 @@ class TestUtils:
     @staticmethod
     def generate_phone_number() -> str:
         """Generate random phone number."""
-        import random
-        return f"+1{random.randint(1000000000, 9999999999)}"
+        return f"+1{_test_rng.randint(1000000000, 9999999999)}"
     
     @staticmethod
     async def wait_for_condition(condition_func, timeout: float = 5.0, interval: float = 0.1) -> bool:
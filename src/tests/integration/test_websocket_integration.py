@@ -12,7 +12,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any
 import threading
 
-from src.websocket.bridge import WebSocketBridge, CallInfo, CallState, MessageType
+from src.websocket.bridge import WebSocketBridge, MessageType
+from src.websocket.models import CallInfo, CallState
 
 
 # NOTE: This test class is commented out because it requires a full WebSocket server infrastructure
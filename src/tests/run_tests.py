@@ -303,11 +303,9 @@ def generate_test_report(results: Dict[str, Any]):
                 if result.get("stderr"):
                     print(f"Error: {result['stderr']}")
                 if result.get("stdout"):
-                    # Show last few lines of output
-                    lines = result["stdout"].split("\\n")
-                    relevant_lines = [line for line in lines[-20:] if line.strip()]
-                    for line in relevant_lines:
-                        print(f"  {line}")
+                    # Show last few lines of output; only the tail is split, not the whole log
+                    tail = result["stdout"].rsplit("\n", 20)[-20:]
+                    sys.stdout.writelines(f"  {line}\n" for line in tail if line.strip())
     
     # Overall assessment
     overall_success = len(failed_tests) == 0 and results.get("structure_validation", False)
@@ -228,6 +228,16 @@ class TestAudioProcessor:
         invalid_codec = audio_processor.get_codec('INVALID')
         assert invalid_codec is None
     
+    def test_decode_and_agc_matches_separate_steps(self, audio_processor, sample_audio_data):
+        """Test the fused decode + AGC gives the same output as the two separate calls."""
+        for codec in ('PCMU', 'PCMA'):
+            encoded = audio_processor.convert_format(sample_audio_data["pcm"], 'PCM', codec)
+            expected = audio_processor.apply_agc(audio_processor.convert_format(encoded, codec, 'PCM'))
+            assert audio_processor.decode_and_agc(encoded, codec) == expected
+        
+        silence = b'\xff' * 160  # μ-law silence decodes to zero samples
+        assert audio_processor.decode_and_agc(silence, 'PCMU') == audio_processor.convert_format(silence, 'PCMU', 'PCM')
+    
     def test_invalid_input_handling(self, audio_processor):
         """Test handling of invalid input data."""
         # Test with empty data - should return empty bytes gracefully
@@ -330,6 +340,21 @@ class TestAudioProcessor:
         assert faded_in != audio_data
         assert faded_out != audio_data
 
+    def test_fade_envelope_values(self, audio_processor):
+        """Test fades scale each sample by a linear ramp, truncating toward zero."""
+        pattern = [1000, -1000, 32767, -32768, 7, -7, 500, -500]
+        samples = pattern * 10
+        audio_data = struct.pack(f'<{len(samples)}h', *samples)
+        fade_samples = 8  # 1ms at 8kHz
+
+        faded_in = list(struct.unpack(f'<{len(samples)}h', audio_processor.fade_in(audio_data, fade_ms=1)))
+        faded_out = list(struct.unpack(f'<{len(samples)}h', audio_processor.fade_out(audio_data, fade_ms=1)))
+
+        assert faded_in[:fade_samples] == [int(s * (i / fade_samples)) for i, s in enumerate(pattern)]
+        assert faded_in[fade_samples:] == samples[fade_samples:]
+        assert faded_out[-fade_samples:] == [int(s * (1.0 - i / fade_samples)) for i, s in enumerate(pattern)]
+        assert faded_out[:-fade_samples] == samples[:-fade_samples]
+
 
 class TestRTPSession:
     """Test RTP session functionality."""
@@ -565,6 +590,16 @@ class TestRTPStatistics:
         assert rtp_stats.packets_received == 1
         assert rtp_stats.bytes_received == 160
     
+    def test_record_received_payload(self, rtp_stats):
+        """Test recording raw payloads without an RTP header."""
+        rtp_stats.record_received_payload(b'\x00' * 160)
+        rtp_stats.record_received_payload(b'\x00' * 160)
+        
+        assert rtp_stats.packets_received == 2
+        assert rtp_stats.bytes_received == 320
+        assert rtp_stats.packets_lost == 0
+        assert rtp_stats.last_sequence is None
+    
     def test_packet_loss_calculation(self, rtp_stats):
         """Test packet loss rate calculation."""
         from src.audio.rtp import RTPPacket, RTPHeader
@@ -601,7 +636,21 @@ class TestRTPStatistics:
         
         # Jitter should be calculated
         assert rtp_stats.jitter_ms >= 0
-    
+
+    def test_rolling_jitter_matches_window(self, rtp_stats):
+        """Test rolling jitter equals the deviation of the last window of intervals."""
+        from src.audio.rtp import JITTER_WINDOW
+
+        rng = np.random.default_rng(7)
+        arrivals = np.cumsum(0.02 + rng.uniform(-0.004, 0.004, 3 * JITTER_WINDOW))
+
+        with patch("src.audio.rtp.time.monotonic", side_effect=arrivals.tolist()):
+            for _ in arrivals:
+                rtp_stats.record_received_payload(b'\x00' * 160)
+
+        expected = np.std(np.diff(arrivals[-JITTER_WINDOW:])) * 1000
+        assert rtp_stats.jitter_ms == pytest.approx(expected, rel=1e-6)
+
     def test_bitrate_calculation(self, rtp_stats):
         """Test bitrate calculation through statistics."""
         # Record sent packets
@@ -138,6 +138,30 @@ class TestDTMFDetector:
         dtmf_detector.remove_event_handler(test_handler)
         assert len(dtmf_detector.event_handlers) == 0
     
+    @pytest.mark.asyncio
+    async def test_async_handlers_run_concurrently(self, dtmf_detector):
+        """Test that coroutine handlers are awaited together and isolated from failures."""
+        started = []
+        release = asyncio.Event()
+
+        async def slow_handler(event: DTMFEvent):
+            started.append("slow")
+            await release.wait()
+
+        async def failing_handler(event: DTMFEvent):
+            started.append("failing")
+            release.set()
+            raise RuntimeError("handler failure")
+
+        dtmf_detector.add_event_handler(slow_handler)
+        dtmf_detector.add_event_handler(failing_handler)
+
+        event = await asyncio.wait_for(dtmf_detector.process_sip_info("test-gather", "7"), 1.0)
+
+        assert event.digit == "7"
+        assert started == ["slow", "failing"]
+        assert dtmf_detector.total_events == 1
+
     # NOTE: Commented out - requires full DTMF implementation and debouncing logic
     # @pytest.mark.asyncio
     # async def test_dtmf_debouncing(self, dtmf_detector):
@@ -171,6 +195,35 @@ class TestDTMFDetector:
         assert '1' in dtmf_frequencies
         assert '*' in dtmf_frequencies
     
+    def test_inband_frame_detection_all_digits(self, dtmf_detector):
+        """Test in-band detection of every keypad digit in a single frame."""
+        inband = dtmf_detector.inband_detector
+        t = np.arange(inband.frame_size) / inband.sample_rate
+
+        for (low, high), digit in inband.DTMF_MATRIX.items():
+            frame = (np.sin(2 * np.pi * low * t) + np.sin(2 * np.pi * high * t)) * 8000
+            assert inband._detect_dtmf_in_frame(frame.astype(np.float32)) == digit
+
+        # Silence and a single non-DTMF tone are rejected
+        assert inband._detect_dtmf_in_frame(np.zeros(inband.frame_size, dtype=np.float32)) is None
+        tone = np.sin(2 * np.pi * 1000 * t) * 8000
+        assert inband._detect_dtmf_in_frame(tone.astype(np.float32)) is None
+
+    def test_inband_buffer_keeps_latest_frame(self, dtmf_detector):
+        """Test that the per-call buffer holds the most recent frame of samples."""
+        inband = dtmf_detector.inband_detector
+        samples = np.arange(400, dtype=np.int16)
+
+        for start in range(0, 400, 80):
+            inband.process_audio("test-buffer", samples[start:start + 80].tobytes())
+
+        buffer = inband.call_buffers["test-buffer"]
+        assert buffer.dtype == np.float32
+        assert np.array_equal(buffer, samples[-inband.frame_size:].astype(np.float32))
+
+        dtmf_detector.cleanup_call("test-buffer")
+        assert "test-buffer" not in inband.call_buffers
+
     def test_call_state_management(self, dtmf_detector):
         """Test call state management in detector."""
         call_id = "test-state"
@@ -272,12 +325,13 @@ class TestDTMFProcessor:
         dtmf_processor.add_pattern(pattern)
         
         # Send matching sequence
-        for digit_char in "123":
+        start_time = time.time()
+        for i, digit_char in enumerate("123"):
             event = DTMFEvent(
                 call_id=call_id,
                 digit=digit_char,
                 method=DTMFMethod.SIP_INFO,
-                timestamp=time.time(),
+                timestamp=start_time + i * 0.1,
                 duration_ms=100
             )
             result = await dtmf_processor.process_dtmf_event(event)
@@ -299,24 +353,25 @@ class TestDTMFProcessor:
         dtmf_processor.add_pattern(pattern)
         
         # Send partial sequence
+        start_time = time.time()
         event = DTMFEvent(
             call_id=call_id,
             digit="4",
             method=DTMFMethod.RFC2833,
-            timestamp=time.time(),
+            timestamp=start_time,
             duration_ms=100
         )
         await dtmf_processor.process_dtmf_event(event)
         
-        # Wait for timeout
-        await asyncio.sleep(0.2)
+        # Not yet expired at the digit time; check 200ms later without sleeping
+        sequence = dtmf_processor.active_sequences[call_id]
+        assert not sequence.is_expired(0.1, now=start_time)
         
         # Sequence should be timed out and cleared
         # Force cleanup by checking timeout condition
-        current_time = time.time()
         expired_calls = []
         for call_id_check, sequence in dtmf_processor.active_sequences.items():
-            if sequence.is_expired(0.1):  # Use the pattern timeout, not default
+            if sequence.is_expired(0.1, now=start_time + 0.2):  # Use the pattern timeout, not default
                 expired_calls.append(call_id_check)
         
         for expired_call_id in expired_calls:
@@ -829,6 +884,71 @@ class TestMusicOnHoldManager:
         assert "active_players" in stats
         assert "playback_task_running" in stats
 
+    @pytest.mark.asyncio
+    async def test_concurrent_holds_share_source_audio(self, music_manager, temp_audio_file):
+        """Test that players of the same source share one loaded buffer."""
+        from src.dtmf.music_on_hold import MusicSourceType
+
+        music_manager.add_music_source(
+            MusicSource(name="file_music", source_type=MusicSourceType.FILE, path=temp_audio_file)
+        )
+
+        call_ids = ["hold-1", "hold-2", "hold-3"]
+        for call_id in call_ids:
+            assert await music_manager.start_hold_music(call_id, "file_music") is True
+
+        buffers = {id(music_manager.players[call_id].audio_data) for call_id in call_ids}
+        assert len(buffers) == 1
+        assert music_manager.players["hold-1"].audio_data
+
+        for call_id in call_ids:
+            assert await music_manager.stop_hold_music(call_id) is True
+
+    @pytest.mark.asyncio
+    async def test_failed_source_load_not_cached(self, music_manager, tmp_path):
+        """Test a failed load plays the fallback tone without caching it for the source."""
+        from src.dtmf.music_on_hold import MusicSourceType
+
+        missing = tmp_path / "missing.wav"
+        music_manager.add_music_source(
+            MusicSource(name="file_music", source_type=MusicSourceType.FILE, path=str(missing))
+        )
+
+        assert await music_manager.start_hold_music("hold-1", "file_music") is True
+        assert music_manager.players["hold-1"].audio_data  # Fallback ring tone
+        assert "file_music" not in music_manager._source_audio
+
+        await music_manager.stop_hold_music("hold-1")
+
+    def test_generate_tone_matches_sine(self):
+        """Test table-driven tone generation against a directly computed sine."""
+        tone = np.frombuffer(AudioGenerator.generate_tone(440, 0.5), dtype='<i2')
+
+        t = np.arange(4000) / 8000
+        expected = (0.3 * np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16)
+
+        assert len(tone) == 4000
+        assert np.abs(tone.astype(int) - expected.astype(int)).max() <= 1
+
+        # Non-integer frequencies take the direct path
+        assert len(AudioGenerator.generate_tone(441.5, 0.1)) == 1600
+
+    def test_generated_audio_is_memoized(self):
+        """Test that identical generator requests share one buffer."""
+        assert AudioGenerator.generate_tone(800, 1.0) is AudioGenerator.generate_tone(800, 1.0)
+        assert AudioGenerator.generate_ring_tone(6.0) is AudioGenerator.generate_ring_tone(6.0)
+
+    def test_ring_tone_length_for_partial_cycles(self):
+        """Test ring tones cover exactly the requested duration, ring then silence."""
+        for duration in (1.5, 3.3, 6.0, 7.25):
+            audio = np.frombuffer(AudioGenerator.generate_ring_tone(duration), dtype='<i2')
+            assert len(audio) == int(duration * 8000)
+
+        # 3.3 s: 2 s of ring followed by a truncated silence
+        audio = np.frombuffer(AudioGenerator.generate_ring_tone(3.3), dtype='<i2')
+        assert np.any(audio[:16000])
+        assert not np.any(audio[16000:])
+
 
 # Complex DTMF integration tests commented out - require full implementations
 # class TestDTMFIntegration:
@@ -0,0 +1,88 @@
+"""
+Unit tests for the custom RTP bridge.
+Tests the RTPproxy control protocol and RTP forwarding over real UDP sockets.
+"""
+import pytest
+import asyncio
+import socket
+import struct
+from unittest.mock import AsyncMock
+
+from src.media.rtp_bridge import RTPproxy
+
+
+async def _wait_until(predicate, timeout: float = 1.0):
+    """Poll a condition set by the event loop, failing after timeout."""
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    assert predicate()
+
+
+def _free_udp_port() -> int:
+    """Reserve and release an ephemeral UDP port on localhost."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _control_and_forward_flow():
+    """Drive one session through V/U/D commands and forward RTP both ways."""
+    loop = asyncio.get_running_loop()
+    proxy = RTPproxy(control_socket_addr="127.0.0.1", control_port=_free_udp_port())
+    proxy.running = True
+    control_task = asyncio.create_task(proxy.start_control_server())
+
+    caller_port = _free_udp_port()
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as client, \
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as caller:
+        client.setblocking(False)
+        client.connect(("127.0.0.1", proxy.control_port))
+        caller.setblocking(False)
+        caller.bind(("127.0.0.1", caller_port))
+
+        async def command(text: bytes) -> str:
+            await loop.sock_sendall(client, text)
+            return (await asyncio.wait_for(loop.sock_recv(client, 1024), 1.0)).decode()
+
+        await _wait_until(lambda: proxy.control_transport is not None)
+
+        assert await command(b"V") == "20040107"
+        assert await command(b"\xff\xfe") == "E1"
+
+        rtp_port = int(await command(f"ck1 U call1 127.0.0.1 {caller_port}".encode()))
+        session = next(iter(proxy.sessions.values()))
+        session.ai_websocket = AsyncMock()
+        await _wait_until(lambda: rtp_port in proxy.rtp_transports)
+
+        packet = struct.pack('!BBHII', 0x80, 0, 7, 160, 1) + b"\xff" * 160
+        for _ in range(3):
+            caller.sendto(packet, ("127.0.0.1", rtp_port))
+        await _wait_until(lambda: session.ai_websocket.send.await_count == 3)
+
+        await proxy.send_rtp_to_caller(session, b"\x00" * 160)
+        reply = await asyncio.wait_for(loop.sock_recv(caller, 2048), 1.0)
+        assert len(reply) == 12 + 160
+
+        assert await command(b"ck1 D call1") == "0"
+        await asyncio.sleep(0)
+        assert not proxy.rtp_transports
+        assert not proxy.reader_tasks
+
+    proxy.control_transport.close()
+    await asyncio.wait_for(control_task, 1.0)
+
+
+class TestRTPproxy:
+    """Test RTPproxy control protocol and media forwarding."""
+
+    def test_control_and_forwarding_default_loop(self):
+        """Test the control server and RTP forwarding on the default event loop."""
+        asyncio.run(_control_and_forward_flow())
+
+    def test_control_and_forwarding_uvloop(self):
+        """Test the same flow under uvloop, which the bridge entry point installs."""
+        uvloop = pytest.importorskip("uvloop")
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(_control_and_forward_flow())
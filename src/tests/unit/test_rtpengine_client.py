@@ -0,0 +1,93 @@
+"""
+Unit tests for the RTPEngine ng protocol client.
+Tests request/reply matching against a fake RTPEngine on a local UDP socket.
+"""
+import pytest
+import pytest_asyncio
+import asyncio
+
+bencodepy = pytest.importorskip("bencodepy")
+
+from src.media.rtpengine_client import RTPEngineClient
+
+
+class FakeRTPEngine(asyncio.DatagramProtocol):
+    """Answers ping at once and holds queries until released, replying in reverse order."""
+
+    def __init__(self):
+        self.transport = None
+        self.held = []
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        cookie, _, payload = data.partition(b" ")
+        request = bencodepy.decode(payload)
+        if request[b"command"] == b"ping":
+            self.reply(cookie, {"result": "pong"}, addr)
+        else:
+            self.held.append((cookie, request, addr))
+
+    def reply(self, cookie, response, addr):
+        self.transport.sendto(cookie + b" " + bencodepy.encode(response), addr)
+
+    def release(self):
+        for cookie, request, addr in reversed(self.held):
+            self.reply(cookie, {"result": "ok", "call-id": request[b"call-id"]}, addr)
+        self.held.clear()
+
+
+@pytest_asyncio.fixture
+async def rtpengine():
+    """Start a fake RTPEngine and a client connected to it."""
+    loop = asyncio.get_running_loop()
+    transport, server = await loop.create_datagram_endpoint(FakeRTPEngine, local_addr=("127.0.0.1", 0))
+    client = RTPEngineClient(host="127.0.0.1", port=transport.get_extra_info("sockname")[1], timeout=0.5)
+    await client.start()
+    yield client, server
+    await client.stop()
+    transport.close()
+
+
+async def _wait_for_held(server, count):
+    for _ in range(100):
+        if len(server.held) == count:
+            return
+        await asyncio.sleep(0.01)
+    assert len(server.held) == count
+
+
+class TestRTPEngineClient:
+    """Test concurrent ng requests over the shared control socket."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_matched_by_cookie(self, rtpengine):
+        """Test replies arriving out of order reach the request that sent them."""
+        client, server = rtpengine
+
+        first = asyncio.create_task(client.query_session("call-1", "tag"))
+        second = asyncio.create_task(client.query_session("call-2", "tag"))
+        await _wait_for_held(server, 2)
+
+        # A reply with an unknown cookie is ignored
+        server.reply(b"stale", {"result": "ok", "call-id": "call-x"}, server.held[0][2])
+        server.release()
+
+        assert (await first)["call-id"] == "call-1"
+        assert (await second)["call-id"] == "call-2"
+        assert not client.protocol.pending
+
+    @pytest.mark.asyncio
+    async def test_late_reply_after_timeout_is_discarded(self, rtpengine):
+        """Test a timed-out request does not hand its late reply to the next one."""
+        client, server = rtpengine
+
+        assert await client.query_session("call-slow", "tag") is None
+        await _wait_for_held(server, 1)
+
+        pending = asyncio.create_task(client.query_session("call-next", "tag"))
+        await _wait_for_held(server, 2)
+        server.release()
+
+        assert (await pending)["call-id"] == "call-next"
@@ -14,7 +14,7 @@ from datetime import datetime, timedelta, timezone
 from src.sms.sms_manager import SMSManager, SMSMessage, SMSStatus, SMSDirection
 from src.sms.sms_processor import SMSProcessor, SMSProcessingRule, SMSProcessingAction, SMSProcessingResult
 from src.sms.sms_queue import SMSQueue, QueuedSMSItem, SMSQueuePriority
-from src.sms.sip_message_handler import SIPMessageHandler
+from src.sms.sip_message_handler import SIPMessageHandler, _format_rpc_headers
 from src.sms.sip_message_integration import SIPMessageIntegration
 
 
@@ -287,7 +287,20 @@ class TestSMSQueue:
         import asyncio
         result = asyncio.run(sms_queue.enqueue(overflow_message))
         assert result is False
-    
+
+    def test_global_throttle_window(self, sms_queue):
+        """Test global throttle only counts sends inside the window."""
+        sms_queue.global_rate_limit = 2
+        now = time.time()
+        sms_queue.last_send_times.extend([now - 120, now - 90, now - 1])
+
+        # Two sends are older than the 60s window and get dropped
+        assert sms_queue._check_global_throttle() is True
+        assert list(sms_queue.last_send_times) == [now - 1]
+
+        sms_queue._update_global_throttle()
+        assert sms_queue._check_global_throttle() is False
+
     def test_queue_statistics(self, sms_queue):
         """Test queue statistics generation."""
         # Add messages with different priorities
@@ -472,6 +485,21 @@ class TestSMSProcessor:
         assert stats["filtered_messages"] == 10
         assert stats["success_rate"] == 0.95
 
+    @pytest.mark.asyncio
+    async def test_time_restrictions(self, sms_processor):
+        """Test rule day and time-of-day restrictions."""
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2024, 1, 3, 23, 30)  # A Wednesday night
+
+        with patch("src.sms.sms_processor.datetime", FixedDatetime):
+            assert sms_processor._check_time_restrictions({"days": ["Monday", "Wednesday"]})
+            assert not sms_processor._check_time_restrictions({"days": ["saturday", "sunday"]})
+            assert sms_processor._check_time_restrictions({"start_time": "22:00", "end_time": "06:00"})
+            assert not sms_processor._check_time_restrictions({"start_time": "09:00", "end_time": "17:00"})
+            assert not sms_processor._check_time_restrictions({"start_time": "9am", "end_time": "17:00"})
+
 
 class TestSIPMessageHandler:
     """Test SIP MESSAGE protocol handler."""
@@ -484,7 +512,39 @@ class TestSIPMessageHandler:
     def sip_message_handler(self):
         """Create test SIP message handler."""
         return SIPMessageHandler()
-    
+
+    def test_delivery_report_message_id_extraction(self, sip_message_handler):
+        """Test message ID lookup in delivery report headers and body."""
+        extract = sip_message_handler._extract_original_message_id
+
+        assert extract({"headers": {"X-SMS-ID": "abc-123"}}) == "abc-123"
+        assert extract({"body": "Status: ok\nSMS-ID: dead-beef"}) == "dead-beef"
+        # Message-ID takes precedence over the other markers
+        assert extract({"body": "SMS-ID: 111\nMessage-ID: 222"}) == "222"
+        assert extract({"body": "no identifier here"}) is None
+
+    def test_rpc_headers_escape_line_breaks(self):
+        """Test header values cannot break out into extra SIP headers."""
+        headers_str = _format_rpc_headers({
+            "Content-Type": "text/plain",
+            "X-Note": "hi\r\nX-Injected: 1",
+        })
+
+        assert headers_str == "Content-Type: text/plain\\r\\nX-Note: hi  X-Injected: 1\\r\\n"
+
+    def test_rpc_headers_escape_escaped_line_breaks_and_names(self):
+        """Test escaped CRLF text in values and invalid header names cannot add headers."""
+        headers_str = _format_rpc_headers({
+            "X-Note": "hi\\r\\nX-Injected: 1",
+            "X-Evil: 1\r\nX-Other": "v",
+            "X-Path": "C:\\tmp",
+        })
+
+        assert headers_str == "X-Note: hi\\\\r\\\\nX-Injected: 1\\r\\nX-Path: C:\\\\tmp\\r\\n"
+        # Once Kamailio unescapes the string only the two intended header lines remain
+        unescaped = headers_str.encode().decode("unicode_escape")
+        assert unescaped.split("\r\n") == ["X-Note: hi\\r\\nX-Injected: 1", "X-Path: C:\\tmp", ""]
+
     # def test_sip_message_parsing(self, sip_message_handler):
     #     """Test parsing SIP MESSAGE."""
     #     sip_message = """MESSAGE sip:+10987654321@example.com SIP/2.0
@@ -703,7 +763,71 @@ class TestSMSManager:
         assert result["success"] is True
         assert "message_id" in result
         assert result["status"] == "queued"
-    
+
+    @pytest.mark.asyncio
+    async def test_queued_sends_bounded_concurrency(self, sms_manager, sample_sms_data):
+        """Test queued messages are sent concurrently up to the configured limit."""
+        in_flight = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def send_sip_message(sip_data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return {"success": True}
+
+        await sms_manager.stop_processing()
+        sms_manager.kamailio_integration = MagicMock(send_sip_message=send_sip_message)
+        sms_manager.max_concurrent_messages = 2
+
+        for _ in range(4):
+            await sms_manager.send_sms(
+                from_number=sample_sms_data["from_number"],
+                to_number=sample_sms_data["to_number"],
+                message=sample_sms_data["message"]
+            )
+        sms_manager.start_processing()
+
+        for _ in range(50):
+            if peak == 2:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+
+        assert peak == 2
+        release.set()
+        await sms_manager.stop_processing()
+
+    @pytest.mark.asyncio
+    async def test_stop_while_waiting_for_send_slot_keeps_message_queued(self, sms_manager, sample_sms_data):
+        """Test a processor stopped while all send slots are busy does not lose the next message."""
+        started = asyncio.Event()
+
+        async def send_sip_message(sip_data):
+            started.set()
+            await asyncio.Event().wait()
+
+        await sms_manager.stop_processing()
+        sms_manager.kamailio_integration = MagicMock(send_sip_message=send_sip_message)
+        sms_manager.max_concurrent_messages = 1
+
+        for _ in range(2):
+            await sms_manager.send_sms(
+                from_number=sample_sms_data["from_number"],
+                to_number=sample_sms_data["to_number"],
+                message=sample_sms_data["message"]
+            )
+        sms_manager.start_processing()
+
+        await asyncio.wait_for(started.wait(), 1.0)
+        await asyncio.sleep(0.05)
+        await sms_manager.stop_processing()
+
+        assert sms_manager.sms_queue.size() == 1
+
     @pytest.mark.asyncio
     async def test_receive_sms(self, sms_manager, sample_sms_data):
         """Test receiving SMS through manager."""
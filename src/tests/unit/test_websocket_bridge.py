@@ -18,15 +18,18 @@ import asyncio
 import json
 import time
 import base64
+import zlib
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any
 import websockets
 from websockets.legacy.client import WebSocketClientProtocol
 from websockets.legacy.server import WebSocketServerProtocol
+from websockets.frames import Opcode
 
-from src.websocket.bridge import (
-    WebSocketBridge, CallInfo, CallState, MessageType, AudioBuffer, ConnectionManager
-)
+from src.websocket.bridge import WebSocketBridge, MessageType, ConnectionManager, AUDIO_BATCH_MAX_FRAMES
+from src.websocket.frames import AUDIO_FRAME_HEADER, AUDIO_FRAME_VERSION, AUDIO_FRAME_TYPE_AUDIO
+from src.websocket.models import AudioBuffer, CallInfo, CallState
+from src.websocket.bridge_handlers import _RtpInbox, STALE_CALL_TIMEOUT
 from src.audio.rtp import RTPSession, RTPStatistics
 
 
@@ -156,10 +159,87 @@ class TestAudioBuffer:
         audio_buffer.clear()
         
         assert len(audio_buffer.frames) == 0
-        assert len(audio_buffer.frame_times) == 0
         assert audio_buffer.total_bytes == 0
         assert audio_buffer.get_buffer_level() == 0.0
 
+    
+    def test_adaptive_target_delay_follows_jitter(self):
+        """Test target delay adapts to the observed inter-arrival jitter."""
+        audio_buffer = AudioBuffer(max_frames=5, target_delay_ms=60, adapt_interval=10)
+        
+        # Frames alternately 0 ms and 40 ms apart: 20 ms deviation from the 20 ms spacing
+        arrivals, now = [], 0
+        for i in range(21):
+            arrivals.append(now)
+            now += 40_000_000 if i % 2 else 0
+        
+        with patch('src.websocket.bridge.time.monotonic_ns', side_effect=arrivals):
+            for _ in arrivals:
+                audio_buffer.add_frame(b"\x00" * 320)
+        
+        stats = audio_buffer.get_statistics()
+        assert stats["target_delay_ms"] == pytest.approx(30.0)
+        assert audio_buffer.target_delay_ms == 30
+        assert stats["jitter_ms"] > 0
+        assert stats["buffered_frames"] == audio_buffer.max_frames
+    
+    def test_adaptive_target_delay_is_clamped(self):
+        """Test target delay never drops below the configured minimum."""
+        audio_buffer = AudioBuffer(max_frames=5, target_delay_ms=60, adapt_interval=10)
+        
+        arrivals = [i * 20_000_000 for i in range(11)]
+        with patch('src.websocket.bridge.time.monotonic_ns', side_effect=arrivals):
+            for _ in arrivals:
+                audio_buffer.add_frame(b"\x00" * 320)
+        
+        assert audio_buffer.get_statistics()["jitter_ms"] == 0
+        assert audio_buffer.target_delay_ms == 20
+    
+    def test_frames_reordered_by_sequence(self, audio_buffer):
+        """Test out-of-order frames are played in sequence order."""
+        for sequence in (3, 1, 2):
+            audio_buffer.add_frame(bytes([sequence]), sequence=sequence)
+        audio_buffer.target_delay_ns = 0
+        
+        assert [audio_buffer.get_frame() for _ in range(3)] == [b"\x01", b"\x02", b"\x03"]
+        assert audio_buffer.get_frame() is None
+    
+    def test_duplicate_and_late_frames_dropped(self, audio_buffer):
+        """Test duplicates and frames behind the playout point are discarded."""
+        audio_buffer.target_delay_ns = 0
+        audio_buffer.add_frame(b"a", sequence=10)
+        audio_buffer.add_frame(b"a", sequence=10)
+        assert len(audio_buffer.frames) == 1
+        
+        assert audio_buffer.get_frame() == b"a"
+        audio_buffer.add_frame(b"late", sequence=9)
+        
+        assert len(audio_buffer.frames) == 0
+        assert audio_buffer.get_statistics()["dropped_frames"] == 2
+    
+    def test_late_frame_dropped_after_overflow_eviction(self):
+        """Test a late frame is not queued behind a playout point moved by eviction."""
+        audio_buffer = AudioBuffer(max_frames=3, target_delay_ms=60)
+        for sequence in (10, 11, 12):
+            audio_buffer.add_frame(bytes([sequence]), sequence=sequence)
+        
+        # Full buffer: evicting 10 skips its slot, so 9 is now behind the playout point
+        audio_buffer.add_frame(b"\x09", sequence=9)
+        
+        assert sorted(sequence for sequence, _, _ in audio_buffer.frames) == [11, 12]
+        assert audio_buffer.dropped_frames == 1
+        audio_buffer.target_delay_ns = 0
+        assert audio_buffer.get_frame() == bytes([11])
+    
+    def test_sequence_wraparound(self, audio_buffer):
+        """Test ordering across the 16-bit sequence wrap."""
+        audio_buffer.target_delay_ns = 0
+        for sequence in (65534, 0, 65535, 1):
+            audio_buffer.add_frame(sequence.to_bytes(2, "big"), sequence=sequence)
+        
+        played = [int.from_bytes(audio_buffer.get_frame(), "big") for _ in range(4)]
+        assert played == [65534, 65535, 0, 1]
+
 
 class TestConnectionManager:
     """Test ConnectionManager functionality."""
@@ -226,6 +306,56 @@ class TestConnectionManager:
                 assert connection is None
                 assert connection_manager.retry_counts["test-call-456"] == connection_manager.max_retries
     
+    @pytest.mark.asyncio
+    async def test_connect_for_call_backoff_is_capped(self, connection_manager):
+        """Test retry delays grow exponentially with jitter and respect the cap."""
+        call_info = CallInfo(
+            call_id="test-call-backoff",
+            from_number="+12345678901",
+            to_number="+10987654321",
+            sip_headers={}
+        )
+        connection_manager.max_retries = 5
+        connection_manager.max_delay = 5.0
+        
+        with patch('src.websocket.bridge.websockets.connect', side_effect=ConnectionError("Connection failed")):
+            with patch('src.websocket.bridge.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+                assert await connection_manager.connect_for_call("test-call-backoff", call_info) is None
+        
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == connection_manager.max_retries - 1
+        for attempt, delay in enumerate(delays):
+            base = connection_manager.base_delay * 2 ** attempt
+            assert min(base, 5.0) <= delay <= min(base * 1.5, 5.0)
+    
+    @pytest.mark.asyncio
+    async def test_connect_for_call_invalid_uri_fails_fast(self, connection_manager):
+        """Test unrecoverable errors are not retried."""
+        call_info = CallInfo(
+            call_id="test-call-bad-uri",
+            from_number="+12345678901",
+            to_number="+10987654321",
+            sip_headers={}
+        )
+        error = websockets.exceptions.InvalidURI("bad://uri", "unsupported scheme")
+        
+        with patch('src.websocket.bridge.websockets.connect', side_effect=error) as mock_connect:
+            with patch('src.websocket.bridge.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+                assert await connection_manager.connect_for_call("test-call-bad-uri", call_info) is None
+        
+        assert mock_connect.call_count == 1
+        mock_sleep.assert_not_called()
+    
+    def test_compression_options(self, connection_manager):
+        """Test deflate is only negotiated for the JSON audio transport."""
+        assert connection_manager._compression_options()["compression"] is None
+        assert "extensions" not in connection_manager._compression_options()
+        
+        connection_manager.binary_audio = False
+        extensions = connection_manager._compression_options()["extensions"]
+        assert len(extensions) == 1
+        assert extensions[0].name == "permessage-deflate"
+    
     @pytest.mark.asyncio
     async def test_disconnect_call(self, connection_manager):
         """Test disconnecting call."""
@@ -248,10 +378,27 @@ class TestConnectionManager:
         # Verify connection was closed and cleaned up
         mock_connection.close.assert_called_once()
         assert call_id not in connection_manager.connections
-    
+
+    @pytest.mark.asyncio
+    async def test_dtmf_before_hangup_is_flushed(self, connection_manager):
+        """Test control messages still queued at disconnect are sent before call_end."""
+        call_id = "test-call-dtmf-hangup"
+        mock_connection = FakeAIConnection()
+        connection_manager.connections[call_id] = mock_connection
+
+        await connection_manager.send_audio(call_id, b"\x01" * 320)
+        await connection_manager.send_control(call_id, {"type": "dtmf", "data": {"digit": "#"}})
+        await connection_manager.disconnect_call(call_id)
+
+        sent = [call.args[0] for call in mock_connection.send.call_args_list]
+        assert len(sent) == 3
+        assert sent[0][AUDIO_FRAME_HEADER.size:] == b"\x01" * 320
+        assert [json.loads(message)["type"] for message in sent[1:]] == ["dtmf", MessageType.CALL_END.value]
+        assert call_id not in connection_manager._sender_tasks
+
     @pytest.mark.asyncio
     async def test_send_audio(self, connection_manager, sample_audio_data):
-        """Test sending audio data."""
+        """Test sending audio data as a binary frame."""
         call_id = "test-call-audio"
         
         # Mock connection
@@ -262,6 +409,36 @@ class TestConnectionManager:
         
         audio_data = sample_audio_data["pcm"]
         result = await connection_manager.send_audio(call_id, audio_data)
+        await asyncio.sleep(0.01)  # Let the sender task drain the queue
+        
+        assert result is True
+        mock_connection.send.assert_called_once()
+        
+        frame = mock_connection.send.call_args[0][0]
+        assert isinstance(frame, bytes)
+        version, frame_type, _, call_hash, timestamp_ns = AUDIO_FRAME_HEADER.unpack_from(frame)
+        assert version == AUDIO_FRAME_VERSION
+        assert frame_type == AUDIO_FRAME_TYPE_AUDIO
+        assert call_hash == zlib.crc32(call_id.encode())
+        assert timestamp_ns > 0
+        assert frame[AUDIO_FRAME_HEADER.size:] == audio_data
+        
+        await connection_manager.disconnect_call(call_id)
+    
+    @pytest.mark.asyncio
+    async def test_send_audio_json_transport(self, connection_manager, sample_audio_data):
+        """Test sending audio data as base64 JSON."""
+        call_id = "test-call-audio-json"
+        connection_manager.binary_audio = False
+        
+        mock_connection = AsyncMock(spec=WebSocketClientProtocol)
+        mock_connection.send = AsyncMock()
+        
+        connection_manager.connections[call_id] = mock_connection
+        
+        audio_data = sample_audio_data["pcm"]
+        result = await connection_manager.send_audio(call_id, audio_data)
+        await asyncio.sleep(0.01)
         
         assert result is True
         mock_connection.send.assert_called_once()
@@ -275,6 +452,169 @@ class TestConnectionManager:
         # Verify audio is base64 encoded
         decoded_audio = base64.b64decode(sent_message["data"]["audio"])
         assert decoded_audio == audio_data
+        
+        await connection_manager.disconnect_call(call_id)
+    
+    @pytest.mark.asyncio
+    async def test_send_audio_batches_queued_frames(self, connection_manager):
+        """Test frames queued within one tick are sent as a single batch."""
+        call_id = "test-call-batch"
+        connection_manager.binary_audio = False
+        
+        mock_connection = AsyncMock(spec=WebSocketClientProtocol)
+        mock_connection.send = AsyncMock()
+        
+        connection_manager.connections[call_id] = mock_connection
+        
+        frames = [bytes([i]) * 320 for i in range(3)]
+        for frame in frames:
+            assert await connection_manager.send_audio(call_id, frame) is True
+        await asyncio.sleep(0.01)
+        
+        mock_connection.send.assert_called_once()
+        sent_message = json.loads(mock_connection.send.call_args[0][0])
+        assert sent_message["type"] == MessageType.AUDIO_DATA_BATCH.value
+        assert sent_message["data"]["call_id"] == call_id
+        assert [base64.b64decode(chunk) for chunk in sent_message["data"]["chunks"]] == frames
+        
+        await connection_manager.disconnect_call(call_id)
+    
+    @pytest.mark.asyncio
+    async def test_send_audio_binary_batch_is_coalesced(self, connection_manager):
+        """Test batched binary frames share one header and a contiguous payload."""
+        call_id = "test-call-binary-batch"
+        
+        mock_connection = AsyncMock(spec=WebSocketClientProtocol)
+        mock_connection.send = AsyncMock()
+        
+        connection_manager.connections[call_id] = mock_connection
+        
+        frames = [bytes([i]) * 320 for i in range(3)]
+        for frame in frames:
+            await connection_manager.send_audio(call_id, frame)
+        await asyncio.sleep(0.01)
+        
+        mock_connection.send.assert_called_once()
+        frame = mock_connection.send.call_args[0][0]
+        assert frame[AUDIO_FRAME_HEADER.size:] == b"".join(frames)
+        
+        await connection_manager.disconnect_call(call_id)
+    
+    @pytest.mark.asyncio
+    async def test_binary_frame_sequence_increments(self, connection_manager):
+        """Test each binary frame carries the next per-call sequence number."""
+        call_id = "test-call-sequence"
+        
+        mock_connection = AsyncMock(spec=WebSocketClientProtocol)
+        connection_manager.connections[call_id] = mock_connection
+        
+        for _ in range(3):
+            await connection_manager.send_audio(call_id, b"\x00" * 320)
+            await asyncio.sleep(0.01)
+        
+        sequences = [AUDIO_FRAME_HEADER.unpack_from(call.args[0])[2]
+                     for call in mock_connection.send.call_args_list]
+        assert sequences == [0, 1, 2]
+        
+        await connection_manager.disconnect_call(call_id)
+    
+    @pytest.mark.asyncio
+    async def test_send_queue_drops_oldest_when_full(self, connection_manager):
+        """Test a stalled AI connection drops the oldest queued frames instead of blocking."""
+        call_id = "test-call-backpressure"
+        connection_manager.send_queue_size = 3
+        
+        mock_connection = AsyncMock(spec=WebSocketClientProtocol)
+        connection_manager.connections[call_id] = mock_connection
+        
+        frames = [bytes([i]) * 320 for i in range(5)]
+        for frame in frames:
+            assert await connection_manager.send_audio(call_id, frame) is True
+        
+        assert connection_manager.dropped_oldest == 2
+        await asyncio.sleep(0.01)
+        
+        mock_connection.send.assert_called_once()
+        assert mock_connection.send.call_args[0][0][AUDIO_FRAME_HEADER.size:] == b"".join(frames[2:])
+
+        await connection_manager.disconnect_call(call_id)
+
+    @pytest.mark.asyncio
+    async def test_send_queue_never_drops_control_messages(self, connection_manager):
+        """Test a full send queue evicts only audio, keeping control messages in order."""
+        call_id = "test-call-backpressure-control"
+        connection_manager.send_queue_size = 3
+        connection_manager.connections[call_id] = AsyncMock(spec=WebSocketClientProtocol)
+
+        dtmf = {"type": "dtmf", "digit": "5"}
+        hangup = {"type": "hangup"}
+        assert await connection_manager.send_control(call_id, dtmf) is True
+        assert await connection_manager.send_audio(call_id, b"a" * 320) is True
+        assert await connection_manager.send_audio(call_id, b"b" * 320) is True
+        assert await connection_manager.send_control(call_id, hangup) is True
+
+        # Queue only holds control messages now: new audio is dropped, control is rejected
+        assert await connection_manager.send_control(call_id, dtmf) is True
+        assert await connection_manager.send_audio(call_id, b"c" * 320) is True
+        assert await connection_manager.send_control(call_id, hangup) is False
+
+        queue = connection_manager._send_queues[call_id]
+        queued = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert queued == [connection_manager._encode_control(call_id, dtmf),
+                          connection_manager._encode_control(call_id, hangup),
+                          connection_manager._encode_control(call_id, dtmf)]
+        assert connection_manager.dropped_oldest == 2
+        assert connection_manager.dropped_incoming == 1
+
+        await connection_manager.disconnect_call(call_id)
+    
+    @pytest.mark.asyncio
+    async def test_msgpack_control_messages_when_negotiated(self, connection_manager):
+        """Test control messages use msgpack once the AI platform accepts it."""
+        msgpack = pytest.importorskip("msgpack")
+        call_id = "test-call-msgpack"
+        call_info = CallInfo(call_id=call_id, from_number="+1", to_number="+2", sip_headers={})
+        
+        mock_connection = AsyncMock(spec=WebSocketClientProtocol)
+        mock_connection.response_headers = {"X-Codec": "msgpack"}
+        
+        async def mock_connect(*args, **kwargs):
+            assert kwargs["extra_headers"]["X-Codec"] == "msgpack"
+            return mock_connection
+        
+        with patch('src.websocket.bridge.websockets.connect', side_effect=mock_connect):
+            await connection_manager.connect_for_call(call_id, call_info)
+        
+        auth_message = msgpack.unpackb(mock_connection.send.call_args[0][0])
+        assert auth_message["type"] == "auth"
+        
+        await connection_manager.send_control(call_id, {"type": "dtmf", "data": {"digit": "7"}})
+        await asyncio.sleep(0.01)
+        assert msgpack.unpackb(mock_connection.send.call_args[0][0])["data"]["digit"] == "7"
+        
+        await connection_manager.disconnect_call(call_id)
+        assert msgpack.unpackb(mock_connection.send.call_args[0][0])["type"] == "call_end"
+    
+    @pytest.mark.asyncio
+    async def test_control_and_audio_flushed_together(self, connection_manager):
+        """Test queued control messages and audio are written with a single drain."""
+        call_id = "test-call-flush"
+        
+        mock_connection = AsyncMock(spec=WebSocketClientProtocol)
+        connection_manager.connections[call_id] = mock_connection
+        
+        await connection_manager.send_audio(call_id, b"\x01" * 320)
+        await connection_manager.send_control(call_id, {"type": "dtmf", "data": {"call_id": call_id, "digit": "5"}})
+        await connection_manager.send_audio(call_id, b"\x02" * 320)
+        await asyncio.sleep(0.01)
+        
+        mock_connection.send.assert_not_called()
+        frames = [call.args for call in mock_connection.write_frame_sync.call_args_list]
+        assert [opcode for _, opcode, _ in frames] == [Opcode.BINARY, Opcode.TEXT, Opcode.BINARY]
+        assert json.loads(frames[1][2])["data"]["digit"] == "5"
+        mock_connection.drain.assert_awaited_once()
+        
+        await connection_manager.disconnect_call(call_id)
     
     @pytest.mark.asyncio
     async def test_send_audio_no_connection(self, connection_manager, sample_audio_data):
@@ -293,6 +633,102 @@ class TestConnectionManager:
         assert connection_manager.get_connection("non-existent") is None
 
 
+class FakeAIConnection:
+    """Minimal AI platform connection fed from a queue."""
+    
+    def __init__(self):
+        self.send = AsyncMock()
+        self.close = AsyncMock()
+        self.incoming = asyncio.Queue()
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        message = await self.incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class TestConnectionPool:
+    """Test multiplexing calls over shared AI platform connections."""
+    
+    @pytest.fixture
+    def pooled_manager(self):
+        """Create connection manager with a single shared connection."""
+        return ConnectionManager("ws://localhost:8082/ws", max_retries=1, pool_size=1)
+    
+    @staticmethod
+    def _call_info(call_id):
+        return CallInfo(call_id=call_id, from_number="+12345678901", to_number="+10987654321", sip_headers={})
+    
+    @pytest.mark.asyncio
+    async def test_calls_share_connection(self, pooled_manager):
+        """Test several calls are carried by one upstream connection."""
+        shared = FakeAIConnection()
+        
+        with patch('src.websocket.bridge.websockets.connect', new_callable=AsyncMock, return_value=shared) as mock_connect:
+            first = await pooled_manager.connect_for_call("call-a", self._call_info("call-a"))
+            second = await pooled_manager.connect_for_call("call-b", self._call_info("call-b"))
+        
+        assert first is shared and second is shared
+        assert mock_connect.call_count == 1
+        assert shared.send.call_count == 2  # One auth message per call
+        
+        await pooled_manager.disconnect_call("call-a")
+        shared.close.assert_not_called()
+        
+        await pooled_manager.disconnect_call("call-b")
+        await pooled_manager.close()
+        shared.close.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_incoming_messages_routed_by_call(self, pooled_manager):
+        """Test JSON and binary messages reach the call they belong to."""
+        shared = FakeAIConnection()
+        
+        with patch('src.websocket.bridge.websockets.connect', new_callable=AsyncMock, return_value=shared):
+            await pooled_manager.connect_for_call("call-a", self._call_info("call-a"))
+            await pooled_manager.connect_for_call("call-b", self._call_info("call-b"))
+        
+        header = AUDIO_FRAME_HEADER.pack(AUDIO_FRAME_VERSION, AUDIO_FRAME_TYPE_AUDIO, 0,
+                                         zlib.crc32(b"call-b"), 0)
+        shared.incoming.put_nowait(json.dumps({"type": "hangup", "call_id": "call-a"}))
+        shared.incoming.put_nowait(header + b"pcm")
+        
+        received_a = pooled_manager.iter_messages("call-a")
+        received_b = pooled_manager.iter_messages("call-b")
+        assert json.loads(await received_a.__anext__())["type"] == "hangup"
+        assert await received_b.__anext__() == b"pcm"
+        
+        # Disconnecting ends the call's message stream
+        await pooled_manager.disconnect_call("call-a")
+        with pytest.raises(StopAsyncIteration):
+            await received_a.__anext__()
+        
+        await pooled_manager.disconnect_call("call-b")
+        await pooled_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_unroutable_json_does_not_end_shared_reader(self, pooled_manager):
+        """Test JSON that is not a routable object is skipped without closing the connection."""
+        shared = FakeAIConnection()
+
+        with patch('src.websocket.bridge.websockets.connect', new_callable=AsyncMock, return_value=shared):
+            await pooled_manager.connect_for_call("call-a", self._call_info("call-a"))
+
+        for message in ('["keepalive"]', '"ping"', '{"type": "x", "data": []}', '{"call_id": ["call-a"]}'):
+            shared.incoming.put_nowait(message)
+        shared.incoming.put_nowait(json.dumps({"type": "hangup", "data": {"call_id": "call-a"}}))
+
+        received_a = pooled_manager.iter_messages("call-a")
+        assert json.loads(await asyncio.wait_for(received_a.__anext__(), 1.0))["type"] == "hangup"
+        assert not pooled_manager._demux_tasks[0].done()
+
+        await pooled_manager.disconnect_call("call-a")
+        await pooled_manager.close()
+
 class TestWebSocketBridge:
     """Test WebSocketBridge main functionality."""
     
@@ -358,6 +794,170 @@ class TestWebSocketBridge:
             
             assert call_id not in websocket_bridge.active_calls
     
+    def test_expired_calls_popped_from_heap(self, websocket_bridge):
+        """Test stale calls are found by deadline and ended calls are skipped."""
+        wall_now = time.time()
+        for call_id, age in (("old-call", 5 * 3600), ("ended-call", 6 * 3600), ("new-call", 60)):
+            call_info = CallInfo(call_id=call_id, from_number="+1", to_number="+2",
+                                 sip_headers={}, start_time=wall_now - age)
+            websocket_bridge.active_calls[call_id] = call_info
+            websocket_bridge._track_call_expiry(call_id, call_info)
+        websocket_bridge.active_calls.pop("ended-call")
+        websocket_bridge._expiry_deadlines.pop("ended-call")
+        
+        now = time.monotonic()
+        assert websocket_bridge._pop_expired_calls(now) == ["old-call"]
+        assert [call_id for _, call_id in websocket_bridge._expiry_heap] == ["new-call"]
+        assert websocket_bridge._next_cleanup_delay(now) == pytest.approx(STALE_CALL_TIMEOUT - 60)
+    
+    @pytest.mark.asyncio
+    async def test_rtp_audio_consumed_in_order(self, websocket_bridge):
+        """Test RTP payloads queued by the receive callback are handled in order, in batches."""
+        call_id = "test-rtp-consumer"
+        batches = []
+        
+        async def record(cid, payloads):
+            batches.append(list(payloads))
+        
+        inbox = _RtpInbox()
+        with patch.object(websocket_bridge, '_handle_rtp_audio_batch', side_effect=record):
+            consumer = asyncio.create_task(websocket_bridge._consume_rtp_audio(call_id, inbox))
+            for i in range(3):
+                inbox.push(bytes([i]))
+            await asyncio.sleep(0.01)
+            inbox.push(b"\x03")
+            await asyncio.sleep(0.01)
+            consumer.cancel()
+        
+        assert batches == [[b"\x00", b"\x01", b"\x02"], [b"\x03"]]
+    
+    @pytest.mark.asyncio
+    async def test_rtp_audio_batch_sent_as_one_message(self, websocket_bridge):
+        """Test a batch of RTP payloads reaches the AI platform as a single message."""
+        call_id = "test-rtp-batch"
+        websocket_bridge.active_calls[call_id] = CallInfo(
+            call_id=call_id, from_number="+1", to_number="+2", sip_headers={}
+        )
+        mock_connection = AsyncMock(spec=WebSocketClientProtocol)
+        websocket_bridge.connection_manager.connections[call_id] = mock_connection
+        
+        await websocket_bridge._handle_rtp_audio_batch(call_id, [b"\xff" * 160] * 3)
+        await asyncio.sleep(0.01)
+        
+        mock_connection.send.assert_called_once()
+        await websocket_bridge.connection_manager.disconnect_call(call_id)
+    
+    @pytest.mark.asyncio
+    async def test_ai_messages_dispatched(self, websocket_bridge):
+        """Test AI audio and control messages reach their handlers and bad JSON is skipped."""
+        call_id = "test-ai-dispatch"
+        
+        async def messages(cid):
+            for message in (b"\x00" * 640, "not json", '{"type": "hangup"}', b"\x01" * 640):
+                yield message
+        
+        with patch.object(websocket_bridge.connection_manager, 'iter_messages', side_effect=messages), \
+             patch.object(websocket_bridge, '_handle_ai_audio', new=AsyncMock()) as handle_audio, \
+             patch.object(websocket_bridge, '_process_ai_control_message', new=AsyncMock()) as process_control:
+            await websocket_bridge._handle_ai_messages(call_id)
+        
+        assert handle_audio.await_count == 2
+        process_control.assert_awaited_once_with(call_id, {"type": "hangup"})
+    
+    @pytest.mark.asyncio
+    async def test_sip_messages_dispatched(self, websocket_bridge):
+        """Test SIP audio frames and control messages reach their handlers."""
+        call_id = "test-sip-dispatch"
+        
+        class FakeSipSocket:
+            def __aiter__(self):
+                return self._messages()
+            
+            async def _messages(self):
+                for message in (b"\xff" * 160, '{"type": "dtmf", "digit": "1"}', "{bad", b"\x7f" * 160):
+                    yield message
+        
+        with patch.object(websocket_bridge, '_handle_sip_audio', new=AsyncMock()) as handle_audio, \
+             patch.object(websocket_bridge, '_process_sip_control_message', new=AsyncMock()) as process_control:
+            await websocket_bridge._handle_sip_messages(FakeSipSocket(), call_id)
+        
+        assert [call.args[1] for call in handle_audio.await_args_list] == [b"\xff" * 160, b"\x7f" * 160]
+        process_control.assert_awaited_once_with(call_id, {"type": "dtmf", "digit": "1"})
+    
+    @pytest.mark.asyncio
+    async def test_control_message_dispatch(self, websocket_bridge):
+        """Test control messages from both sides are routed by type."""
+        call_id = "test-control-dispatch"
+        
+        with patch.object(websocket_bridge, '_forward_dtmf_to_ai', new=AsyncMock()) as forward_dtmf, \
+             patch.object(websocket_bridge, '_transfer_call', new=AsyncMock()) as transfer, \
+             patch.object(websocket_bridge, '_handle_call_hold', new=AsyncMock()) as hold:
+            await websocket_bridge._process_sip_control_message(call_id, {"type": "dtmf", "digit": "9"})
+            await websocket_bridge._process_ai_control_message(call_id, {"type": "transfer", "target": "+1555"})
+            await websocket_bridge._process_ai_control_message(call_id, {"type": "hold"})
+            await websocket_bridge._process_sip_control_message(call_id, {"type": "unknown"})
+        
+        forward_dtmf.assert_awaited_once_with(call_id, "9")
+        transfer.assert_awaited_once_with(call_id, "+1555")
+        hold.assert_awaited_once_with(call_id)
+    
+    @pytest.mark.asyncio
+    async def test_sip_control_messages_from_templates(self, websocket_bridge):
+        """Test templated SIP control messages are valid, escaped JSON."""
+        call_id = "test-sip-templates"
+        sip_ws = AsyncMock()
+        sip_ws.open = True
+        websocket_bridge.sip_connections[call_id] = sip_ws
+        websocket_bridge.sip_connection_alive.add(call_id)
+        
+        await websocket_bridge._send_dtmf_to_sip(call_id, "#")
+        await websocket_bridge._transfer_call(call_id, 'sip:"agent"@example.com')
+        await websocket_bridge._send_error(sip_ws, "bad\nrequest")
+        
+        sent = [json.loads(call.args[0]) for call in sip_ws.send.call_args_list]
+        assert sent == [
+            {"type": "dtmf_send", "digit": "#"},
+            {"type": "transfer", "target": 'sip:"agent"@example.com'},
+            {"type": "error", "error": "bad\nrequest"},
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_sip_send_stops_after_connection_closed(self, websocket_bridge):
+        """Test a closed SIP WebSocket is marked dead and skipped afterwards."""
+        call_id = "test-sip-closed"
+        sip_ws = AsyncMock()
+        sip_ws.send.side_effect = websockets.exceptions.ConnectionClosed(None, None)
+        websocket_bridge.sip_connections[call_id] = sip_ws
+        websocket_bridge.sip_connection_alive.add(call_id)
+        
+        assert await websocket_bridge._send_to_sip(call_id, "x") is False
+        assert call_id not in websocket_bridge.sip_connection_alive
+        assert await websocket_bridge._send_to_sip(call_id, "y") is False
+        sip_ws.send.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_heartbeat_cleans_up_unanswered_pings(self, websocket_bridge):
+        """Test heartbeats ping connections concurrently and drop calls that never get a pong."""
+        loop = asyncio.get_running_loop()
+        healthy = AsyncMock(spec=WebSocketClientProtocol)
+        answered = loop.create_future()
+        answered.set_result(None)
+        healthy.ping.return_value = answered
+        wedged = AsyncMock(spec=WebSocketClientProtocol)
+        wedged.ping.return_value = loop.create_future()
+        
+        for call_id, connection in (("call-ok", healthy), ("call-dead", wedged)):
+            websocket_bridge.active_calls[call_id] = CallInfo(
+                call_id=call_id, from_number="+1", to_number="+2", sip_headers={}
+            )
+            websocket_bridge.connection_manager.connections[call_id] = connection
+        
+        with patch('src.websocket.bridge_handlers.HEARTBEAT_TIMEOUT', 0.01), \
+             patch.object(websocket_bridge, 'cleanup_call', new=AsyncMock()) as cleanup:
+            await websocket_bridge._send_heartbeats()
+        
+        cleanup.assert_awaited_once_with("call-dead", reason="Heartbeat failed")
+    
     @pytest.mark.asyncio
     async def test_audio_processing_pipeline(self, websocket_bridge, sample_audio_data):
         """Test audio processing pipeline."""
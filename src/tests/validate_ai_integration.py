@@ -6,6 +6,7 @@ This script validates that the WebSocket communication between
 the SIP server and the conversational AI will work correctly.
 """
 
+import io
 import json
 import asyncio
 import logging
@@ -265,26 +266,23 @@ class IntegrationValidator:
     
     def generate_report(self):
         """Generate validation report."""
-        logger.info("\n" + "="*60)
-        logger.info("VALIDATION REPORT")
-        logger.info("="*60)
+        report = io.StringIO()
+        report.write("\n" + "="*60 + "\nVALIDATION REPORT\n" + "="*60 + "\n")
         
-        logger.info(f"\n✅ Successes: {len(self.successes)}")
-        for success in self.successes:
-            logger.info(f"  {success}")
-        
-        logger.info(f"\n⚠️  Warnings: {len(self.warnings)}")
-        for warning in self.warnings:
-            logger.info(f"  {warning}")
-        
-        logger.info(f"\n❌ Issues: {len(self.issues)}")
-        for issue in self.issues:
-            logger.info(f"  {issue}")
+        for title, entries in (("✅ Successes", self.successes),
+                               ("⚠️  Warnings", self.warnings),
+                               ("❌ Issues", self.issues)):
+            report.write(f"\n{title}: {len(entries)}\n")
+            for entry in entries:
+                report.write(f"  {entry}\n")
         
         if not self.issues:
-            logger.info("\n✅ VALIDATION PASSED: The integration should work correctly!")
+            report.write("\n✅ VALIDATION PASSED: The integration should work correctly!")
         else:
-            logger.info("\n❌ VALIDATION FAILED: Issues need to be addressed")
+            report.write("\n❌ VALIDATION FAILED: Issues need to be addressed")
+        
+        # One log record for the whole report instead of one per line
+        logger.info(report.getvalue())
         
         return len(self.issues) == 0
 
@@ -49,6 +49,9 @@ class WebSocketConfig:
     host: str = "0.0.0.0"
     port: int = 8081
     ai_platform_url: str = "ws://127.0.0.1:8081/ws"
+    binary_audio: bool = True
+    ai_connection_pool_size: int = 0
+    ai_send_queue_size: int = 50
 
 
 @dataclass
@@ -147,7 +150,10 @@ class AppConfig:
             "websocket": {
                 "ai_platform_url": self.websocket.ai_platform_url,
                 "port": self.websocket.port,
-                "host": self.websocket.host
+                "host": self.websocket.host,
+                "binary_audio": self.websocket.binary_audio,
+                "ai_connection_pool_size": self.websocket.ai_connection_pool_size,
+                "ai_send_queue_size": self.websocket.ai_send_queue_size
             },
             "api": {
                 "host": self.api.host,
@@ -299,7 +305,10 @@ class ConfigManager:
         websocket = WebSocketConfig(
             host=self._get_env("WEBSOCKET_HOST", "0.0.0.0"),
             port=self._get_env("WEBSOCKET_PORT", 8081, int),
-            ai_platform_url=self._get_env("AI_PLATFORM_WS_URL", "ws://127.0.0.1:8081/ws")
+            ai_platform_url=self._get_env("AI_PLATFORM_WS_URL", "ws://127.0.0.1:8081/ws"),
+            binary_audio=self._get_env("AI_BINARY_AUDIO", True, bool),
+            ai_connection_pool_size=self._get_env("AI_CONNECTION_POOL_SIZE", 0, int),
+            ai_send_queue_size=self._get_env("AI_SEND_QUEUE_SIZE", 50, int)
         )
         
         # Security configuration
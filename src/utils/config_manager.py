@@ -2,6 +2,7 @@
 import json
 import logging
 import asyncio
+import shutil
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import aiofiles
@@ -48,10 +49,7 @@ class ConfigManager:
         try:
             # Backup current config
             if self.config_path.exists():
-                async with aiofiles.open(self.config_path, 'r') as src:
-                    content = await src.read()
-                async with aiofiles.open(self.backup_path, 'w') as dst:
-                    await dst.write(content)
+                await self._copy_file(self.config_path, self.backup_path)
                     
             # Generate new config
             new_config = await self._generate_kamailio_config(config)
@@ -63,10 +61,7 @@ class ConfigManager:
             # Validate config
             if not await self._validate_kamailio_config():
                 # Restore backup
-                async with aiofiles.open(self.backup_path, 'r') as src:
-                    content = await src.read()
-                async with aiofiles.open(self.config_path, 'w') as dst:
-                    await dst.write(content)
+                await self._copy_file(self.backup_path, self.config_path)
                 return False
                 
             return True
@@ -75,6 +70,10 @@ class ConfigManager:
             logger.error(f"Failed to update config: {e}")
             return False
             
+    async def _copy_file(self, src: Path, dst: Path):
+        """Copy a file kernel-side without loading it into memory."""
+        await asyncio.to_thread(shutil.copyfile, src, dst)
+        
     def validate_config(self, config: SIPConfig) -> bool:
         """Validate configuration values."""
         try:
@@ -200,7 +199,7 @@ class ConfigManager:
         """Generate Kamailio configuration file."""
         # This would generate the actual Kamailio config
         # For now, return a template
-        template = """#!KAMAILIO
+        parts = ["""#!KAMAILIO
 # Auto-generated configuration
         
 # Global parameters
@@ -208,12 +207,11 @@ debug=2
 log_stderror=yes
         
 # Aliases
-"""
-        for domain in config.sip_domains:
-            template += f'alias="{domain}"\n'
+"""]
+        parts.extend(f'alias="{domain}"\n' for domain in config.sip_domains)
             
         # Add more configuration based on SIPConfig
-        return template
+        return "".join(parts)
         
     async def _validate_kamailio_config(self) -> bool:
         """Validate Kamailio configuration file."""
@@ -0,0 +1,19 @@
+"""Event loop setup for the server entry points."""
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for asyncio.run() when it is installed.
+    
+    uvloop is not available on Windows; the default asyncio loop is kept there.
+    Must be called before the event loop is created.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    logger.debug("Using uvloop event loop")
+    return True
@@ -12,6 +12,15 @@ from ..models.schemas import CallInfo, SMSInfo, BlockedNumber, NumberInfo, CallS
 
 logger = logging.getLogger(__name__)
 
+# Kamailio dialog state -> CallStatus
+_DIALOG_STATE_MAP = {
+    1: CallStatus.CONNECTING,
+    2: CallStatus.CONNECTING,
+    3: CallStatus.CONNECTED,
+    4: CallStatus.CONNECTED,
+    5: CallStatus.ENDED
+}
+
 
 class SIPClient:
     """Client for interacting with Kamailio SIP server."""
@@ -105,13 +114,16 @@ class SIPClient:
             # Get dialog info from Kamailio
             result = await self._rpc_call("dlg.list")
             
+            extract_number = self._extract_number
+            map_dialog_state = self._map_dialog_state
+            
             calls = []
             for dialog in result:
                 call_info = CallInfo(
                     call_id=dialog.get("callid"),
-                    from_number=self._extract_number(dialog.get("from_uri")),
-                    to_number=self._extract_number(dialog.get("to_uri")),
-                    status=self._map_dialog_state(dialog.get("state")),
+                    from_number=extract_number(dialog.get("from_uri")),
+                    to_number=extract_number(dialog.get("to_uri")),
+                    status=map_dialog_state(dialog.get("state")),
                     direction=dialog.get("direction", "unknown"),
                     start_time=datetime.fromtimestamp(dialog.get("start_ts", 0))
                 )
@@ -164,6 +176,12 @@ class SIPClient:
             logger.error(f"Failed to hang up call: {e}")
             return False
             
+    async def hangup_calls(self, call_ids: List[str]) -> Dict[str, bool]:
+        """Hang up several calls concurrently."""
+        async with asyncio.TaskGroup() as tg:
+            tasks = {call_id: tg.create_task(self.hangup_call(call_id)) for call_id in call_ids}
+        return {call_id: task.result() for call_id, task in tasks.items()}
+            
     async def transfer_call(
         self,
         call_id: str,
@@ -299,6 +317,20 @@ class SIPClient:
             logger.error(f"Failed to block number: {e}")
             return False
             
+    async def block_numbers(
+        self,
+        numbers: List[str],
+        reason: str = None,
+        expires_at: datetime = None
+    ) -> Dict[str, bool]:
+        """Block several phone numbers concurrently."""
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                number: tg.create_task(self.block_number(number, reason, expires_at))
+                for number in numbers
+            }
+        return {number: task.result() for number, task in tasks.items()}
+            
     async def unblock_number(self, number: str) -> bool:
         """Unblock a phone number."""
         try:
@@ -310,6 +342,12 @@ class SIPClient:
             logger.error(f"Failed to unblock number: {e}")
             return False
             
+    async def unblock_numbers(self, numbers: List[str]) -> Dict[str, bool]:
+        """Unblock several phone numbers concurrently."""
+        async with asyncio.TaskGroup() as tg:
+            tasks = {number: tg.create_task(self.unblock_number(number)) for number in numbers}
+        return {number: task.result() for number, task in tasks.items()}
+            
     async def get_blocked_numbers(self) -> List[BlockedNumber]:
         """Get list of blocked numbers."""
         try:
@@ -383,10 +421,12 @@ class SIPClient:
             # Get all registered users
             result = await self._rpc_call("ul.dump")
             
+            extract_number = self._extract_number
+            
             numbers = []
             for user in result:
                 aor = user.get("AoR", "")
-                number = self._extract_number(aor)
+                number = extract_number(aor)
                 
                 if number:
                     info = NumberInfo(
@@ -423,11 +463,13 @@ class SIPClient:
             logger.error(f"Failed to get number info: {e}")
             return None
             
-    def _get_domain(self) -> str:
+    @staticmethod
+    def _get_domain() -> str:
         """Get SIP domain."""
         return "sip.olib.ai"  # Could be configurable
         
-    def _extract_number(self, uri: str) -> str:
+    @staticmethod
+    def _extract_number(uri: str) -> str:
         """Extract phone number from SIP URI."""
         if not uri:
             return ""
@@ -438,18 +480,13 @@ class SIPClient:
             return uri.split("@")[0]
         return uri
         
-    def _map_dialog_state(self, state: int) -> CallStatus:
+    @staticmethod
+    def _map_dialog_state(state: int) -> CallStatus:
         """Map Kamailio dialog state to CallStatus."""
-        state_map = {
-            1: CallStatus.CONNECTING,
-            2: CallStatus.CONNECTING,
-            3: CallStatus.CONNECTED,
-            4: CallStatus.CONNECTED,
-            5: CallStatus.ENDED
-        }
-        return state_map.get(state, CallStatus.FAILED)
+        return _DIALOG_STATE_MAP.get(state, CallStatus.FAILED)
         
-    def _calculate_segments(self, message: str) -> int:
+    @staticmethod
+    def _calculate_segments(message: str) -> int:
         """Calculate number of SMS segments."""
         length = len(message)
         if length <= 160:
@@ -1,42 +1,75 @@
 """Advanced WebSocket bridge for connecting SIP calls to AI platform."""
 import asyncio
-import json
+import itertools
 import logging
+import random
 import time
 import uuid
-from typing import Dict, Optional, Callable, Set, Any
+from typing import Dict, List, Optional, Set, Any, Tuple, Iterator, AsyncIterator
 import websockets
 from websockets.legacy.server import WebSocketServerProtocol
 from websockets.legacy.client import WebSocketClientProtocol
-from dataclasses import dataclass, asdict
+from websockets.legacy.protocol import WebSocketCommonProtocol
+from websockets.frames import Opcode
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
 from enum import Enum
-import struct
-import base64
-import traceback
-from collections import deque, defaultdict
+import zlib
+import binascii
+from collections import defaultdict
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ..audio.codecs import AudioProcessor
-from ..audio.rtp import RTPManager, RTPSession, RTPStatistics
+from ..audio.rtp import RTPManager, RTPStatistics
 from ..utils.config import get_config
+from ..utils.event_loop import install_uvloop
+from ..utils import json_codec
+from .frames import AUDIO_FRAME_HEADER, AUDIO_FRAME_VERSION, AUDIO_FRAME_TYPE_AUDIO
+from .models import AudioBuffer, CallInfo
+
+try:
+    import msgpack
+except ImportError:  # msgpack control messages are optional
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds for coalescing queued audio frames into one AI platform message
+AUDIO_BATCH_MAX_FRAMES = 32
+AUDIO_BATCH_MAX_BYTES = 64 * 1024
 
-class CallState(Enum):
-    """Call states."""
-    INITIALIZING = "initializing"
-    CONNECTING = "connecting"
-    RINGING = "ringing"
-    CONNECTED = "connected"
-    ON_HOLD = "on_hold"
-    TRANSFERRING = "transferring"
-    ENDING = "ending"
-    DISCONNECTED = "disconnected"
-    ERROR = "error"
+# How long disconnect_call waits for an in-flight send before dropping the call's backlog
+SENDER_STOP_TIMEOUT = 2.0
+
+# permessage-deflate tuned for small, frequent messages (base64 JSON audio to the AI platform only)
+DEFLATE_COMPRESS_SETTINGS = {"level": 3, "memLevel": 5}
+WS_MAX_MESSAGE_SIZE = 2 ** 20
+
+# Control message codec negotiation: offered in the handshake, used if echoed back
+CODEC_HEADER = "X-Codec"
+CODEC_MSGPACK = "msgpack"
+_CODEC_OFFER = {CODEC_HEADER: CODEC_MSGPACK} if msgpack is not None else {}
+
+
+class _ControlFrame(bytes):
+    """Binary-encoded control message, kept apart from raw audio in the send queue."""
+    __slots__ = ()
+
+
+class _SendQueue(asyncio.Queue):
+    """Per-call send queue that can evict its oldest raw audio frame in place."""
+    
+    def evict_oldest_audio(self) -> bool:
+        """Remove the oldest raw audio frame, keeping everything else in order."""
+        for index, queued in enumerate(self._queue):
+            # _ControlFrame subclasses bytes, so match the exact type
+            if type(queued) is bytes:
+                del self._queue[index]
+                self.task_done()
+                return True
+        return False
 
 
 class MessageType(Enum):
@@ -48,6 +81,7 @@ class MessageType(Enum):
     CALL_RESUME = "call_resume"
     CALL_TRANSFER = "call_transfer"
     AUDIO_DATA = "audio_data"
+    AUDIO_DATA_BATCH = "audio_data_batch"
     AUDIO_START = "audio_start"
     AUDIO_STOP = "audio_stop"
     DTMF = "dtmf"
@@ -56,129 +90,253 @@ class MessageType(Enum):
     STATUS = "status"
 
 
-@dataclass
-class CallInfo:
-    """Enhanced call information."""
-    call_id: str
-    from_number: str
-    to_number: str
-    sip_headers: Dict[str, str]
-    state: CallState = CallState.INITIALIZING
-    start_time: Optional[float] = None
-    end_time: Optional[float] = None
-    rtp_local_port: Optional[int] = None
-    rtp_remote_host: Optional[str] = None
-    rtp_remote_port: Optional[int] = None
-    codec: str = "PCMU"
-    ai_session_id: Optional[str] = None
-
-
-class AudioBuffer:
-    """Advanced audio buffering with jitter control."""
-    
-    def __init__(self, max_frames: int = 3, target_delay_ms: int = 5):
-        self.max_frames = max_frames
-        self.target_delay_ms = target_delay_ms
-        self.frames = deque(maxlen=max_frames)
-        self.frame_times = deque(maxlen=max_frames)
-        self.total_bytes = 0
-        
-    def add_frame(self, audio_data: bytes) -> None:
-        """Add audio frame to buffer."""
-        current_time = time.time()
-        
-        if len(self.frames) >= self.max_frames:
-            # Remove oldest frame
-            old_frame = self.frames.popleft()
-            self.frame_times.popleft()
-            self.total_bytes -= len(old_frame)
-            
-        self.frames.append(audio_data)
-        self.frame_times.append(current_time)
-        self.total_bytes += len(audio_data)
-        
-    def get_frame(self) -> Optional[bytes]:
-        """Get next audio frame if ready."""
-        if not self.frames:
-            return None
-            
-        # Check if we should delay playback for jitter control
-        current_time = time.time()
-        frame_time = self.frame_times[0]
-        age_ms = (current_time - frame_time) * 1000
-        
-        if age_ms >= self.target_delay_ms or len(self.frames) >= self.max_frames:
-            self.frame_times.popleft()
-            frame = self.frames.popleft()
-            self.total_bytes -= len(frame)
-            return frame
-            
-        return None
-        
-    def clear(self) -> None:
-        """Clear all buffered frames."""
-        self.frames.clear()
-        self.frame_times.clear()
-        self.total_bytes = 0
-        
-    def get_buffer_level(self) -> float:
-        """Get buffer level (0.0 to 1.0)."""
-        return len(self.frames) / self.max_frames if self.max_frames > 0 else 0.0
+# Message type strings for per-message paths (avoids enum attribute lookups)
+_MT_AUDIO_DATA = MessageType.AUDIO_DATA.value
+_MT_AUDIO_DATA_BATCH = MessageType.AUDIO_DATA_BATCH.value
+_MT_CALL_END = MessageType.CALL_END.value
 
 
 class ConnectionManager:
-    """Manages AI platform connections with reconnection logic."""
+    """Manages AI platform connections with reconnection logic.
     
-    def __init__(self, ai_platform_url: str, max_retries: int = 5):
+    By default every call gets its own WebSocket. With pool_size > 0, calls
+    are multiplexed over that many shared connections; incoming messages are
+    routed back to calls by call_id (JSON) or by the call hash in the binary
+    audio header.
+    """
+    
+    def __init__(self, ai_platform_url: str, max_retries: int = 5, binary_audio: bool = True,
+                 base_delay: float = 1.0, max_delay: float = 30.0, pool_size: int = 0,
+                 send_queue_size: int = 50):
         self.ai_platform_url = ai_platform_url
+        self.send_queue_size = send_queue_size
+        self.dropped_oldest = 0
+        self.dropped_incoming = 0
+        self._sample_rate = get_config().audio.sample_rate
         self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.binary_audio = binary_audio
         self.connections: Dict[str, WebSocketClientProtocol] = {}
         self.connection_tasks: Dict[str, asyncio.Task] = {}
         self.retry_counts: Dict[str, int] = defaultdict(int)
+        self._send_queues: Dict[str, _SendQueue] = {}
+        self._sender_tasks: Dict[str, asyncio.Task] = {}
+        self._call_hashes: Dict[str, int] = {}
+        self._audio_prefixes: Dict[str, Tuple[str, str]] = {}
+        self._sequences: Dict[str, Iterator[int]] = {}
+        self._msgpack_calls: Set[str] = set()
+        
+        # Multiplexed connection pool
+        self.pool_size = pool_size
+        self.pool: List[Optional[WebSocketClientProtocol]] = [None] * pool_size
+        self._pool_lock = asyncio.Lock()
+        self._demux_tasks: Dict[int, asyncio.Task] = {}
+        self._call_inboxes: Dict[str, asyncio.Queue] = {}
+        self._hash_to_call: Dict[int, str] = {}
         
     async def connect_for_call(self, call_id: str, call_info: CallInfo) -> Optional[WebSocketClientProtocol]:
-        """Create AI platform connection for a call."""
-        try:
-            # Generate unique session ID
-            session_id = str(uuid.uuid4())
-            call_info.ai_session_id = session_id
+        """Create AI platform connection for a call, retrying with jittered backoff."""
+        for attempt in range(self.max_retries):
+            try:
+                connection = await self._connect_once(call_id, call_info)
+            except Exception as e:
+                logger.error(f"Failed to connect to AI platform for call {call_id}: {e}")
+                self.retry_counts[call_id] += 1
+                
+                if self._is_unrecoverable(e):
+                    logger.error(f"Not retrying AI platform connection for call {call_id}")
+                    return None
+                    
+                if attempt + 1 < self.max_retries:
+                    delay = min(self.base_delay * (2 ** attempt) * (1 + random.random() * 0.5), self.max_delay)
+                    await asyncio.sleep(delay)
+                continue
+                
+            self.retry_counts[call_id] = 0
+            logger.info(f"Connected to AI platform for call {call_id}")
+            return connection
             
+        return None
+        
+    async def _connect_once(self, call_id: str, call_info: CallInfo) -> WebSocketClientProtocol:
+        """Make a single connection attempt and send the call start message."""
+        # Generate unique session ID
+        session_id = str(uuid.uuid4())
+        call_info.ai_session_id = session_id
+        
+        if self.pool_size:
+            connection = await self._get_pooled_connection(call_id)
+            self._prepare_call(call_id)
+            self._call_inboxes[call_id] = asyncio.Queue()
+        else:
             # Connect with custom headers
             extra_headers = {
                 "X-Call-ID": call_id,
                 "X-Session-ID": session_id,
                 "X-From-Number": call_info.from_number,
                 "X-To-Number": call_info.to_number,
-                "X-Source": "sip-server"
+                "X-Source": "sip-server",
+                **_CODEC_OFFER
             }
             
             connection = await websockets.connect(
                 self.ai_platform_url,
                 extra_headers=extra_headers,
                 ping_interval=30,
-                ping_timeout=10
+                ping_timeout=10,
+                **self._compression_options()
             )
+        
+        if self._negotiated_msgpack(connection):
+            self._msgpack_calls.add(call_id)
             
-            self.connections[call_id] = connection
-            self.retry_counts[call_id] = 0
-            
+        try:
             # Send initial call start message
             await self._send_call_start(connection, call_info)
+        except Exception:
+            self._msgpack_calls.discard(call_id)
+            if self.pool_size:
+                self._call_inboxes.pop(call_id, None)
+            else:
+                await connection.close()
+            raise
             
-            logger.info(f"Connected to AI platform for call {call_id}")
-            return connection
-            
+        self.connections[call_id] = connection
+        
+        # Start the per-call audio sender
+        self._start_sender(call_id)
+        return connection
+        
+    async def _get_pooled_connection(self, call_id: str) -> WebSocketClientProtocol:
+        """Get (or open) the shared connection that carries this call."""
+        slot = zlib.crc32(call_id.encode()) % self.pool_size
+        
+        async with self._pool_lock:
+            connection = self.pool[slot]
+            demux_task = self._demux_tasks.get(slot)
+            if connection is None or demux_task is None or demux_task.done():
+                connection = await websockets.connect(
+                    self.ai_platform_url,
+                    extra_headers={"X-Source": "sip-server", "X-Multiplexed": "true", **_CODEC_OFFER},
+                    ping_interval=30,
+                    ping_timeout=10,
+                    **self._compression_options()
+                )
+                self.pool[slot] = connection
+                self._demux_tasks[slot] = asyncio.create_task(self._demux_loop(slot, connection))
+                logger.info(f"Opened shared AI platform connection {slot}")
+                
+        return connection
+        
+    async def _demux_loop(self, slot: int, connection: WebSocketClientProtocol) -> None:
+        """Route messages from a shared connection to the owning calls."""
+        try:
+            async for message in connection:
+                if isinstance(message, bytes):
+                    # Binary audio: call identified by the frame header
+                    if len(message) < AUDIO_FRAME_HEADER.size:
+                        continue
+                    call_id = self._hash_to_call.get(AUDIO_FRAME_HEADER.unpack_from(message)[3])
+                    message = message[AUDIO_FRAME_HEADER.size:]
+                else:
+                    try:
+                        data = json_codec.loads(message)
+                    except json_codec.JSONDecodeError:
+                        logger.error(f"Invalid JSON on shared AI platform connection {slot}")
+                        continue
+                    call_id = self._message_call_id(data)
+                    
+                inbox = self._call_inboxes.get(call_id)
+                if inbox is None:
+                    logger.debug(f"Dropping AI platform message for unknown call {call_id}")
+                    continue
+                inbox.put_nowait(message)
+                
+        except websockets.exceptions.ConnectionClosed:
+            logger.info(f"Shared AI platform connection {slot} closed")
         except Exception as e:
-            logger.error(f"Failed to connect to AI platform for call {call_id}: {e}")
-            self.retry_counts[call_id] += 1
+            logger.error(f"Error reading shared AI platform connection {slot}: {e}")
+        finally:
+            if self.pool[slot] is connection:
+                self.pool[slot] = None
+            # End the message streams of every call carried by this connection
+            for call_id, call_connection in self.connections.items():
+                inbox = self._call_inboxes.get(call_id)
+                if call_connection is connection and inbox is not None:
+                    inbox.put_nowait(None)
+                    
+    @staticmethod
+    def _message_call_id(data: Any) -> Optional[str]:
+        """Call ID of a decoded JSON message, or None when it cannot be routed."""
+        if not isinstance(data, dict):
+            return None
+        call_id = data.get("call_id")
+        if not call_id:
+            inner = data.get("data")
+            call_id = inner.get("call_id") if isinstance(inner, dict) else None
+        return call_id if isinstance(call_id, str) else None
+        
+    async def iter_messages(self, call_id: str) -> AsyncIterator[Any]:
+        """Yield messages from the AI platform for a call."""
+        connection = self.connections.get(call_id)
+        if not connection:
+            return
             
-            if self.retry_counts[call_id] < self.max_retries:
-                # Schedule retry
-                await asyncio.sleep(2 ** self.retry_counts[call_id])  # Exponential backoff
-                return await self.connect_for_call(call_id, call_info)
+        if not self.pool_size:
+            async for message in connection:
+                yield message
+            return
             
-            return None
+        inbox = self._call_inboxes.get(call_id)
+        if inbox is None:
+            return
+        while True:
+            message = await inbox.get()
+            if message is None:
+                return
+            yield message
             
+    async def close(self) -> None:
+        """Close shared pool connections."""
+        for task in self._demux_tasks.values():
+            task.cancel()
+        self._demux_tasks.clear()
+        
+        for slot, connection in enumerate(self.pool):
+            if connection is not None:
+                try:
+                    await connection.close()
+                except Exception as e:
+                    logger.error(f"Error closing shared AI platform connection {slot}: {e}")
+                self.pool[slot] = None
+                
+    def _compression_options(self) -> Dict[str, Any]:
+        """WebSocket compression options for AI platform connections.
+        
+        Base64 JSON audio compresses well; raw binary PCM does not, so
+        permessage-deflate is only negotiated for the JSON transport.
+        """
+        if self.binary_audio:
+            return {"compression": None, "max_size": WS_MAX_MESSAGE_SIZE}
+        return {
+            "compression": None,
+            "extensions": [ClientPerMessageDeflateFactory(compress_settings=DEFLATE_COMPRESS_SETTINGS)],
+            "max_size": WS_MAX_MESSAGE_SIZE
+        }
+        
+    @staticmethod
+    def _is_unrecoverable(error: Exception) -> bool:
+        """Check whether a connection error will not go away by retrying."""
+        if isinstance(error, websockets.exceptions.InvalidURI):
+            return True
+            
+        # Handshake rejected for authentication / authorization reasons
+        status_code = getattr(error, "status_code", None)
+        if status_code is None:
+            status_code = getattr(getattr(error, "response", None), "status_code", None)
+        return status_code in (401, 403)
+        
     async def _send_call_start(self, connection: WebSocketClientProtocol, call_info: CallInfo) -> None:
         """Send call start message to AI platform with authentication."""
         # Create authentication message first
@@ -197,33 +355,62 @@ class ConnectionManager:
                 "direction": "incoming",
                 "sip_headers": call_info.sip_headers,
                 "codec": call_info.codec,
-                "sample_rate": get_config().audio.sample_rate
+                "sample_rate": self._sample_rate,
+                "audio_transport": "binary" if self.binary_audio else "json"
             }
         }
-        await connection.send(json.dumps(auth_message))
+        await connection.send(self._encode_control(call_info.call_id, auth_message))
+        
+    @staticmethod
+    def _negotiated_msgpack(connection: WebSocketClientProtocol) -> bool:
+        """Whether the AI platform accepted msgpack control messages in the handshake."""
+        if msgpack is None:
+            return False
+        headers = getattr(connection, "response_headers", None)
+        return bool(headers) and headers.get(CODEC_HEADER) == CODEC_MSGPACK
+        
+    def _encode_control(self, call_id: str, message: Dict[str, Any]):
+        """Encode a control message with the codec negotiated for the call."""
+        if call_id in self._msgpack_calls:
+            return _ControlFrame(msgpack.packb(message, use_bin_type=True))
+        return json_codec.dumps(message)
         
     async def disconnect_call(self, call_id: str) -> None:
         """Disconnect AI platform connection for a call."""
+        # Queued control messages (e.g. a DTMF just before hangup) go out ahead of call_end
+        await self._stop_sender(call_id)
+        call_hash = self._call_hashes.pop(call_id, None)
+        if self._hash_to_call.get(call_hash) == call_id:
+            del self._hash_to_call[call_hash]
+        self._audio_prefixes.pop(call_id, None)
+        self._sequences.pop(call_id, None)
+        
         if call_id in self.connections:
             try:
                 connection = self.connections[call_id]
                 
                 # Send call end message
                 message = {
-                    "type": MessageType.CALL_END.value,
+                    "type": _MT_CALL_END,
                     "data": {
                         "call_id": call_id,
                         "timestamp": time.time()
                     }
                 }
-                await connection.send(json.dumps(message))
-                await connection.close()
+                await connection.send(self._encode_control(call_id, message))
+                if not self.pool_size:
+                    await connection.close()
                 
             except Exception as e:
                 logger.error(f"Error disconnecting call {call_id}: {e}")
             finally:
                 del self.connections[call_id]
                 self.retry_counts.pop(call_id, None)
+                self._msgpack_calls.discard(call_id)
+                
+        inbox = self._call_inboxes.pop(call_id, None)
+        if inbox is not None:
+            inbox.put_nowait(None)
                 
         if call_id in self.connection_tasks:
             self.connection_tasks[call_id].cancel()
@@ -234,31 +421,188 @@ class ConnectionManager:
         return self.connections.get(call_id)
         
     async def send_audio(self, call_id: str, audio_data: bytes) -> bool:
-        """Send audio data to AI platform."""
-        connection = self.connections.get(call_id)
-        if not connection:
+        """Queue audio data for sending to AI platform."""
+        return self._enqueue(call_id, audio_data)
+        
+    async def send_audio_batch(self, call_id: str, frames: List[bytes]) -> bool:
+        """Queue several audio frames at once; the sender coalesces them into one message."""
+        if call_id not in self.connections:
             return False
+        for audio_data in frames:
+            self._enqueue(call_id, audio_data)
+        return True
+        
+    async def send_control(self, call_id: str, message: Dict[str, Any]) -> bool:
+        """Queue a control message, keeping its order relative to queued audio."""
+        return self._enqueue(call_id, self._encode_control(call_id, message))
+        
+    def _enqueue(self, call_id: str, item) -> bool:
+        """Put audio (bytes) or an encoded control message (str or _ControlFrame) on the call's send queue."""
+        if call_id not in self.connections:
+            return False
+            
+        queue = self._send_queues.get(call_id)
+        if queue is None:
+            queue = self._start_sender(call_id)
             
         try:
-            # Encode audio as base64 for JSON transport
-            audio_b64 = base64.b64encode(audio_data).decode('utf-8')
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # The AI side is stalled: discard the oldest audio rather than block the RTP path.
+            # Control messages (DTMF, hangup, ...) are never evicted.
+            if not queue.evict_oldest_audio():
+                if type(item) is bytes:
+                    self.dropped_incoming += 1
+                    return True
+                logger.warning(f"Send queue for call {call_id} is full of control messages, "
+                               f"rejecting control message")
+                return False
+            queue.put_nowait(item)
+            self.dropped_oldest += 1
+        return True
+        
+    async def _stop_sender(self, call_id: str) -> None:
+        """Stop the call's sender task after writing everything already queued."""
+        sender_task = self._sender_tasks.pop(call_id, None)
+        queue = self._send_queues.pop(call_id, None)
+        if sender_task is None or queue is None:
+            return
             
-            message = {
-                "type": MessageType.AUDIO_DATA.value,
-                "data": {
-                    "call_id": call_id,
-                    "audio": audio_b64,
-                    "timestamp": time.time(),
-                    "sequence": int(time.time() * 1000) % 65536  # Simple sequence number
-                }
-            }
+        # Take the backlog, then let the sender finish its in-flight write and stop
+        pending = [queue.get_nowait() for _ in range(queue.qsize())]
+        queue.put_nowait(None)
+        try:
+            await asyncio.wait_for(sender_task, SENDER_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"Sender for call {call_id} did not stop in time, "
+                           f"discarding {len(pending)} queued items")
+            return
             
-            await connection.send(json.dumps(message))
-            return True
+        connection = self.connections.get(call_id)
+        if pending and connection:
+            try:
+                await self._write_messages(connection, self._build_messages(call_id, pending))
+            except Exception as e:
+                logger.error(f"Error flushing queued messages for call {call_id}: {e}")
+                
+    def _start_sender(self, call_id: str) -> _SendQueue:
+        """Create the send queue and sender task for a call."""
+        self._prepare_call(call_id)
+        queue = _SendQueue(maxsize=self.send_queue_size)
+        self._send_queues[call_id] = queue
+        self._sender_tasks[call_id] = asyncio.create_task(self._sender_loop(call_id, queue))
+        return queue
+        
+    async def _sender_loop(self, call_id: str, queue: _SendQueue) -> None:
+        """Drain queued items and flush them to the AI platform together."""
+        while True:
+            # Wait for the first item, then take whatever else is already queued;
+            # None is the stop marker put by _stop_sender
+            item = await queue.get()
+            if item is None:
+                return
+            pending = [item]
+            pending_bytes = len(item)
+            while len(pending) < AUDIO_BATCH_MAX_FRAMES and pending_bytes < AUDIO_BATCH_MAX_BYTES:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    queue.put_nowait(None)
+                    break
+                pending.append(item)
+                pending_bytes += len(item)
+                
+            connection = self.connections.get(call_id)
+            if not connection:
+                return
+                
+            try:
+                await self._write_messages(connection, self._build_messages(call_id, pending))
+            except Exception as e:
+                logger.error(f"Error sending audio for call {call_id}: {e}")
+                
+    def _build_messages(self, call_id: str, pending: list) -> list:
+        """Collapse consecutive audio frames into one message; control messages keep their place."""
+        messages = []
+        audio_batch = []
+        for item in pending:
+            if isinstance(item, (str, _ControlFrame)):
+                if audio_batch:
+                    messages.append(self._encode_audio(call_id, audio_batch))
+                    audio_batch = []
+                messages.append(item)
+            else:
+                audio_batch.append(item)
+        if audio_batch:
+            messages.append(self._encode_audio(call_id, audio_batch))
+        return messages
+        
+    @staticmethod
+    async def _write_messages(connection: WebSocketClientProtocol, messages: list) -> None:
+        """Write messages back to back and wait for the transport to drain once."""
+        if len(messages) == 1 or not isinstance(connection, WebSocketCommonProtocol):
+            for message in messages:
+                await connection.send(message)
+            return
             
-        except Exception as e:
-            logger.error(f"Error sending audio for call {call_id}: {e}")
-            return False
+        await connection.ensure_open()
+        for message in messages:
+            if isinstance(message, str):
+                connection.write_frame_sync(True, Opcode.TEXT, message.encode())
+            else:
+                connection.write_frame_sync(True, Opcode.BINARY, message)
+        await connection.drain()
+        
+    def _encode_audio(self, call_id: str, batch: list):
+        """Encode queued audio frames for the configured transport."""
+        if self.binary_audio:
+            return self._build_audio_frame(call_id, batch)
+        return self._encode_audio_message(call_id, batch)
+        
+    def _build_audio_frame(self, call_id: str, batch: list) -> bytes:
+        """Build a binary audio frame: fixed header followed by raw PCM.
+        
+        Batched frames are coalesced into a single contiguous payload.
+        """
+        header = AUDIO_FRAME_HEADER.pack(
+            AUDIO_FRAME_VERSION,
+            AUDIO_FRAME_TYPE_AUDIO,
+            next(self._sequences[call_id]) & 0xFFFF,
+            self._call_hashes[call_id],
+            time.time_ns()
+        )
+        return header + b"".join(batch)
+        
+    def _encode_audio_message(self, call_id: str, batch: list) -> str:
+        """Encode one or more audio frames as a JSON message.
+        
+        Only the base64 audio, timestamp and sequence vary per frame, so the
+        rest of the message comes from the per-call prefixes.
+        """
+        single_prefix, batch_prefix = self._audio_prefixes[call_id]
+        now = time.time()
+        
+        if len(batch) == 1:
+            audio_b64 = binascii.b2a_base64(batch[0], newline=False).decode('ascii')
+            sequence = next(self._sequences[call_id]) & 0xFFFF
+            return f'{single_prefix}{audio_b64}","timestamp":{now!r},"sequence":{sequence}}}}}'
+            
+        chunks = '","'.join(binascii.b2a_base64(chunk, newline=False).decode('ascii') for chunk in batch)
+        return f'{batch_prefix}{chunks}"],"timestamp":{now!r}}}}}'
+        
+    def _prepare_call(self, call_id: str) -> None:
+        """Precompute the per-call values used to encode audio."""
+        call_hash = zlib.crc32(call_id.encode())
+        self._call_hashes[call_id] = call_hash
+        self._hash_to_call[call_hash] = call_id
+        call_id_json = json_codec.dumps(call_id)
+        self._audio_prefixes[call_id] = (
+            f'{{"type":"{_MT_AUDIO_DATA}","data":{{"call_id":{call_id_json},"audio":"',
+            f'{{"type":"{_MT_AUDIO_DATA_BATCH}","data":{{"call_id":{call_id_json},"chunks":["'
+        )
+        self._sequences[call_id] = itertools.count()
 
 
 class WebSocketBridge:
@@ -274,18 +618,30 @@ class WebSocketBridge:
         # Core components
         self.audio_processor = AudioProcessor()
         self.rtp_manager = RTPManager(self.rtp_port_range)
-        self.connection_manager = ConnectionManager(self.ai_platform_url)
+        self.connection_manager = ConnectionManager(
+            self.ai_platform_url,
+            binary_audio=config.websocket.binary_audio,
+            pool_size=config.websocket.ai_connection_pool_size,
+            send_queue_size=config.websocket.ai_send_queue_size
+        )
         
         # Call tracking
         self.active_calls: Dict[str, CallInfo] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []  # (monotonic stale deadline, call_id)
+        self._expiry_deadlines: Dict[str, float] = {}
         self.sip_connections: Dict[str, WebSocketServerProtocol] = {}
+        self.sip_connection_alive: Set[str] = set()
         self.audio_buffers: Dict[str, AudioBuffer] = {}
         self.call_statistics: Dict[str, RTPStatistics] = {}
+        self._rtp_inboxes: Dict[str, Any] = {}
+        self._rtp_consumers: Dict[str, asyncio.Task] = {}
+        self._resamplers: Dict[str, Any] = {}
         
         # Performance monitoring
         self.total_calls_handled = 0
         self.concurrent_calls = 0
         self.bridge_start_time = time.time()
+        self._started_monotonic = time.monotonic()  # Uptime is measured on this clock
         
         # Control flags
         self.running = False
@@ -302,7 +658,9 @@ class WebSocketBridge:
             "0.0.0.0",
             self.sip_ws_port,
             ping_interval=30,
-            ping_timeout=10
+            ping_timeout=10,
+            compression=None,  # Codec audio frames do not compress
+            max_size=WS_MAX_MESSAGE_SIZE
         )
         logger.info(f"SIP WebSocket server listening on port {self.sip_ws_port}")
         
@@ -332,6 +690,9 @@ class WebSocketBridge:
         for call_id in list(self.active_calls.keys()):
             await self.cleanup_call(call_id, reason="Bridge shutdown")
             
+        # Close shared AI platform connections
+        await self.connection_manager.close()
+        
         # Cleanup RTP manager
         await self.rtp_manager.cleanup_all()
         
@@ -365,4 +726,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
@@ -1,13 +1,67 @@
-"""Handler methods for WebSocket bridge operations."""
+"""Handler methods for WebSocket bridge operations.
+
+Every handler is a coroutine on a single event loop, with a few tasks and
+small socket writes per call, so throughput is bound by loop overhead. The
+entry points install uvloop (see utils.event_loop) when it is available.
+"""
 import asyncio
-import json
 import logging
+import sys
 import time
-import base64
-from typing import Dict, Optional, Any
+import heapq
+from collections import deque
+from typing import Dict, Optional, Any, List
+
+import websockets
+
+from ..audio.resampler import AudioResampler, StreamingResampler
+from ..audio.rtp import RTPStatistics
+from ..utils import json_codec
+from .models import AudioBuffer, CallInfo, CallState
 
 logger = logging.getLogger(__name__)
 
+# Control messages to the SIP side: fixed ones are encoded once, the rest from templates
+_HANGUP_MESSAGE = json_codec.dumps({"type": "hangup"})
+_DTMF_SEND_PREFIX = '{"type":"dtmf_send","digit":'
+_TRANSFER_PREFIX = '{"type":"transfer","target":'
+_ERROR_PREFIX = '{"type":"error","error":'
+
+# Seconds to wait for an AI platform pong before treating the connection as dead
+HEARTBEAT_TIMEOUT = 5.0
+
+# Calls older than this are treated as stale and torn down by the cleanup loop
+STALE_CALL_TIMEOUT = 4 * 60 * 60
+
+# RTP payloads held per call while the consumer is busy (50 = 1s of 20ms frames)
+RTP_INBOX_MAX_FRAMES = 50
+
+
+class _RtpInbox:
+    """Per-call RTP payload queue; the consumer is woken through a single Future."""
+    __slots__ = ("frames", "waiter")
+    
+    def __init__(self, max_frames: int = RTP_INBOX_MAX_FRAMES):
+        self.frames = deque(maxlen=max_frames)  # Oldest frames are dropped on overflow
+        self.waiter: Optional[asyncio.Future] = None
+        
+    def push(self, audio_data: bytes):
+        """Queue a payload and wake the consumer if it is waiting."""
+        self.frames.append(audio_data)
+        waiter = self.waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+            
+    async def wait(self):
+        """Wait until at least one payload is queued."""
+        if self.frames:
+            return
+        self.waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self.waiter
+        finally:
+            self.waiter = None
+
 
 class BridgeHandlers:
     """Mixin class containing handler methods for WebSocket bridge."""
@@ -22,7 +76,7 @@ class BridgeHandlers:
             
             # Wait for initial call setup message
             initial_message = await asyncio.wait_for(websocket.recv(), timeout=30.0)
-            data = json.loads(initial_message)
+            data = json_codec.loads(initial_message)
             
             if data.get("type") != "call_setup":
                 await self._send_error(websocket, "Expected call_setup message")
@@ -30,14 +84,18 @@ class BridgeHandlers:
                 
             # Extract call information
             call_id = data.get("call_id")
-            if not call_id:
+            if not call_id or not isinstance(call_id, str):
                 await self._send_error(websocket, "Missing call_id")
                 return
+            # Interned so the per-call dict lookups usually compare by identity
+            call_id = sys.intern(call_id)
                 
             # Create call info
             call_info = await self._create_call_info(data)
             self.active_calls[call_id] = call_info
+            self._track_call_expiry(call_id, call_info)
             self.sip_connections[call_id] = websocket
+            self.sip_connection_alive.add(call_id)
             self.total_calls_handled += 1
             self.concurrent_calls += 1
             
@@ -52,11 +110,14 @@ class BridgeHandlers:
                 await self._send_error(websocket, "Failed to connect to AI platform")
                 return
                 
-            # Start handling AI messages
+            # Start handling AI messages and draining received RTP audio
             asyncio.create_task(self._handle_ai_messages(call_id))
+            self._rtp_consumers[call_id] = asyncio.create_task(
+                self._consume_rtp_audio(call_id, self._rtp_inboxes[call_id])
+            )
             
             # Send success response
-            await websocket.send(json.dumps({
+            await websocket.send(json_codec.dumps({
                 "type": "call_ready",
                 "call_id": call_id,
                 "rtp_port": call_info.rtp_local_port,
@@ -70,20 +131,17 @@ class BridgeHandlers:
             logger.warning(f"Timeout waiting for call setup from {client_ip}")
         except websockets.exceptions.ConnectionClosed:
             logger.info(f"SIP connection closed for call {call_id}")
-        except json.JSONDecodeError:
+        except json_codec.JSONDecodeError:
             logger.error(f"Invalid JSON from SIP connection {client_ip}")
         except Exception as e:
             logger.error(f"Error handling SIP connection: {e}")
-            if websocket.open:
-                await self._send_error(websocket, str(e))
+            await self._send_error(websocket, str(e))
         finally:
             if call_id:
                 await self.cleanup_call(call_id, reason="SIP connection ended")
                 
     async def _create_call_info(self, data: Dict) -> Any:
         """Create CallInfo object from SIP setup data."""
-        from .bridge import CallInfo, CallState
-        
         return CallInfo(
             call_id=data["call_id"],
             from_number=data.get("from_number", "unknown"),
@@ -110,23 +168,17 @@ class BridgeHandlers:
             call_info.rtp_remote_host = remote_host
             call_info.rtp_remote_port = remote_port
             
-            # Setup audio callback
-            rtp_session.set_receive_callback(
-                lambda audio_data: asyncio.create_task(
-                    self._handle_rtp_audio(call_id, audio_data)
-                )
-            )
+            # Setup audio callback; payloads are queued for the call's consumer task
+            inbox = _RtpInbox()
+            self._rtp_inboxes[call_id] = inbox
+            # RTPSession calls back from its playout coroutine on this loop, so push directly
+            rtp_session.set_receive_callback(inbox.push)
             
             # Create audio buffer
-            from .bridge import AudioBuffer
             self.audio_buffers[call_id] = AudioBuffer()
-            from ..audio.rtp import RTPStatistics
             self.call_statistics[call_id] = RTPStatistics()
             
             # Initialize streaming resampler for this call
-            if not hasattr(self, '_resamplers'):
-                self._resamplers = {}
-            from ..audio.resampler import StreamingResampler
             self._resamplers[call_id] = StreamingResampler(
                 from_rate=8000,  # SIP telephony
                 to_rate=16000,   # AI STT requirement  
@@ -141,42 +193,51 @@ class BridgeHandlers:
             
     async def _handle_sip_messages(self, websocket, call_id: str):
         """Handle ongoing SIP WebSocket messages."""
+        # Same shape as the AI reader: audio frames take the first, pre-bound branch
+        handle_audio = self._handle_sip_audio
+        process_control = self._process_sip_control_message
+        loads = json_codec.loads
         try:
             async for message in websocket:
-                if isinstance(message, bytes):
+                if type(message) is bytes:
                     # Binary audio data
-                    await self._handle_sip_audio(call_id, message)
-                else:
-                    # Text control message
-                    try:
-                        data = json.loads(message)
-                        await self._process_sip_control_message(call_id, data)
-                    except json.JSONDecodeError:
-                        logger.error(f"Invalid JSON from SIP call {call_id}")
+                    await handle_audio(call_id, message)
+                    continue
+                    
+                # Text control message
+                try:
+                    data = loads(message)
+                except json_codec.JSONDecodeError:
+                    logger.error(f"Invalid JSON from SIP call {call_id}")
+                    continue
+                await process_control(call_id, data)
                         
         except websockets.exceptions.ConnectionClosed:
+            self.sip_connection_alive.discard(call_id)
             logger.info(f"SIP WebSocket closed for call {call_id}")
         except Exception as e:
             logger.error(f"Error handling SIP messages for call {call_id}: {e}")
             
     async def _handle_ai_messages(self, call_id: str):
         """Handle messages from AI platform."""
-        connection = self.connection_manager.get_connection(call_id)
-        if not connection:
-            return
-            
+        # Bound once: audio arrives every 20ms, control messages only occasionally
+        handle_audio = self._handle_ai_audio
+        process_control = self._process_ai_control_message
+        loads = json_codec.loads
         try:
-            async for message in connection:
-                if isinstance(message, bytes):
+            async for message in self.connection_manager.iter_messages(call_id):
+                if type(message) is bytes:
                     # Binary audio from AI
-                    await self._handle_ai_audio(call_id, message)
-                else:
-                    # Control message from AI
-                    try:
-                        data = json.loads(message)
-                        await self._process_ai_control_message(call_id, data)
-                    except json.JSONDecodeError:
-                        logger.error(f"Invalid JSON from AI for call {call_id}")
+                    await handle_audio(call_id, message)
+                    continue
+                    
+                # Control message from AI
+                try:
+                    data = loads(message)
+                except json_codec.JSONDecodeError:
+                    logger.error(f"Invalid JSON from AI for call {call_id}")
+                    continue
+                await process_control(call_id, data)
                         
         except websockets.exceptions.ConnectionClosed:
             logger.info(f"AI connection closed for call {call_id}")
@@ -185,39 +246,51 @@ class BridgeHandlers:
             
     async def _handle_rtp_audio(self, call_id: str, audio_data: bytes):
         """Handle audio received via RTP."""
-        if call_id not in self.active_calls:
+        await self._handle_rtp_audio_batch(call_id, (audio_data,))
+        
+    async def _handle_rtp_audio_batch(self, call_id: str, payloads):
+        """Convert received RTP payloads and queue them for the AI platform together."""
+        call_info = self.active_calls.get(call_id)
+        if call_info is None:
             return
             
         try:
-            call_info = self.active_calls[call_id]
-            
-            # Convert codec format to PCM for AI platform
-            pcm_data = self.audio_processor.convert_format(
-                audio_data, call_info.codec, "PCM"
-            )
+            pcm_frames = [self._rtp_to_ai_audio(call_id, call_info, audio_data) for audio_data in payloads]
             
-            # Apply audio processing
-            pcm_data = self.audio_processor.apply_agc(pcm_data)
-            
-            # Resample from 8kHz (telephony) to 16kHz (AI STT requirement)
-            if hasattr(self, '_resamplers') and call_id in self._resamplers:
-                resampled_data = self._resamplers[call_id].process_chunk(pcm_data)
-            else:
-                # Fallback to simple resampling
-                from ..audio.resampler import AudioResampler
-                resampled_data = AudioResampler.resample_audio(pcm_data, 8000, 16000)
-            
-            # Send audio immediately for lowest latency
-            await self.connection_manager.send_audio(call_id, resampled_data)
+            # Queued frames are coalesced by the AI sender into one WebSocket message
+            await self.connection_manager.send_audio_batch(call_id, pcm_frames)
                     
             # Update statistics
             stats = self.call_statistics.get(call_id)
             if stats:
-                stats.record_received_packet(type('Packet', (), {'payload': audio_data})())
+                for audio_data in payloads:
+                    stats.record_received_payload(audio_data)
                 
         except Exception as e:
             logger.error(f"Error handling RTP audio for call {call_id}: {e}")
             
+    def _rtp_to_ai_audio(self, call_id: str, call_info: Any, audio_data: bytes) -> bytes:
+        """Convert one RTP payload to 16kHz PCM for the AI platform."""
+        # Decode to PCM and apply AGC for the AI platform
+        pcm_data = self.audio_processor.decode_and_agc(audio_data, call_info.codec)
+        
+        # Resample from 8kHz (telephony) to 16kHz (AI STT requirement)
+        resampler = self._resamplers.get(call_id)
+        if resampler is not None:
+            return resampler.process_chunk(pcm_data)
+        # Fallback to simple resampling
+        return AudioResampler.resample_audio(pcm_data, 8000, 16000)
+            
+    async def _consume_rtp_audio(self, call_id: str, inbox: _RtpInbox):
+        """Process queued RTP payloads for a call in arrival order."""
+        frames = inbox.frames
+        while True:
+            await inbox.wait()
+            # Take everything queued so far and hand it over as one batch
+            payloads = list(frames)
+            frames.clear()
+            await self._handle_rtp_audio_batch(call_id, payloads)
+                
     async def _handle_sip_audio(self, call_id: str, audio_data: bytes):
         """Handle audio received via SIP WebSocket."""
         # This is alternative to RTP - direct WebSocket audio
@@ -225,14 +298,12 @@ class BridgeHandlers:
         
     async def _handle_ai_audio(self, call_id: str, audio_data: bytes):
         """Handle audio received from AI platform."""
-        if call_id not in self.active_calls:
+        call_info = self.active_calls.get(call_id)
+        if call_info is None:
             return
             
         try:
-            call_info = self.active_calls[call_id]
-            
             # AI sends 16kHz PCM, need to downsample to 8kHz for telephony
-            from ..audio.resampler import AudioResampler
             downsampled_data = AudioResampler.resample_audio(audio_data, 16000, 8000)
             
             # Convert PCM to SIP codec format
@@ -246,9 +317,7 @@ class BridgeHandlers:
                 await rtp_session.send_audio(codec_data)
                 
             # Also send via SIP WebSocket if available
-            sip_ws = self.sip_connections.get(call_id)
-            if sip_ws and sip_ws.open:
-                await sip_ws.send(codec_data)
+            await self._send_to_sip(call_id, codec_data)
                 
             # Update statistics
             stats = self.call_statistics.get(call_id)
@@ -258,102 +327,93 @@ class BridgeHandlers:
         except Exception as e:
             logger.error(f"Error handling AI audio for call {call_id}: {e}")
             
+    # Control message type -> handler(self, call_id, data); each returns the coroutine to await
+    _SIP_CONTROL_HANDLERS = {
+        "dtmf": lambda self, call_id, data: self._forward_dtmf_to_ai(call_id, data.get("digit")),
+        "call_hold": lambda self, call_id, data: self._handle_call_hold(call_id),
+        "call_resume": lambda self, call_id, data: self._handle_call_resume(call_id),
+        "call_end": lambda self, call_id, data: self.cleanup_call(call_id, reason="SIP initiated"),
+    }
+    _AI_CONTROL_HANDLERS = {
+        "hangup": lambda self, call_id, data: self._hangup_call(call_id),
+        "transfer": lambda self, call_id, data: self._transfer_call(call_id, data.get("target")),
+        "hold": lambda self, call_id, data: self._handle_call_hold(call_id),
+        "resume": lambda self, call_id, data: self._handle_call_resume(call_id),
+        "dtmf_send": lambda self, call_id, data: self._send_dtmf_to_sip(call_id, data.get("digit")),
+    }
+    
     async def _process_sip_control_message(self, call_id: str, data: Dict):
         """Process control messages from SIP."""
         message_type = data.get("type")
-        
-        if message_type == "dtmf":
-            await self._forward_dtmf_to_ai(call_id, data.get("digit"))
-        elif message_type == "call_hold":
-            await self._handle_call_hold(call_id)
-        elif message_type == "call_resume":
-            await self._handle_call_resume(call_id)
-        elif message_type == "call_end":
-            await self.cleanup_call(call_id, reason="SIP initiated")
-        else:
+        handler = self._SIP_CONTROL_HANDLERS.get(message_type)
+        if handler is None:
             logger.warning(f"Unknown SIP control message: {message_type}")
+            return
+        await handler(self, call_id, data)
             
     async def _process_ai_control_message(self, call_id: str, data: Dict):
         """Process control messages from AI platform."""
         message_type = data.get("type")
-        
-        if message_type == "hangup":
-            await self._hangup_call(call_id)
-        elif message_type == "transfer":
-            await self._transfer_call(call_id, data.get("target"))
-        elif message_type == "hold":
-            await self._handle_call_hold(call_id)
-        elif message_type == "resume":
-            await self._handle_call_resume(call_id)
-        elif message_type == "dtmf_send":
-            await self._send_dtmf_to_sip(call_id, data.get("digit"))
-        else:
+        handler = self._AI_CONTROL_HANDLERS.get(message_type)
+        if handler is None:
             logger.debug(f"Unhandled AI control message: {message_type}")
+            return
+        await handler(self, call_id, data)
             
     async def _forward_dtmf_to_ai(self, call_id: str, digit: str):
         """Forward DTMF digit to AI platform."""
-        connection = self.connection_manager.get_connection(call_id)
-        if connection:
-            message = {
-                "type": "dtmf",
-                "data": {
-                    "call_id": call_id,
-                    "digit": digit,
-                    "timestamp": time.time()
-                }
+        message = {
+            "type": "dtmf",
+            "data": {
+                "call_id": call_id,
+                "digit": digit,
+                "timestamp": time.time()
             }
-            await connection.send(json.dumps(message))
+        }
+        await self.connection_manager.send_control(call_id, message)
             
     async def _send_dtmf_to_sip(self, call_id: str, digit: str):
         """Send DTMF digit to SIP side."""
-        sip_ws = self.sip_connections.get(call_id)
-        if sip_ws and sip_ws.open:
-            message = {
-                "type": "dtmf_send",
-                "digit": digit
-            }
-            await sip_ws.send(json.dumps(message))
+        await self._send_to_sip(call_id, f'{_DTMF_SEND_PREFIX}{json_codec.dumps(digit)}}}')
             
     async def _handle_call_hold(self, call_id: str):
         """Handle call hold request."""
-        if call_id in self.active_calls:
-            from .bridge import CallState
-            self.active_calls[call_id].state = CallState.ON_HOLD
+        call_info = self.active_calls.get(call_id)
+        if call_info is not None:
+            call_info.state = CallState.ON_HOLD
             logger.info(f"Call {call_id} placed on hold")
             
     async def _handle_call_resume(self, call_id: str):
         """Handle call resume request."""
-        if call_id in self.active_calls:
-            from .bridge import CallState
-            self.active_calls[call_id].state = CallState.CONNECTED
+        call_info = self.active_calls.get(call_id)
+        if call_info is not None:
+            call_info.state = CallState.CONNECTED
             logger.info(f"Call {call_id} resumed")
             
     async def _hangup_call(self, call_id: str):
         """Hang up a call."""
-        sip_ws = self.sip_connections.get(call_id)
-        if sip_ws and sip_ws.open:
-            message = {"type": "hangup"}
-            await sip_ws.send(json.dumps(message))
+        await self._send_to_sip(call_id, _HANGUP_MESSAGE)
         await self.cleanup_call(call_id, reason="AI initiated hangup")
         
     async def _transfer_call(self, call_id: str, target: str):
         """Transfer a call to another number."""
-        sip_ws = self.sip_connections.get(call_id)
-        if sip_ws and sip_ws.open:
-            message = {
-                "type": "transfer",
-                "target": target
-            }
-            await sip_ws.send(json.dumps(message))
+        await self._send_to_sip(call_id, f'{_TRANSFER_PREFIX}{json_codec.dumps(target)}}}')
             
+    async def _send_to_sip(self, call_id: str, message) -> bool:
+        """Send a frame to the call's SIP WebSocket while it is known to be open."""
+        if call_id not in self.sip_connection_alive:
+            return False
+        try:
+            await self.sip_connections[call_id].send(message)
+        except (websockets.exceptions.ConnectionClosed, KeyError):
+            self.sip_connection_alive.discard(call_id)
+            return False
+        return True
+        
     async def _send_error(self, websocket, error_message: str):
         """Send error message to WebSocket."""
         try:
-            if websocket.open:
-                await websocket.send(json.dumps({
-                    "type": "error",
-                    "error": error_message
-                }))
+            await websocket.send(f'{_ERROR_PREFIX}{json_codec.dumps(error_message)}}}')
         except Exception:
             pass  # Connection might be closed
             
@@ -363,36 +423,42 @@ class BridgeHandlers:
         
         try:
             # Update call state
-            if call_id in self.active_calls:
-                from .bridge import CallState
-                call_info = self.active_calls[call_id]
+            call_info = self.active_calls.get(call_id)
+            if call_info is not None:
                 call_info.state = CallState.DISCONNECTED
                 call_info.end_time = time.time()
                 
             # Close AI connection
             await self.connection_manager.disconnect_call(call_id)
             
+            # Stop tracking expiry; the heap entry is skipped when popped
+            self._expiry_deadlines.pop(call_id, None)
+            
             # Close SIP connection
+            self.sip_connection_alive.discard(call_id)
             sip_ws = self.sip_connections.get(call_id)
-            if sip_ws and sip_ws.open:
+            if sip_ws:
                 try:
                     await sip_ws.close()
                 except Exception:
                     pass
                     
-            # Cleanup RTP session
+            # Cleanup RTP session and its consumer
             await self.rtp_manager.destroy_session(call_id)
+            rtp_consumer = self._rtp_consumers.pop(call_id, None)
+            if rtp_consumer:
+                rtp_consumer.cancel()
+            self._rtp_inboxes.pop(call_id, None)
             
             # Clear buffers and statistics
             self.audio_buffers.pop(call_id, None)
             self.call_statistics.pop(call_id, None)
             
             # Cleanup resampler
-            if hasattr(self, '_resamplers'):
-                resampler = self._resamplers.pop(call_id, None)
-                if resampler:
-                    # Flush any remaining buffered audio
-                    resampler.flush()
+            resampler = self._resamplers.pop(call_id, None)
+            if resampler:
+                # Flush any remaining buffered audio
+                resampler.flush()
             
             # Remove from tracking
             self.active_calls.pop(call_id, None)
@@ -408,18 +474,11 @@ class BridgeHandlers:
         """Periodic cleanup of stale calls."""
         while self.running:
             try:
-                current_time = time.time()
-                stale_calls = []
-                
-                for call_id, call_info in self.active_calls.items():
-                    # Mark calls as stale if they're older than 4 hours
-                    if call_info.start_time and (current_time - call_info.start_time) > 14400:
-                        stale_calls.append(call_id)
-                        
-                for call_id in stale_calls:
+                for call_id in self._pop_expired_calls(time.monotonic()):
                     await self.cleanup_call(call_id, reason="Stale call cleanup")
                     
-                await asyncio.sleep(300)  # Check every 5 minutes
+                # Sleep until the earliest deadline; calls added later always expire after it
+                await asyncio.sleep(self._next_cleanup_delay(time.monotonic()))
                 
             except asyncio.CancelledError:
                 break
@@ -427,19 +486,44 @@ class BridgeHandlers:
                 logger.error(f"Error in cleanup loop: {e}")
                 await asyncio.sleep(60)
                 
+    def _track_call_expiry(self, call_id: str, call_info: Any):
+        """Schedule a call for stale cleanup once it exceeds the maximum duration."""
+        # Deadlines use the monotonic clock so NTP steps cannot expire calls early or late
+        age = max(time.time() - call_info.start_time, 0.0) if call_info.start_time else 0.0
+        deadline = time.monotonic() - age + STALE_CALL_TIMEOUT
+        self._expiry_deadlines[call_id] = deadline
+        heapq.heappush(self._expiry_heap, (deadline, call_id))
+        
+    def _next_cleanup_delay(self, now: float) -> float:
+        """Seconds until the earliest tracked call becomes stale."""
+        if not self._expiry_heap:
+            return STALE_CALL_TIMEOUT
+        return max(self._expiry_heap[0][0] - now, 0.0)
+        
+    def _pop_expired_calls(self, now: float) -> List[str]:
+        """Pop calls whose monotonic deadline has passed, skipping entries for calls already cleaned up."""
+        heap = self._expiry_heap
+        deadlines = self._expiry_deadlines
+        expired = []
+        while heap and heap[0][0] <= now:
+            deadline, call_id = heapq.heappop(heap)
+            # cleanup_call drops the deadline; a reused call_id gets a new one
+            if deadlines.get(call_id) == deadline and call_id in self.active_calls:
+                del deadlines[call_id]
+                expired.append(call_id)
+                
+        # Drop leftover entries of calls that ended early so the heap tracks live calls
+        if len(heap) > 2 * len(deadlines) + 64:
+            self._expiry_heap = [entry for entry in heap if deadlines.get(entry[1]) == entry[0]]
+            heapq.heapify(self._expiry_heap)
+            
+        return expired
+        
     async def _heartbeat_loop(self):
         """Send periodic heartbeats to AI platform."""
         while self.running:
             try:
-                for call_id in list(self.active_calls.keys()):
-                    connection = self.connection_manager.get_connection(call_id)
-                    if connection:
-                        try:
-                            await connection.ping()
-                        except Exception:
-                            # Connection is dead, cleanup
-                            await self.cleanup_call(call_id, reason="Heartbeat failed")
-                            
+                await self._send_heartbeats()
                 await asyncio.sleep(30)  # Heartbeat every 30 seconds
                 
             except asyncio.CancelledError:
@@ -448,9 +532,36 @@ class BridgeHandlers:
                 logger.error(f"Error in heartbeat loop: {e}")
                 await asyncio.sleep(30)
                 
+    async def _send_heartbeats(self):
+        """Ping every AI connection concurrently; a pooled connection is pinged once."""
+        calls_by_connection: Dict[int, tuple] = {}
+        # Nothing awaits while grouping, so the live dict can be iterated without a snapshot
+        for call_id in self.active_calls:
+            connection = self.connection_manager.get_connection(call_id)
+            if connection:
+                calls_by_connection.setdefault(id(connection), (connection, []))[1].append(call_id)
+                
+        await asyncio.gather(
+            *(self._ping_ai_connection(connection, call_ids)
+              for connection, call_ids in calls_by_connection.values()),
+            return_exceptions=True
+        )
+        
+    async def _ping_ai_connection(self, connection, call_ids: List[str]):
+        """Ping one AI connection and clean up its calls if no pong arrives in time."""
+        try:
+            pong_waiter = await connection.ping()
+            await asyncio.wait_for(pong_waiter, timeout=HEARTBEAT_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Connection is dead or wedged, cleanup
+            for call_id in call_ids:
+                await self.cleanup_call(call_id, reason="Heartbeat failed")
+                
     def get_statistics(self) -> Dict:
         """Get bridge statistics."""
-        uptime = time.time() - self.bridge_start_time
+        uptime = time.monotonic() - self._started_monotonic
         
         return {
             "uptime_seconds": int(uptime),
@@ -458,6 +569,8 @@ class BridgeHandlers:
             "concurrent_calls": self.concurrent_calls,
             "active_calls": len(self.active_calls),
             "ai_connections": len(self.connection_manager.connections),
+            "ai_send_dropped_frames": self.connection_manager.dropped_oldest,
+            "ai_send_rejected_frames": self.connection_manager.dropped_incoming,
             "rtp_sessions": len(self.rtp_manager.sessions),
             "audio_buffers": len(self.audio_buffers),
             "call_stats": {
@@ -0,0 +1,7 @@
+"""Binary audio frame format used on AI platform WebSocket connections."""
+import struct
+
+# Binary audio frame header: version, frame type, sequence, crc32(call_id), timestamp_ns
+AUDIO_FRAME_HEADER = struct.Struct("!BBHIQ")
+AUDIO_FRAME_VERSION = 1
+AUDIO_FRAME_TYPE_AUDIO = 1
@@ -0,0 +1,272 @@
+"""Per-call data types shared by the WebSocket bridge and its handlers."""
+import heapq
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional, Set, Any
+
+
+class CallState(Enum):
+    """Call states."""
+    INITIALIZING = "initializing"
+    CONNECTING = "connecting"
+    RINGING = "ringing"
+    CONNECTED = "connected"
+    ON_HOLD = "on_hold"
+    TRANSFERRING = "transferring"
+    ENDING = "ending"
+    DISCONNECTED = "disconnected"
+    ERROR = "error"
+
+
+@dataclass(slots=True, kw_only=True)
+class CallInfo:
+    """Enhanced call information."""
+    call_id: str
+    from_number: str
+    to_number: str
+    sip_headers: Dict[str, str]
+    state: CallState = CallState.INITIALIZING
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    rtp_local_port: Optional[int] = None
+    rtp_remote_host: Optional[str] = None
+    rtp_remote_port: Optional[int] = None
+    codec: str = "PCMU"
+    ai_session_id: Optional[str] = None
+
+
+class _P2Quantile:
+    """Streaming quantile estimate using the P-square algorithm (Jain & Chlamtac).
+    
+    Tracks five markers instead of storing samples, so memory and per-sample
+    cost are constant.
+    """
+    __slots__ = ("quantile", "_samples", "_heights", "_positions", "_desired", "_increments")
+    
+    def __init__(self, quantile: float):
+        self.quantile = quantile
+        self._samples = []
+        self._heights: Optional[list] = None
+        self._positions: Optional[list] = None
+        self._desired: Optional[list] = None
+        self._increments = (0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0)
+        
+    def add(self, value: float) -> None:
+        """Add an observation."""
+        if self._heights is None:
+            self._samples.append(value)
+            if len(self._samples) == 5:
+                self._samples.sort()
+                q = self.quantile
+                self._heights = self._samples
+                self._positions = [0, 1, 2, 3, 4]
+                self._desired = [0.0, 2 * q, 4 * q, 2 + 2 * q, 4.0]
+            return
+            
+        heights, positions = self._heights, self._positions
+        
+        # Find the cell the value falls into, extending the extremes if needed
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+                
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+            
+        # Adjust the three middle markers towards their desired positions
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if ((offset >= 1 and positions[i + 1] - positions[i] > 1) or
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1)):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+                
+    def _parabolic(self, i: int, step: int) -> float:
+        """Piecewise-parabolic prediction for marker i moved by step."""
+        heights, positions = self._heights, self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i]) +
+            (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1])
+        )
+        
+    @property
+    def value(self) -> float:
+        """Current quantile estimate."""
+        if self._heights is not None:
+            return self._heights[2]
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+
+
+class AudioBuffer:
+    """Advanced audio buffering with adaptive jitter control.
+    
+    Frames are played out in sequence-number order (16-bit, wrap-aware);
+    duplicates and frames older than the last one played are dropped.
+    The playout delay starts at target_delay_ms. When adaptive, it is
+    recomputed every adapt_interval frames from the 95th percentile of the
+    inter-arrival deviation and clamped to [min_delay_ms, max_delay_ms].
+    
+    The bridge creates one per call, but the RTP path currently plays out
+    through RTPSession and does not feed frames into it yet.
+    """
+    __slots__ = (
+        "max_frames", "target_delay_ms", "target_delay_ns", "adaptive", "frame_interval_ns",
+        "min_delay_ns", "max_delay_ns", "delay_factor", "adapt_interval", "frames",
+        "total_bytes", "_queued_sequences", "_highest_sequence", "_last_played_sequence",
+        "dropped_frames", "jitter_ns", "_jitter_p95", "_last_arrival_ns", "_frames_since_adapt"
+    )
+    
+    def __init__(self, max_frames: int = 3, target_delay_ms: int = 5, adaptive: bool = True,
+                 frame_interval_ms: int = 20, min_delay_ms: int = 20, max_delay_ms: int = 200,
+                 delay_factor: float = 1.5, adapt_interval: int = 50):
+        self.max_frames = max_frames
+        self.target_delay_ms = target_delay_ms
+        self.target_delay_ns = target_delay_ms * 1_000_000
+        self.adaptive = adaptive
+        self.frame_interval_ns = frame_interval_ms * 1_000_000
+        self.min_delay_ns = min_delay_ms * 1_000_000
+        self.max_delay_ns = max_delay_ms * 1_000_000
+        self.delay_factor = delay_factor
+        self.adapt_interval = adapt_interval
+        # Min-heap of (extended_sequence, arrival_ns, audio_data)
+        self.frames: list = []
+        self.total_bytes = 0
+        self._queued_sequences: Set[int] = set()
+        self._highest_sequence: Optional[int] = None
+        self._last_played_sequence: Optional[int] = None
+        self.dropped_frames = 0
+        
+        # Jitter tracking
+        self.jitter_ns = 0.0
+        self._jitter_p95 = _P2Quantile(0.95)
+        self._last_arrival_ns: Optional[int] = None
+        self._frames_since_adapt = 0
+        
+    def add_frame(self, audio_data: bytes, sequence: Optional[int] = None) -> None:
+        """Add audio frame to buffer.
+        
+        Args:
+            audio_data: Frame payload
+            sequence: 16-bit sequence number; arrival order is assumed when omitted
+        """
+        arrival_ns = time.monotonic_ns()
+        self._update_jitter(arrival_ns)
+        
+        sequence = self._extend_sequence(sequence)
+        if sequence in self._queued_sequences or (
+                self._last_played_sequence is not None and sequence <= self._last_played_sequence):
+            # Duplicate or arrived after its playout slot
+            self.dropped_frames += 1
+            return
+            
+        if len(self.frames) >= self.max_frames:
+            # Remove oldest frame; its playout slot is skipped
+            old_sequence, _, old_frame = heapq.heappop(self.frames)
+            self._queued_sequences.discard(old_sequence)
+            self._last_played_sequence = old_sequence
+            self.total_bytes -= len(old_frame)
+            if sequence <= self._last_played_sequence:
+                # The eviction moved the playout point past this late frame
+                self.dropped_frames += 1
+                return
+                
+        heapq.heappush(self.frames, (sequence, arrival_ns, audio_data))
+        self._queued_sequences.add(sequence)
+        self.total_bytes += len(audio_data)
+        
+    def _extend_sequence(self, sequence: Optional[int]) -> int:
+        """Map a 16-bit sequence number onto a monotonically extended one."""
+        highest = self._highest_sequence
+        if highest is None:
+            extended = 0 if sequence is None else sequence
+        elif sequence is None:
+            extended = highest + 1
+        else:
+            delta = (sequence - highest) & 0xFFFF
+            if delta >= 0x8000:
+                delta -= 0x10000
+            extended = highest + delta
+            
+        if highest is None or extended > highest:
+            self._highest_sequence = extended
+        return extended
+        
+    def _update_jitter(self, arrival_ns: int) -> None:
+        """Update the jitter estimate and, periodically, the target delay."""
+        last_arrival_ns = self._last_arrival_ns
+        self._last_arrival_ns = arrival_ns
+        if last_arrival_ns is None:
+            return
+            
+        # RFC 3550 interarrival jitter against the nominal frame spacing
+        deviation = abs(arrival_ns - last_arrival_ns - self.frame_interval_ns)
+        self.jitter_ns += (deviation - self.jitter_ns) / 16
+        
+        if not self.adaptive:
+            return
+            
+        self._jitter_p95.add(deviation)
+        self._frames_since_adapt += 1
+        if self._frames_since_adapt >= self.adapt_interval:
+            self._frames_since_adapt = 0
+            target_ns = int(self.delay_factor * self._jitter_p95.value)
+            self.target_delay_ns = min(max(target_ns, self.min_delay_ns), self.max_delay_ns)
+            self.target_delay_ms = self.target_delay_ns // 1_000_000
+            
+    def get_frame(self) -> Optional[bytes]:
+        """Get next audio frame if ready."""
+        if not self.frames:
+            return None
+            
+        # Check if we should delay playback for jitter control
+        _, arrival_ns, _ = self.frames[0]
+        
+        if time.monotonic_ns() - arrival_ns >= self.target_delay_ns or len(self.frames) >= self.max_frames:
+            sequence, _, frame = heapq.heappop(self.frames)
+            self._queued_sequences.discard(sequence)
+            self._last_played_sequence = sequence
+            self.total_bytes -= len(frame)
+            return frame
+            
+        return None
+        
+    def clear(self) -> None:
+        """Clear all buffered frames."""
+        self.frames.clear()
+        self._queued_sequences.clear()
+        self._highest_sequence = None
+        self._last_played_sequence = None
+        self.total_bytes = 0
+        
+    def get_buffer_level(self) -> float:
+        """Get buffer level (0.0 to 1.0)."""
+        return len(self.frames) / self.max_frames if self.max_frames > 0 else 0.0
+        
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get jitter buffer statistics."""
+        return {
+            "jitter_ms": self.jitter_ns / 1_000_000,
+            "jitter_p95_ms": self._jitter_p95.value / 1_000_000,
+            "target_delay_ms": self.target_delay_ns / 1_000_000,
+            "buffer_level": self.get_buffer_level(),
+            "buffered_frames": len(self.frames),
+            "buffered_bytes": self.total_bytes,
+            "dropped_frames": self.dropped_frames
+        }